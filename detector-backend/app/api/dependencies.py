@@ -1,4 +1,9 @@
+from typing import Optional
+
 from fastapi import HTTPException, Request
+from app.core.batching import PredictionBatcher
+from app.core.inference_executor import InferenceExecutor
+from app.core.timing import timed
 from app.services.article_extractor import ArticleExtractor
 
 
@@ -13,6 +18,25 @@ def get_detector(req: Request):
     return detector
 
 
+def get_prediction_batcher(req: Request) -> Optional[PredictionBatcher]:
+    # Batching is optional, callers fall back to the detector if it is disabled.
+    return getattr(req.state, "prediction_batcher", None) or getattr(
+        req.app.state, "prediction_batcher", None
+    )
+
+
+def get_inference_executor(req: Request, name: str) -> InferenceExecutor:
+    executors = getattr(req.state, "inference_executors", None) or getattr(
+        req.app.state, "inference_executors", None
+    )
+    executor = (executors or {}).get(name)
+    if executor is None:
+        raise HTTPException(
+            status_code=503, detail="Inference service is not available right now."
+        )
+    return executor
+
+
 def get_fact_checker(req: Request):
     fact_checker = getattr(req.state, "fact_checker", None) or getattr(
         req.app.state, "fact_checker", None
@@ -35,14 +59,16 @@ def get_article_extractor(req: Request) -> ArticleExtractor:
     return extractor
 
 
-def extract_article_text_or_raise(
+async def extract_article_text_or_raise(
     extractor: ArticleExtractor, raw_input: str
 ) -> str:
     """
     Resolves raw input (text or URL) into article text using the extractor.
+    Article downloads are awaited, so slow publishers do not block the event loop.
     """
     try:
-        extraction = extractor.process(raw_input)
+        with timed("extraction"):
+            extraction = await extractor.process_async(raw_input)
     except Exception as exc:
         raise HTTPException(
             status_code=500, detail=f"Article extraction failed: {exc}"
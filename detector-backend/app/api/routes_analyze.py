@@ -0,0 +1,143 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.schemas import FactCheckResponse, HighlightResponse, PredictionResponse, TextRequest
+from app.api.dependencies import (
+    extract_article_text_or_raise,
+    get_article_extractor,
+    get_detector,
+    get_fact_checker,
+    get_inference_executor,
+    get_prediction_batcher,
+)
+from app.core.config import Settings
+from app.core.logging_config import get_logger
+from app.core.timing import current_timings
+from app.domain import HighlightMode
+
+router = APIRouter()
+logger = get_logger(__name__)
+settings = Settings()
+
+
+async def _run_stage(
+    stage: str, timeout: float, run: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Runs a single analysis stage and turns its outcome into a stream event.
+    Failures and timeouts are reported per stage and never abort the others.
+    """
+    try:
+        result = await asyncio.wait_for(run(), timeout)
+        return {"stage": stage, "status": "ok", "result": result}
+    except asyncio.TimeoutError:
+        return {
+            "stage": stage,
+            "status": "timeout",
+            "error": f"Stage did not finish within {timeout:g} seconds.",
+        }
+    except HTTPException as exc:
+        return {
+            "stage": stage,
+            "status": "error",
+            "status_code": exc.status_code,
+            "error": exc.detail,
+        }
+    except Exception as exc:
+        logger.exception("Analyze stage %s failed", stage)
+        return {"stage": stage, "status": "error", "status_code": 500, "error": str(exc)}
+
+
+def _format_event(event: Dict[str, Any], sse: bool) -> str:
+    payload = json.dumps(event, default=str)
+    if sse:
+        return f"event: {event['stage']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+@router.post("/analyze")
+async def analyze(
+    request: TextRequest,
+    req: Request,
+    highlight: bool = Query(True, description="Run the token highlighting stage."),
+    fact_check: bool = Query(True, description="Run the LLM fact-check stage."),
+    mode: HighlightMode = Query(
+        HighlightMode.EXACT,
+        description="'exact' uses SHAP, 'fast' approximates it with gradient x input.",
+    ),
+) -> StreamingResponse:
+    """
+    Resolves the input once and runs prediction, highlighting and fact-checking
+    concurrently. Each stage is streamed as soon as it finishes, as NDJSON or,
+    if requested via the Accept header, as server-sent events.
+    A final 'done' event carries the timing breakdown of the request.
+    """
+    detector = get_detector(req)
+    batcher = get_prediction_batcher(req)
+    predict_executor = get_inference_executor(req, "predict")
+    highlight_executor = get_inference_executor(req, "highlight")
+    fact_checker = get_fact_checker(req) if fact_check else None
+    article_extractor = get_article_extractor(req)
+
+    # Extraction errors are returned as a regular HTTP error before streaming starts.
+    article_text = await extract_article_text_or_raise(article_extractor, request.text)
+    language = await predict_executor.run(detector.detect_language, article_text)
+
+    async def run_prediction() -> Dict[str, Any]:
+        if batcher is not None:
+            result = await batcher.predict(article_text, language=language)
+        else:
+            result = await predict_executor.run(
+                detector.predict, article_text, language=language
+            )
+        return PredictionResponse.from_prediction(result).model_dump(mode="json")
+
+    async def run_highlight() -> Dict[str, Any]:
+        result = await highlight_executor.run(
+            detector.explain, article_text, language=language, mode=mode
+        )
+        return HighlightResponse.from_prediction(
+            result.prediction, highlights=result.highlights
+        ).model_dump(mode="json")
+
+    async def run_fact_check() -> Dict[str, Any]:
+        result: FactCheckResponse = await fact_checker.run_fact_check(article_text)
+        return result.model_dump(mode="json")
+
+    stages = [("prediction", settings.ANALYZE_PREDICT_TIMEOUT_SECONDS, run_prediction)]
+    if highlight:
+        stages.append(
+            ("highlight", settings.ANALYZE_HIGHLIGHT_TIMEOUT_SECONDS, run_highlight)
+        )
+    if fact_checker is not None:
+        stages.append(
+            ("fact_check", settings.ANALYZE_FACT_CHECK_TIMEOUT_SECONDS, run_fact_check)
+        )
+
+    sse = "text/event-stream" in req.headers.get("accept", "")
+    timings = current_timings()
+
+    async def stream() -> AsyncIterator[str]:
+        tasks = [
+            asyncio.ensure_future(_run_stage(stage, timeout, run))
+            for stage, timeout, run in stages
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield _format_event(await finished, sse)
+        finally:
+            # Stop remaining stages if the client disconnects.
+            for task in tasks:
+                task.cancel()
+
+        done = {"stage": "done", "timings": timings.as_dict() if timings else {}}
+        yield _format_event(done, sse)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+    )
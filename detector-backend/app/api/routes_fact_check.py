@@ -22,7 +22,7 @@ async def fact_check(request: TextRequest, req: Request) -> FactCheckResponse:
     fact_checker = get_fact_checker(req)
     article_extractor = get_article_extractor(req)
 
-    article_text = extract_article_text_or_raise(article_extractor, request.text)
+    article_text = await extract_article_text_or_raise(article_extractor, request.text)
 
     try:
         result = await fact_checker.run_fact_check(article_text)
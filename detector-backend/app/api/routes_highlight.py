@@ -1,34 +1,49 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from app.schemas import TextRequest, HighlightResponse
 from app.api.dependencies import (
     extract_article_text_or_raise,
     get_article_extractor,
     get_detector,
+    get_inference_executor,
 )
 from app.core.logging_config import get_logger
+from app.domain import HighlightMode
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 
 @router.post("/highlight", response_model=HighlightResponse)
-async def highlight(request: TextRequest, req: Request) -> HighlightResponse:
+async def highlight(
+    request: TextRequest,
+    req: Request,
+    mode: HighlightMode = Query(
+        HighlightMode.EXACT,
+        description="'exact' uses SHAP, 'fast' approximates it with gradient x input.",
+    ),
+) -> HighlightResponse:
     """
     Uses the local BERT model to perform token-level classification.
     Returning the weight of the contribution for each token.
     Positive values represent tokens, which contribute to a Fake News classification.
+    The response also contains the prediction of the same run, so no separate
+    /predict call is needed.
     """
     # Access the detector initialized in the app's lifespan
     detector = get_detector(req)
+    executor = get_inference_executor(req, "highlight")
     article_extractor = get_article_extractor(req)
 
-    article_text = extract_article_text_or_raise(article_extractor, request.text)
+    article_text = await extract_article_text_or_raise(article_extractor, request.text)
 
     try:
-        result = detector.highlight(article_text)
+        # Runs in its own pool, so slow SHAP jobs cannot block /predict or /health.
+        result = await executor.run(detector.explain, article_text, mode=mode)
 
-        return HighlightResponse(highlights=result)
+        return HighlightResponse.from_prediction(
+            result.prediction, highlights=result.highlights
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,27 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
+
+from app.api.dependencies import get_prediction_batcher
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+def metrics(req: Request) -> Dict[str, Any]:
+    """
+    Exposes runtime counters of the inference path for tuning purposes.
+    """
+    batcher = get_prediction_batcher(req)
+    executors = getattr(req.app.state, "inference_executors", None) or {}
+    result_cache = getattr(req.app.state, "result_cache", None)
+    extraction_cache = getattr(req.app.state, "extraction_cache", None)
+
+    return {
+        "batching": batcher.metrics() if batcher is not None else None,
+        "executors": {name: executor.stats() for name, executor in executors.items()},
+        "result_cache": result_cache.stats() if result_cache is not None else None,
+        "extraction_cache": (
+            extraction_cache.stats() if extraction_cache is not None else None
+        ),
+    }
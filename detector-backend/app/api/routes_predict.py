@@ -1,45 +1,233 @@
-from fastapi import APIRouter, HTTPException, Request
+import asyncio
+import json
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Tuple
 
-from app.domain import Label
-from app.schemas import PredictionResponse, TextRequest
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.schemas import (
+    BatchPredictionItem,
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    PredictionResponse,
+    TextRequest,
+)
 from app.api.dependencies import (
     extract_article_text_or_raise,
     get_article_extractor,
     get_detector,
+    get_inference_executor,
+    get_prediction_batcher,
 )
+from app.core.config import Settings
 from app.core.logging_config import get_logger
+from app.core.inference_executor import InferenceExecutor
+from app.core.timing import current_timings
+from app.domain import AggregationStrategy, Language
+from app.services.article_extractor import ArticleExtractor
 
 router = APIRouter()
 logger = get_logger(__name__)
+settings = Settings()
 
 
 @router.post("/predict", response_model=PredictionResponse)
-async def predict(request: TextRequest, req: Request) -> PredictionResponse:
+async def predict(
+    request: TextRequest,
+    req: Request,
+    chunked: bool = Query(
+        False, description="Classify the whole article in overlapping chunks."
+    ),
+    aggregation: AggregationStrategy = Query(
+        AggregationStrategy.MEAN, description="How chunk scores are combined."
+    ),
+) -> PredictionResponse:
     """
     Main entry point for BERT-based text classification.
     Analyzes the input text and returns a probability score for both 'REAL' and 'FAKE' labels.
+    By default only the first 512 tokens are classified. In chunked mode the
+    whole article is classified and the per-chunk scores are returned as well.
     """
     # Access the detector initialized in the app's lifespan
     detector = get_detector(req)
+    batcher = get_prediction_batcher(req)
+    executor = get_inference_executor(req, "predict")
     article_extractor = get_article_extractor(req)
 
-    article_text = extract_article_text_or_raise(article_extractor, request.text)
+    article_text = await extract_article_text_or_raise(article_extractor, request.text)
 
     try:
-        result = detector.predict(article_text)
+        if chunked:
+            chunked_result = await executor.run(
+                detector.predict_chunked,
+                article_text,
+                strategy=aggregation,
+                overlap=settings.CHUNK_OVERLAP_TOKENS,
+                max_chunks=settings.CHUNK_MAX_CHUNKS,
+            )
+            return PredictionResponse.from_prediction(
+                chunked_result.prediction, chunks=chunked_result.chunks
+            )
 
-        fake_score = (
-            result.score if result.label == Label.FAKE else round(1 - result.score, 4)
-        )
-        real_score = result.score if result.label == Label.REAL else 1 - result.score
+        if batcher is not None:
+            result = await batcher.predict(article_text)
+        else:
+            result = await executor.run(detector.predict, article_text)
 
-        return PredictionResponse(
-            prediction_result=result,
-            confidence_fake=fake_score,
-            confidence_real=real_score,
-        )
+        return PredictionResponse.from_prediction(result)
     except HTTPException:
         raise
     except Exception as e:
         logger.exception("Prediction failed")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _failed_item(index: int, status_code: int, error: str) -> BatchPredictionItem:
+    return BatchPredictionItem(
+        index=index, status="error", status_code=status_code, error=error
+    )
+
+
+def _detect_language_or_error(detector, text: str) -> Language | HTTPException:
+    # An unsupported language only fails its own item.
+    try:
+        return detector.detect_language(text)
+    except HTTPException as exc:
+        return exc
+
+
+async def _predict_items(
+    texts: List[str],
+    detector,
+    executor: InferenceExecutor,
+    article_extractor: ArticleExtractor,
+) -> AsyncIterator[BatchPredictionItem]:
+    """
+    Yields the result of every item as soon as it is known.
+
+    All items are extracted concurrently, then grouped by detected language and
+    classified in chunks of BATCH_PREDICT_CHUNK_SIZE through `predict_batch`.
+    A failing item or chunk only marks its own items as failed.
+    """
+    extraction_slots = asyncio.Semaphore(settings.BATCH_PREDICT_EXTRACTION_CONCURRENCY)
+
+    async def extract(index: int, raw_input: str) -> Tuple[int, str | HTTPException]:
+        async with extraction_slots:
+            try:
+                return index, await extract_article_text_or_raise(article_extractor, raw_input)
+            except HTTPException as exc:
+                return index, exc
+
+    article_texts: Dict[int, str] = {}
+    for finished in asyncio.as_completed(
+        [extract(index, raw_input) for index, raw_input in enumerate(texts)]
+    ):
+        index, outcome = await finished
+        if isinstance(outcome, HTTPException):
+            yield _failed_item(index, outcome.status_code, outcome.detail)
+        else:
+            article_texts[index] = outcome
+
+    if not article_texts:
+        return
+
+    indices = sorted(article_texts)
+    try:
+        languages = await executor.run(
+            lambda: [_detect_language_or_error(detector, article_texts[i]) for i in indices]
+        )
+    except HTTPException as exc:
+        for index in indices:
+            yield _failed_item(index, exc.status_code, exc.detail)
+        return
+    except Exception as exc:
+        logger.exception("Batch language detection failed")
+        for index in indices:
+            yield _failed_item(index, 500, str(exc))
+        return
+
+    groups: Dict[Language, List[int]] = defaultdict(list)
+    for index, language in zip(indices, languages):
+        if isinstance(language, HTTPException):
+            yield _failed_item(index, language.status_code, language.detail)
+        else:
+            groups[language].append(index)
+
+    chunk_size = max(1, settings.BATCH_PREDICT_CHUNK_SIZE)
+    chunks = [
+        (language, members[start : start + chunk_size])
+        for language, members in groups.items()
+        for start in range(0, len(members), chunk_size)
+    ]
+    # One batch takes at most all predict workers, but never floods their queue.
+    inference_slots = asyncio.Semaphore(executor.max_workers)
+
+    async def classify(language: Language, members: List[int]) -> List[BatchPredictionItem]:
+        async with inference_slots:
+            try:
+                results = await executor.run(
+                    detector.predict_batch, [article_texts[i] for i in members], language
+                )
+            except HTTPException as exc:
+                return [_failed_item(i, exc.status_code, exc.detail) for i in members]
+            except Exception as exc:
+                logger.exception("Batch prediction failed")
+                return [_failed_item(i, 500, str(exc)) for i in members]
+        return [
+            BatchPredictionItem(
+                index=index,
+                status="ok",
+                language=language,
+                result=PredictionResponse.from_prediction(result),
+            )
+            for index, result in zip(members, results)
+        ]
+
+    for finished in asyncio.as_completed([classify(*chunk) for chunk in chunks]):
+        for item in await finished:
+            yield item
+
+
+@router.post("/predict/batch", response_model=BatchPredictionResponse)
+async def predict_batch(request: BatchPredictionRequest, req: Request):
+    """
+    Classifies many articles in one call, each item being a text or an article URL.
+    Every item gets its own result; failed items carry an error instead of
+    failing the whole call. With 'Accept: application/x-ndjson' the items are
+    streamed in completion order, followed by a final 'done' line.
+    """
+    if len(request.texts) > settings.BATCH_PREDICT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.BATCH_PREDICT_MAX_ITEMS} items per batch are allowed.",
+        )
+
+    detector = get_detector(req)
+    executor = get_inference_executor(req, "predict")
+    article_extractor = get_article_extractor(req)
+    items = _predict_items(request.texts, detector, executor, article_extractor)
+
+    if "application/x-ndjson" in req.headers.get("accept", ""):
+        timings = current_timings()
+
+        async def stream() -> AsyncIterator[str]:
+            counts = {"ok": 0, "error": 0}
+            async for item in items:
+                counts[item.status] += 1
+                yield item.model_dump_json(exclude_none=True) + "\n"
+            done = {
+                "done": True,
+                "succeeded": counts["ok"],
+                "failed": counts["error"],
+                "timings": timings.as_dict() if timings else {},
+            }
+            yield json.dumps(done) + "\n"
+
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    results = sorted([item async for item in items], key=lambda item: item.index)
+    succeeded = sum(item.status == "ok" for item in results)
+    return BatchPredictionResponse(
+        results=results, succeeded=succeeded, failed=len(results) - succeeded
+    )
@@ -0,0 +1,218 @@
+import asyncio
+import contextvars
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+from app.core.logging_config import get_logger
+from app.core.timing import timed
+from app.domain import Language, PredictionResult
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Runs a blocking callable off the event loop, e.g. asyncio.to_thread or InferenceExecutor.run.
+BlockingRunner = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class BatchingMetrics:
+    """
+    Counters describing how well incoming requests are grouped into batches.
+    """
+
+    requests: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    total_batch_size: int = 0
+    max_batch_size: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record_enqueue(self, queue_depth: int) -> None:
+        self.requests += 1
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def record_batch(self, batch_size: int, waits: List[float], queue_depth: int) -> None:
+        self.batches += 1
+        self.queue_depth = queue_depth
+        self.total_batch_size += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.total_wait_seconds += sum(waits)
+        self.max_wait_seconds = max([self.max_wait_seconds, *waits])
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_batch_size": (
+                self.total_batch_size / self.batches if self.batches else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "avg_wait_ms": (
+                self.total_wait_seconds / self.requests * 1000 if self.requests else 0.0
+            ),
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+
+@dataclass
+class _PendingItem(Generic[T]):
+    text: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher(Generic[T]):
+    """
+    Collects single-text requests for one model and runs them as a batch.
+
+    A batch is flushed as soon as `max_batch_size` requests are waiting or the
+    oldest request has waited `max_wait_ms`. The blocking batch function runs
+    through `run_blocking` (a worker thread by default), so the event loop keeps
+    accepting requests meanwhile.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[str]], List[T]],
+        max_batch_size: int,
+        max_wait_ms: float,
+        name: str = "batcher",
+        run_blocking: BlockingRunner = asyncio.to_thread,
+    ) -> None:
+        self.run_batch = run_batch
+        self.run_blocking = run_blocking
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+        self.metrics = BatchingMetrics()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        # The queue and worker are bound to the loop of the first request. The worker
+        # gets an empty context, as a batch must not be attributed to that request.
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(
+                self._run(), name=self.name, context=contextvars.Context()
+            )
+
+        return self._queue
+
+    async def submit(self, text: str) -> T:
+        queue = self._ensure_worker()
+        item = _PendingItem(text=text, future=asyncio.get_running_loop().create_future())
+        queue.put_nowait(item)
+        self.metrics.record_enqueue(queue.qsize())
+
+        with timed("batch"):
+            return await item.future
+
+    async def _collect(self) -> List[_PendingItem]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        # Requests that arrived meanwhile are taken along without waiting any longer.
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            started = time.perf_counter()
+            waits = [started - item.enqueued_at for item in batch]
+            self.metrics.record_batch(len(batch), waits, self._queue.qsize())
+
+            try:
+                results = await self.run_blocking(
+                    self.run_batch, [item.text for item in batch]
+                )
+            except Exception as exc:
+                self.metrics.failed_batches += 1
+                logger.exception("Batch of %d failed in %s", len(batch), self.name)
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(exc)
+                continue
+
+            for item, result in zip(batch, results):
+                if not item.future.done():
+                    item.future.set_result(result)
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._worker = None
+
+
+class PredictionBatcher:
+    """
+    Per-language micro-batching in front of FakeNewsDetector.predict.
+    The language is detected per request, then the text waits in the queue of
+    the matching pipeline until a batch is formed.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        max_batch_size: int,
+        max_wait_ms: float,
+        run_blocking: BlockingRunner = asyncio.to_thread,
+    ) -> None:
+        self.detector = detector
+        self.run_blocking = run_blocking
+        self._batchers: Dict[Language, MicroBatcher[PredictionResult]] = {
+            language: MicroBatcher(
+                run_batch=lambda texts, language=language: detector.predict_batch(
+                    texts, language
+                ),
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+                name=f"predict-batcher-{language.value}",
+                run_blocking=run_blocking,
+            )
+            for language in Language
+        }
+
+    async def predict(
+        self, text: str, language: Optional[Language] = None
+    ) -> PredictionResult:
+        if language is None:
+            language = await self.run_blocking(self.detector.detect_language, text)
+
+        return await self._batchers[language].submit(text)
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            language.value: batcher.metrics.snapshot()
+            for language, batcher in self._batchers.items()
+        }
+
+    async def close(self) -> None:
+        for batcher in self._batchers.values():
+            await batcher.close()
@@ -0,0 +1,271 @@
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from pymongo.synchronous.collection import Collection
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe in-process LRU cache with an optional time to live per entry.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None) -> None:
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if self.max_size == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for cache keys: NFC unicode and collapsed whitespace.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class ResultCache:
+    """
+    Content-addressed cache for prediction and highlight results.
+
+    Entries are keyed by the hash of the normalized input text together with
+    the model id and revision, so a model update never serves stale results.
+    The in-process LRU tier is always active, the MongoDB tier is optional and
+    shared between workers and restarts. Values are JSON-compatible payloads.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: Optional[float] = None,
+        collection: Optional[Collection] = None,
+    ) -> None:
+        self._memory: LRUCache[Any] = LRUCache(max_size, ttl_seconds)
+        self._collection = collection
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+
+        if self._collection is not None and ttl_seconds:
+            try:
+                self._collection.create_index(
+                    "created_at", expireAfterSeconds=int(ttl_seconds)
+                )
+            except Exception:
+                logger.warning("Could not create TTL index for the result cache", exc_info=True)
+
+    @staticmethod
+    def make_key(kind: str, text: str, model_id: str, revision: str) -> str:
+        digest = hashlib.sha256()
+        for part in (kind, model_id, revision, text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        payload = self._memory.get(key)
+        if payload is not None:
+            with self._lock:
+                self.hits += 1
+            return payload
+
+        if self._collection is not None:
+            try:
+                document = self._collection.find_one({"_id": key})
+            except Exception:
+                logger.warning("Result cache lookup in MongoDB failed", exc_info=True)
+                document = None
+
+            if document is not None:
+                payload = document["payload"]
+                self._memory.set(key, payload)
+                with self._lock:
+                    self.hits += 1
+                    self.mongo_hits += 1
+                return payload
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, payload: Any) -> None:
+        self._memory.set(key, payload)
+
+        if self._collection is not None:
+            try:
+                self._collection.replace_one(
+                    {"_id": key},
+                    {"payload": payload, "created_at": datetime.now(timezone.utc)},
+                    upsert=True,
+                )
+            except Exception:
+                logger.warning("Result cache write to MongoDB failed", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "mongo_hits": self.mongo_hits,
+                "misses": self.misses,
+                "memory": self._memory.stats(),
+                "mongo_enabled": self._collection is not None,
+            }
+
+
+# Query parameters that only track the referrer and never change the article.
+TRACKING_PARAM_PREFIXES = ("utm_", "pk_", "mtm_")
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "referrer", "source", "at_medium", "at_campaign", "wt_mc",
+    "_ga", "ito", "ncid", "cmpid",
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL used for cache keys.
+
+    The scheme is unified to https, the host lowercased without 'www.' and
+    default ports, tracking parameters and the fragment are dropped and the
+    remaining query parameters are sorted.
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+
+    return urlunsplit(("https", host, parts.path or "/", urlencode(query), ""))
+
+
+class ExtractionCache:
+    """
+    Cache for article extractions keyed by the canonical URL.
+
+    Entries validated within the last `fresh_seconds` are served without any
+    request. Older entries are kept until `ttl_seconds` and carry the ETag and
+    Last-Modified header of their response, so the extractor can revalidate
+    them with a conditional request instead of downloading and parsing again.
+    Storage reuses the LRU and optional MongoDB tiers of ResultCache; the parser
+    version is part of the key, so a Fundus update invalidates all entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: Optional[float] = None,
+        fresh_seconds: float = 900.0,
+        parser_version: str = "unknown",
+        collection: Optional[Collection] = None,
+    ) -> None:
+        self._store = ResultCache(max_size, ttl_seconds, collection)
+        self.fresh_seconds = fresh_seconds
+        self.parser_version = parser_version
+
+    def _key(self, url: str) -> str:
+        return ResultCache.make_key(
+            "extraction", canonicalize_url(url), "fundus", self.parser_version
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the entry with 'result', 'etag', 'last_modified' and 'validated_at'.
+        """
+        return self._store.get(self._key(url))
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["validated_at"] < self.fresh_seconds
+
+    def set(
+        self,
+        urls: Iterable[str],
+        result: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Stores a successful extraction under all given URLs, e.g. the requested
+        URL and the redirect target, and returns the stored entry.
+        """
+        entry = {
+            "result": dict(result),
+            "etag": etag,
+            "last_modified": last_modified,
+            "validated_at": time.time(),
+        }
+        for key in {self._key(url) for url in urls if url}:
+            self._store.set(key, entry)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        return self._store.stats()
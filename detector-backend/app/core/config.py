@@ -1,7 +1,10 @@
 from dotenv import load_dotenv
 from pathlib import Path
+from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.domain import InferenceBackend
+
 load_dotenv()
 
 
@@ -10,6 +13,86 @@ class Settings(BaseSettings):
     MONGO_DB_NAME: str = "fakenews"
     BASE_DIR: Path = Path(__file__).resolve().parent.parent
     OPENAI_API_KEY: str | None = None
+    # Language detection only analyzes this many leading characters of a text.
+    LANGUAGE_DETECTION_PREFIX_CHARS: int = 2000
+    # Candidate languages of the serving detector, an empty list considers all
+    # spoken languages. Only the full set reliably rejects unsupported input: a
+    # restricted detector reports the closest candidate, e.g. Swedish as German.
+    LANGUAGE_DETECTION_CANDIDATES: list[str] = []
+    # lingua's low accuracy mode only uses trigram models, which detects about twice
+    # as fast but misdetects many short texts; /predict rejects those with 422.
+    LANGUAGE_DETECTION_LOW_ACCURACY: bool = False
+    # Models load in the background after startup, /ready reports when they are available.
+    # Disable to block the startup until every component is loaded.
+    STARTUP_BACKGROUND_LOADING: bool = True
+    # Build the SHAP explainers right after the classifiers instead of on the first highlight.
+    STARTUP_PRELOAD_EXPLAINERS: bool = True
+    # Inference worker processes (python -m app.core.inference_worker) as Unix socket
+    # paths or host:port. If set, the API holds no models and forwards all inference.
+    INFERENCE_WORKER_ADDRESSES: list[str] = []
+    # Shared secret of API and workers; required, workers and clients refuse to start
+    # without it, since the connection unpickles every message it receives.
+    INFERENCE_WORKER_AUTHKEY: SecretStr | None = None
+    # Allow workers to listen on non-loopback TCP addresses.
+    INFERENCE_WORKER_ALLOW_REMOTE: bool = False
+    INFERENCE_WORKER_TIMEOUT_SECONDS: float = 300.0
+    INFERENCE_WORKER_STARTUP_TIMEOUT_SECONDS: float = 600.0
+    # Parallel extraction of multi-URL input: pool size, concurrent fetches per host
+    # and the deadline for all URLs of one input.
+    EXTRACTION_MAX_WORKERS: int = 8
+    EXTRACTION_PER_HOST_LIMIT: int = 2
+    EXTRACTION_MULTI_URL_TIMEOUT_SECONDS: float = 30.0
+    # Cache of article extractions keyed by canonical URL. Entries younger than the
+    # fresh time are served directly, older ones are revalidated via ETag/Last-Modified.
+    EXTRACTION_CACHE_SIZE: int = 512
+    EXTRACTION_CACHE_TTL_SECONDS: int = 24 * 3600
+    EXTRACTION_CACHE_FRESH_SECONDS: int = 900
+    EXTRACTION_CACHE_MONGO_ENABLED: bool = False
+    # robots.txt rules per publisher are fetched in the background at startup and
+    # refreshed after this interval, so requests do not wait for them.
+    EXTRACTION_ROBOTS_PREFETCH: bool = True
+    EXTRACTION_ROBOTS_REFRESH_SECONDS: int = 6 * 3600
+    # Async article downloads: timeouts, body size limit and HTTP/2 (needs `h2`).
+    EXTRACTION_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    EXTRACTION_READ_TIMEOUT_SECONDS: float = 15.0
+    EXTRACTION_MAX_RESPONSE_BYTES: int = 5 * 1024 * 1024
+    EXTRACTION_HTTP2: bool = True
+    # Domain → publisher index per Fundus version, built on first start if missing.
+    PUBLISHER_INDEX_DIR: Path = Path(__file__).resolve().parent.parent.parent / "cache" / "publisher_index"
+    # Rows per chunk when the data pipelines stream their CSV files, 0 disables chunking.
+    PIPELINE_CHUNK_SIZE: int = 20000
+    # Data pipelines that run at the same time, each in its own process.
+    PIPELINE_WORKERS: int = 4
+    # Language codes detected by the data pipelines, cached per dataset across runs.
+    LANGUAGE_CACHE_DIR: Path = Path(__file__).resolve().parent.parent.parent / "cache" / "language"
+    # Micro-batching of /predict requests. A max size of 1 disables batching.
+    PREDICT_BATCH_MAX_SIZE: int = 8
+    PREDICT_BATCH_MAX_WAIT_MS: float = 10.0
+    # Bounded inference pools. Requests beyond workers + queue get a 503.
+    PREDICT_WORKERS: int = 2
+    PREDICT_QUEUE_SIZE: int = 32
+    HIGHLIGHT_WORKERS: int = 1
+    HIGHLIGHT_QUEUE_SIZE: int = 4
+    INFERENCE_RETRY_AFTER_SECONDS: int = 5
+    # /predict/batch: items per call, classifier batch size and parallel extractions.
+    BATCH_PREDICT_MAX_ITEMS: int = 500
+    BATCH_PREDICT_CHUNK_SIZE: int = 32
+    BATCH_PREDICT_EXTRACTION_CONCURRENCY: int = 16
+    # Sliding-window classification of long articles (/predict?chunked=true).
+    CHUNK_OVERLAP_TOKENS: int = 64
+    CHUNK_MAX_CHUNKS: int = 8
+    # Per-stage timeouts of the combined /analyze endpoint.
+    ANALYZE_PREDICT_TIMEOUT_SECONDS: float = 30.0
+    ANALYZE_HIGHLIGHT_TIMEOUT_SECONDS: float = 180.0
+    ANALYZE_FACT_CHECK_TIMEOUT_SECONDS: float = 180.0
+    # Content-addressed cache for prediction and highlight results.
+    RESULT_CACHE_SIZE: int = 2048
+    RESULT_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    RESULT_CACHE_MONGO_ENABLED: bool = False
+    # Model runtime: "torch", "torch-int8" or "onnx" (needs the "onnx" extra).
+    INFERENCE_BACKEND: InferenceBackend = InferenceBackend.TORCH
+    # Exported ONNX models, created with `python -m app.core.model_export`.
+    ONNX_MODEL_DIR: Path = Path(__file__).resolve().parent.parent.parent / "models" / "onnx"
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,11 +1,27 @@
-from typing import List, Literal
+from pathlib import Path
+import threading
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from fastapi import HTTPException
+import numpy as np
 from shap import Explainer
 import torch
-from transformers import pipeline, Pipeline
+from transformers import Pipeline
 
-from app.domain import PredictionResult, TokenContribution
+from app.core.cache import ResultCache, normalize_text
+from app.core.inference_backend import load_classification_pipeline, onnx_model_dir
+from app.core.timing import timed
+from app.domain import (
+    AggregationStrategy,
+    ChunkedPredictionResult,
+    ChunkPrediction,
+    HighlightMode,
+    HighlightResult,
+    InferenceBackend,
+    Language,
+    PredictionResult,
+    TokenContribution,
+)
 from app.services.language_service import LanguageDetectionService
 from app.domain import Label
 
@@ -16,92 +32,372 @@ class FakeNewsDetector:
     and token-level interpretability via SHAP explainers.
     """
 
-    def __init__(self):
-        # Initialize pipelines for each supported language.
-        self.pipe_en = pipeline(
-            "text-classification",
-            "Lennywinks/fake-news-detector-english",
-            device=0 if torch.cuda.is_available() else -1,
-            truncation=True,
-            padding=True,
-            max_length=512
-        )
-        self.pipe_de = pipeline(
-            "text-classification",
-            "Lennywinks/fake-news-detector-german",
-            device=0 if torch.cuda.is_available() else -1,
-            truncation=True,
-            padding=True,
-            max_length=512
+    MODEL_IDS: Dict[Language, str] = {
+        Language.EN: "Lennywinks/fake-news-detector-english",
+        Language.DE: "Lennywinks/fake-news-detector-german",
+    }
+
+    def __init__(
+        self,
+        result_cache: Optional[ResultCache] = None,
+        language_prefix_chars: int = 2000,
+        language_detector: Optional[LanguageDetectionService] = None,
+        backend: InferenceBackend = InferenceBackend.TORCH,
+        onnx_base_dir: Optional[Path] = None,
+    ):
+        # Initialize pipelines for each supported language on the configured backend.
+        self.backend = InferenceBackend(backend)
+        self.pipe_en, self.pipe_de = (
+            load_classification_pipeline(
+                model_id,
+                backend=self.backend,
+                onnx_dir=onnx_model_dir(onnx_base_dir, model_id) if onnx_base_dir else None,
+            )
+            for model_id in (
+                FakeNewsDetector.MODEL_IDS[Language.EN],
+                FakeNewsDetector.MODEL_IDS[Language.DE],
+            )
         )
+        self.language_detector = language_detector or LanguageDetectionService()
+        # Language detection only looks at this many leading characters.
+        self.language_prefix_chars = language_prefix_chars
+        self.pipelines: Dict[Language, Pipeline] = {
+            Language.EN: self.pipe_en,
+            Language.DE: self.pipe_de,
+        }
         # SHAP Explainers take the pipeline as input to calculate feature importance for specific text tokens.
-        self.explainer_en = Explainer(self.pipe_en)
-        self.explainer_de = Explainer(self.pipe_de)
-        self.language_detector = LanguageDetectionService()
+        # They are built on first use, so predictions are served before they exist.
+        self.explainers: Dict[Language, Explainer] = {}
+        self._explainer_lock = threading.Lock()
+        # Optional cache so repeated articles skip inference entirely.
+        self.result_cache = result_cache
+
+    def detect_language(self, text: str) -> Language:
+        """
+        Determines which of the supported models is responsible for the text.
+        Runs a single detection on a bounded prefix of the text and raises a
+        422 error for any language other than English or German.
+        """
+        with timed("language"):
+            code = self.language_detector.detect_code(
+                text, max_chars=self.language_prefix_chars
+            )
+
+        try:
+            return Language(code)
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Language has to be either German or English. Got {code}.",
+            )
 
     def choose_language(
-        self, text: str, return_element: Literal["pipe", "explainer"]
+        self,
+        text: str,
+        return_element: Literal["pipe", "explainer"],
+        language: Optional[Language] = None,
     ) -> Pipeline | Explainer:
         """
         Routes the input text to the appropriate model based on language detection.
         Strictly enforces English or German support. If a different language is
         detected, a 422 error is raised to prevent invalid inference results.
+        An already detected language skips the detection.
         """
-        if self.language_detector.is_english(text):
-            pipe = self.pipe_en
-            explainer = self.explainer_en
-        elif self.language_detector.is_german(text):
-            pipe = self.pipe_de
-            explainer = self.explainer_de
-        else:
-            language = self.language_detector.detect_code(text)
-            raise HTTPException(
-                status_code=422,
-                detail=f"Language has to be either German or English. Got {language}.",
-            )
+        language = language or self.detect_language(text)
 
-        return pipe if return_element == "pipe" else explainer
+        if return_element == "pipe":
+            return self.pipelines[language]
+        return self.get_explainer(language)
 
-    def predict(self, text: str) -> PredictionResult:
+    def get_explainer(self, language: Language) -> Explainer:
+        """
+        Returns the SHAP explainer of a language, building it on first use.
+        """
+        explainer = self.explainers.get(language)
+        if explainer is None:
+            with self._explainer_lock:
+                explainer = self.explainers.get(language)
+                if explainer is None:
+                    explainer = Explainer(self.pipelines[language])
+                    self.explainers[language] = explainer
+        return explainer
+
+    def load_explainers(self) -> None:
+        """
+        Builds the explainers of all languages ahead of the first highlight request.
+        """
+        for language in self.pipelines:
+            self.get_explainer(language)
+
+    def predict(self, text: str, language: Optional[Language] = None) -> PredictionResult:
         """
         Executes a classification pass on the input text.
+        Pass the language if it is already known to skip the detection.
+        """
+        pipe = self.choose_language(text, return_element="pipe", language=language)
+        with timed("cache"):
+            cache_key = self._cache_key("predict", text, pipe)
+            cached = self._cache_get(cache_key)
+        if cached is not None:
+            return FakeNewsDetector._prediction_from_payload(cached)
+
+        with timed("inference"):
+            result = pipe(text, truncation=True, max_length=512)
+        prediction = FakeNewsDetector._to_prediction(result)
+        self._cache_set(cache_key, FakeNewsDetector._prediction_to_payload(prediction))
+
+        return prediction
+
+    def predict_batch(
+        self, texts: List[str], language: Language
+    ) -> List[PredictionResult]:
+        """
+        Classifies several texts of the same language in one padded forward pass.
+        The language has to be detected beforehand, e.g. by the prediction batcher.
+        """
+        if not texts:
+            return []
+
+        pipe = self.pipelines[language]
+        predictions: List[Optional[PredictionResult]] = []
+        with timed("cache"):
+            cache_keys = [self._cache_key("predict", text, pipe) for text in texts]
+            for cache_key in cache_keys:
+                cached = self._cache_get(cache_key)
+                predictions.append(
+                    FakeNewsDetector._prediction_from_payload(cached)
+                    if cached is not None
+                    else None
+                )
+
+        # Only cache misses go through the model.
+        missing = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if missing:
+            with timed("inference"):
+                results = pipe(
+                    [texts[i] for i in missing],
+                    truncation=True,
+                    max_length=512,
+                    batch_size=len(missing),
+                )
+            for i, result in zip(missing, results):
+                predictions[i] = FakeNewsDetector._to_prediction(result)
+                self._cache_set(
+                    cache_keys[i], FakeNewsDetector._prediction_to_payload(predictions[i])
+                )
+
+        return predictions
+
+    def predict_chunked(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        strategy: AggregationStrategy = AggregationStrategy.MEAN,
+        overlap: int = 64,
+        max_chunks: int = 8,
+        max_length: int = 512,
+    ) -> ChunkedPredictionResult:
+        """
+        Classifies the whole text instead of only its first 512 tokens.
+
+        The text is split into overlapping token windows, all windows are
+        classified in one batched forward pass and their fake probabilities are
+        aggregated with the given strategy. At most `max_chunks` windows are
+        classified to keep latency bounded; for longer texts they are spread
+        evenly over the article.
         """
-        pipe = self.choose_language(text, return_element="pipe")
+        language = language or self.detect_language(text)
+        pipe = self.pipelines[language]
+        text = normalize_text(text)
+
+        cache_kind = f"predict-chunked-{strategy.value}-{overlap}-{max_chunks}-{max_length}"
+        with timed("cache"):
+            cache_key = self._cache_key(cache_kind, text, pipe)
+            cached = self._cache_get(cache_key)
+        if cached is not None:
+            return ChunkedPredictionResult(
+                prediction=FakeNewsDetector._prediction_from_payload(cached["prediction"]),
+                chunks=[ChunkPrediction(**chunk) for chunk in cached["chunks"]],
+                total_tokens=cached["total_tokens"],
+            )
+
+        with timed("chunking"):
+            chunks, total_tokens = FakeNewsDetector._split_into_chunks(
+                text, pipe, overlap=overlap, max_chunks=max_chunks, max_length=max_length
+            )
+
+        with timed("inference"):
+            results = pipe(
+                [chunk for chunk, _ in chunks],
+                truncation=True,
+                max_length=max_length,
+                batch_size=len(chunks),
+            )
+
+        chunk_predictions = []
+        for index, ((_, token_count), result) in enumerate(zip(chunks, results)):
+            prediction = FakeNewsDetector._to_prediction(result)
+            fake_score = (
+                prediction.score if prediction.label == Label.FAKE else 1 - prediction.score
+            )
+            chunk_predictions.append(
+                ChunkPrediction(
+                    index=index,
+                    token_count=token_count,
+                    label=prediction.label,
+                    score=float(prediction.score),
+                    fake_score=float(fake_score),
+                )
+            )
+
+        fake_score = FakeNewsDetector._aggregate_fake_score(chunk_predictions, strategy)
+        label = Label.FAKE if fake_score >= 0.5 else Label.REAL
+        prediction = PredictionResult(
+            label=label, score=fake_score if label == Label.FAKE else 1 - fake_score
+        )
+
+        self._cache_set(
+            cache_key,
+            {
+                "prediction": FakeNewsDetector._prediction_to_payload(prediction),
+                "chunks": [
+                    {**chunk.__dict__, "label": Label(chunk.label).value}
+                    for chunk in chunk_predictions
+                ],
+                "total_tokens": total_tokens,
+            },
+        )
+
+        return ChunkedPredictionResult(
+            prediction=prediction, chunks=chunk_predictions, total_tokens=total_tokens
+        )
+
+    @staticmethod
+    def _split_into_chunks(
+        text: str, pipe: Pipeline, overlap: int, max_chunks: int, max_length: int = 512
+    ) -> Tuple[List[Tuple[str, int]], int]:
+        """
+        Splits the text into overlapping windows that fit into the model.
+        Windows are cut at token boundaries via the character offsets, so each
+        chunk is a substring of the original text.
+        Returns (chunk text, token count) pairs and the total number of tokens.
+        """
+        tokenizer = pipe.tokenizer
+        offsets = tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            truncation=False,
+            verbose=False,
+        )["offset_mapping"]
+        total_tokens = len(offsets)
+
+        # Room for [CLS] and [SEP] has to be left in every window.
+        window = max(1, max_length - tokenizer.num_special_tokens_to_add())
+        step = max(1, window - max(0, overlap))
+        starts = list(range(0, max(total_tokens - overlap, 1), step))
+
+        # Spread the allowed windows evenly, so the whole article is represented.
+        if len(starts) > max_chunks > 1:
+            last = len(starts) - 1
+            starts = [starts[round(i * last / (max_chunks - 1))] for i in range(max_chunks)]
+        elif len(starts) > max_chunks:
+            starts = starts[:1]
+
+        chunks = []
+        for start in starts:
+            end = min(start + window, total_tokens)
+            if end <= start:
+                continue
+            chunks.append((text[offsets[start][0]:offsets[end - 1][1]], end - start))
+
+        return chunks or [(text, total_tokens)], total_tokens
+
+    @staticmethod
+    def _aggregate_fake_score(
+        chunks: List[ChunkPrediction], strategy: AggregationStrategy
+    ) -> float:
+        fake_scores = [chunk.fake_score for chunk in chunks]
+
+        if strategy == AggregationStrategy.MAX_FAKE:
+            return max(fake_scores)
+        if strategy == AggregationStrategy.LENGTH_WEIGHTED:
+            total = sum(chunk.token_count for chunk in chunks)
+            if total > 0:
+                return sum(chunk.fake_score * chunk.token_count for chunk in chunks) / total
 
-        result = pipe(text, truncation=True, max_length=512)
-        top_result = max(result, key=lambda x: x["score"])
+        return sum(fake_scores) / len(fake_scores)
+
+    @staticmethod
+    def _to_prediction(result: Dict[str, Any] | List[Dict[str, Any]]) -> PredictionResult:
+        """
+        Converts the raw pipeline output of a single text into a PredictionResult.
+        The pipeline returns a list for single inputs and a dict per text for batches.
+        """
+        candidates = [result] if isinstance(result, dict) else result
+        top_result = max(candidates, key=lambda x: x["score"])
 
         label = Label(top_result["label"])
         score = top_result["score"]
 
         return PredictionResult(label=label, score=score)
 
-    def highlight(self, text: str) -> List[TokenContribution]:
+    def highlight(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> List[TokenContribution]:
         """
         Calculates the contribution of each token to the classification result.
+        See `explain` for details, which additionally returns the prediction.
+        """
+        return self.explain(text, language=language, mode=mode).highlights
 
-        Uses SHAP (SHapley Additive exPlanations) to assign importance scores.
+    def explain(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> HighlightResult:
+        """
+        Calculates the contribution of each token together with the prediction.
+
+        In exact mode SHAP (SHapley Additive exPlanations) assigns the importance
+        scores, which takes many forward passes. Fast mode approximates them with
+        gradient x input from a single forward and backward pass.
         Scores are normalized against the maximum absolute value to allow for
         consistent heatmapping in the frontend.
+        The language is detected once and reused for truncation, explanation
+        and prediction. The prediction is taken from the explanation itself, so
+        no separate classification pass is needed.
         """
-        pipe = self.choose_language(text, return_element="pipe")
-        text_for_explainer = self._truncate_text_for_model(text, pipe)
-        explainer = self.choose_language(text_for_explainer, return_element="explainer")
-
-        # This call is computationally expensive as it requires multiple inference passes to calculate Shapley values.
-        try:
-            shap_values = explainer([text_for_explainer])
-        except Exception as exc:
+        if mode == HighlightMode.FAST and self.backend != InferenceBackend.TORCH:
             raise HTTPException(
-                status_code=500, detail=f"Could not generate highlights: {exc}"
-            ) from exc
+                status_code=400,
+                detail=f"Fast highlight mode needs the torch backend, running {self.backend.value}.",
+            )
 
-        # Get the predicted label
-        prediction = self.predict(text_for_explainer)
-        target_class = 0 if prediction.label == Label.FAKE else 1
+        language = language or self.detect_language(text)
+        pipe = self.pipelines[language]
+        cache_kind = "explanation" if mode == HighlightMode.EXACT else f"explanation-{mode.value}"
+        with timed("cache"):
+            cache_key = self._cache_key(cache_kind, text, pipe)
+            cached = self._cache_get(cache_key)
+        if cached is not None:
+            return HighlightResult(
+                highlights=[TokenContribution(**item) for item in cached["highlights"]],
+                prediction=FakeNewsDetector._prediction_from_payload(cached["prediction"]),
+            )
+
+        with timed("truncation"):
+            text_for_explainer = self._truncate_text_for_model(normalize_text(text), pipe)
+
+        if mode == HighlightMode.FAST:
+            tokens, values, prediction = self._gradient_attributions(text_for_explainer, pipe)
+        else:
+            tokens, values, prediction = self._shap_attributions(text_for_explainer, language)
 
-        tokens = shap_values.data[0]
-        values = shap_values.values[0, :, target_class]
         if len(values) == 0:
             raise HTTPException(
                 status_code=500,
@@ -122,8 +418,149 @@ class FakeNewsDetector:
         highlights = FakeNewsDetector.merge_tokens_to_words(
             original_text=text_for_explainer, highlights=highlights
         )
+        self._cache_set(
+            cache_key,
+            {
+                "highlights": [
+                    {
+                        "token": h.token,
+                        "score": float(h.score),
+                        "score_normalized": float(h.score_normalized),
+                    }
+                    for h in highlights
+                ],
+                "prediction": FakeNewsDetector._prediction_to_payload(prediction),
+            },
+        )
+
+        return HighlightResult(highlights=highlights, prediction=prediction)
+
+    def _shap_attributions(
+        self, text_for_explainer: str, language: Language
+    ) -> Tuple[List[str], List[float], PredictionResult]:
+        """
+        Exact token attributions for the predicted class via the SHAP explainer.
+
+        SHAP values are additive, so the base value plus the sum of all token
+        values is the model output on the unmasked text. The predicted class and
+        its score are read from there instead of running the pipeline again.
+        """
+        explainer = self.get_explainer(language)
+
+        # This call is computationally expensive as it requires multiple inference passes to calculate Shapley values.
+        try:
+            with timed("explanation"):
+                shap_values = explainer([text_for_explainer])
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500, detail=f"Could not generate highlights: {exc}"
+            ) from exc
+
+        full_output = shap_values.base_values[0] + shap_values.values[0].sum(axis=0)
+        target_class = int(np.argmax(full_output))
+        prediction = PredictionResult(
+            label=Label.from_number(target_class),
+            score=float(full_output[target_class]),
+        )
+
+        return (
+            list(shap_values.data[0]),
+            list(shap_values.values[0, :, target_class]),
+            prediction,
+        )
 
-        return highlights
+    @staticmethod
+    def _gradient_attributions(
+        text_for_explainer: str, pipe: Pipeline
+    ) -> Tuple[List[str], List[float], PredictionResult]:
+        """
+        Approximate token attributions via gradient x input on the embeddings.
+
+        One forward and one backward pass yield the gradient of the predicted
+        class logit with respect to each input embedding. Its dot product with
+        the embedding is the token score. Tokens are cut from the text by their
+        character offsets, so they can be merged to words like SHAP tokens.
+        The prediction is the softmax of the same forward pass.
+        """
+        tokenizer = pipe.tokenizer
+        model = pipe.model
+
+        try:
+            with timed("explanation"):
+                encoded = tokenizer(
+                    text_for_explainer,
+                    truncation=True,
+                    max_length=512,
+                    return_offsets_mapping=True,
+                    return_tensors="pt",
+                )
+                offsets = encoded.pop("offset_mapping")[0].tolist()
+                inputs = {key: value.to(model.device) for key, value in encoded.items()}
+                input_ids = inputs.pop("input_ids")
+
+                with torch.enable_grad():
+                    embeddings = model.get_input_embeddings()(input_ids).detach()
+                    embeddings.requires_grad_(True)
+                    logits = model(inputs_embeds=embeddings, **inputs).logits[0]
+                    target_class = int(logits.argmax())
+                    (gradients,) = torch.autograd.grad(logits[target_class], embeddings)
+
+                probabilities = torch.softmax(logits.detach(), dim=-1)
+                prediction = PredictionResult(
+                    label=Label.from_number(target_class),
+                    score=float(probabilities[target_class]),
+                )
+
+                scores = (gradients[0] * embeddings[0]).sum(dim=-1).detach().cpu().tolist()
+        except Exception as exc:
+            raise HTTPException(
+                status_code=500, detail=f"Could not generate highlights: {exc}"
+            ) from exc
+
+        tokens = []
+        values = []
+        for (start, end), score in zip(offsets, scores):
+            # Special tokens like [CLS] and [SEP] have an empty offset span.
+            if start == end:
+                continue
+            tokens.append(text_for_explainer[start:end])
+            values.append(score)
+
+        return tokens, values, prediction
+
+    def _cache_key(self, kind: str, text: str, pipe: Pipeline) -> Optional[str]:
+        """
+        Builds the content address of a result: the hash of the normalized text
+        plus the model id, its revision and the inference backend.
+        The tokenizer is not involved, so a cache hit costs no tokenization.
+        """
+        if self.result_cache is None:
+            return None
+
+        model = getattr(pipe, "model", None)
+        config = getattr(model, "config", None)
+        model_id = getattr(config, "name_or_path", None) or type(model).__name__
+        revision = getattr(config, "_commit_hash", None) or "unknown"
+        # Quantized or exported models may score slightly differently.
+        revision = f"{revision}:{self.backend.value}"
+        return ResultCache.make_key(kind, normalize_text(text), model_id, revision)
+
+    def _cache_get(self, cache_key: Optional[str]) -> Any:
+        if cache_key is None:
+            return None
+        return self.result_cache.get(cache_key)
+
+    def _cache_set(self, cache_key: Optional[str], payload: Any) -> None:
+        if cache_key is not None:
+            self.result_cache.set(cache_key, payload)
+
+    @staticmethod
+    def _prediction_to_payload(prediction: PredictionResult) -> Dict[str, Any]:
+        return {"label": Label(prediction.label).value, "score": float(prediction.score)}
+
+    @staticmethod
+    def _prediction_from_payload(payload: Dict[str, Any]) -> PredictionResult:
+        return PredictionResult(label=Label(payload["label"]), score=payload["score"])
 
     @staticmethod
     def _truncate_text_for_model(text: str, pipe: Pipeline, max_length: int = 512) -> str:
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Optional
+
+import torch
+from transformers import AutoTokenizer, pipeline, Pipeline
+
+from app.core.logging_config import get_logger
+from app.domain import InferenceBackend
+
+logger = get_logger(__name__)
+
+
+def onnx_model_dir(base_dir: Path, model_id: str) -> Path:
+    """
+    Location of the exported ONNX model of a Hugging Face model id.
+    """
+    return base_dir / model_id.replace("/", "__")
+
+
+def load_classification_pipeline(
+    model_id: str,
+    backend: InferenceBackend = InferenceBackend.TORCH,
+    onnx_dir: Optional[Path] = None,
+    max_length: int = 512,
+) -> Pipeline:
+    """
+    Builds the text-classification pipeline of a model for the given backend.
+
+    All backends return a regular transformers pipeline, so batching, SHAP and
+    the rest of the detector work unchanged. Only the fast highlight mode needs
+    gradients and therefore the plain torch backend.
+    """
+    if backend == InferenceBackend.ONNX:
+        return _load_onnx_pipeline(model_id, onnx_dir, max_length)
+
+    # Dynamically quantized models only run on CPU.
+    use_gpu = torch.cuda.is_available() and backend == InferenceBackend.TORCH
+    pipe = pipeline(
+        "text-classification",
+        model_id,
+        device=0 if use_gpu else -1,
+        truncation=True,
+        padding=True,
+        max_length=max_length,
+    )
+
+    if backend == InferenceBackend.TORCH_INT8:
+        # The weights of all linear layers are converted to int8,
+        # activations are quantized on the fly.
+        pipe.model = torch.ao.quantization.quantize_dynamic(
+            pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    return pipe
+
+
+def _load_onnx_pipeline(
+    model_id: str, onnx_dir: Optional[Path], max_length: int
+) -> Pipeline:
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except ImportError as exc:
+        raise RuntimeError(
+            "The onnx inference backend needs the optional dependencies: "
+            "uv sync --extra onnx"
+        ) from exc
+
+    if onnx_dir is not None and (onnx_dir / "model.onnx").exists():
+        model = ORTModelForSequenceClassification.from_pretrained(onnx_dir)
+        tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+    else:
+        # Without a prepared export the model is converted at startup, which is slow.
+        logger.warning("No ONNX export found for %s, exporting on the fly", model_id)
+        model = ORTModelForSequenceClassification.from_pretrained(model_id, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_id)
+
+    return pipeline(
+        "text-classification",
+        model=model,
+        tokenizer=tokenizer,
+        truncation=True,
+        padding=True,
+        max_length=max_length,
+    )
@@ -0,0 +1,77 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for blocking model inference.
+
+    Routes await `run` instead of calling the detector directly, so the event
+    loop stays responsive during long SHAP runs. At most `max_workers` jobs run
+    at once and `max_queue` more may wait; anything beyond that is rejected with
+    a 503 and a Retry-After header instead of piling up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue: int,
+        retry_after_seconds: int = 5,
+    ) -> None:
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.capacity = self.max_workers + max(0, max_queue)
+        self.retry_after_seconds = retry_after_seconds
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"{name}-inference"
+        )
+        # Jobs keep their slot until the thread finishes, even if the caller is gone.
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _release(self, _future: Any) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"The {self.name} queue is full. Please try again later.",
+                    headers={"Retry-After": str(self.retry_after_seconds)},
+                )
+            self._in_flight += 1
+
+        # Copy the request context so stage timings recorded in the thread are kept.
+        context = contextvars.copy_context()
+        future = self._pool.submit(context.run, partial(fn, *args, **kwargs))
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,170 @@
+"""
+Inference worker process holding the classifiers and explainers.
+
+The API talks to it through RemoteDetector when INFERENCE_WORKER_ADDRESSES is
+set, so heavy SHAP runs no longer compete with request handling for the GIL
+and a crashed worker does not take the API down.
+
+Usage:
+    uv run python -m app.core.inference_worker --address /tmp/fake-news-inference-0.sock
+    uv run python -m app.core.inference_worker --address 127.0.0.1:9100
+"""
+
+import argparse
+import os
+import threading
+from multiprocessing.connection import AuthenticationError, Connection, Listener
+from typing import Any, Tuple
+
+from fastapi import HTTPException
+
+from app.core.logging_config import get_logger
+from app.core.remote_detector import Address, is_loopback, parse_address, require_authkey
+
+logger = get_logger(__name__)
+
+# Detector methods that clients are allowed to call.
+EXPOSED_METHODS = {
+    "detect_language",
+    "predict",
+    "predict_batch",
+    "predict_chunked",
+    "highlight",
+    "explain",
+    "load_explainers",
+}
+
+
+class InferenceWorkerServer:
+    """
+    Serves the methods of a detector over a local socket.
+
+    Every client connection gets its own thread and handles one call at a time,
+    so the number of parallel inference jobs follows the number of connections.
+    Requests are (method, args, kwargs) tuples; replies are ("ok", result) or
+    ("error", status_code, detail), which the client turns into an HTTPException.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        address: Address,
+        authkey: bytes,
+        allow_remote: bool = False,
+    ) -> None:
+        if not authkey:
+            raise ValueError("An authkey for the inference worker is required.")
+        if not allow_remote and not is_loopback(address):
+            raise ValueError(
+                f"Refusing to listen on non-loopback address {address}; "
+                "set INFERENCE_WORKER_ALLOW_REMOTE to allow it."
+            )
+        if isinstance(address, str) and os.path.exists(address):
+            # A socket file left over from a crashed worker blocks the bind.
+            os.unlink(address)
+        self.detector = detector
+        self._listener = Listener(address, authkey=authkey)
+        self._closed = False
+
+    @property
+    def address(self) -> Address:
+        return self._listener.address
+
+    def serve_forever(self) -> None:
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError) as exc:
+                if self._closed:
+                    break
+                logger.warning("Rejected inference client: %s", exc)
+                continue
+            threading.Thread(
+                target=self._serve_connection, args=(conn,), daemon=True
+            ).start()
+
+    def _serve_connection(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    method, args, kwargs = conn.recv()
+                except (OSError, EOFError):
+                    return
+                reply = self._dispatch(method, args, kwargs)
+                try:
+                    conn.send(reply)
+                except (OSError, EOFError):
+                    # The client gave up on the call (e.g. its timeout) and closed the connection.
+                    logger.debug("Inference client left before the reply to %s", method)
+                    return
+
+    def _dispatch(self, method: str, args: tuple, kwargs: dict) -> Tuple[Any, ...]:
+        if method == "ping":
+            return ("ok", True)
+        if method not in EXPOSED_METHODS:
+            return ("error", 400, f"Unknown inference method {method}.")
+
+        try:
+            return ("ok", getattr(self.detector, method)(*args, **kwargs))
+        except HTTPException as exc:
+            return ("error", exc.status_code, exc.detail)
+        except Exception as exc:
+            logger.exception("Inference call %s failed", method)
+            return ("error", 500, str(exc))
+
+    def close(self) -> None:
+        self._closed = True
+        self._listener.close()
+
+
+def main() -> None:
+    from app.core.cache import ResultCache
+    from app.core.config import Settings
+    from app.db import Database
+    from app.main import build_detector, build_language_detector
+
+    parser = argparse.ArgumentParser(description="Inference worker for the backend.")
+    parser.add_argument(
+        "--address", required=True, help="Unix socket path or host:port to listen on."
+    )
+    args = parser.parse_args()
+    settings = Settings()
+    # Fail before loading the models if the worker could not listen anyway.
+    authkey = require_authkey(settings.INFERENCE_WORKER_AUTHKEY)
+    address = parse_address(args.address)
+    if not settings.INFERENCE_WORKER_ALLOW_REMOTE and not is_loopback(address):
+        parser.error(
+            f"{args.address} is not a loopback address; set INFERENCE_WORKER_ALLOW_REMOTE to allow it."
+        )
+
+    database = Database(settings) if settings.RESULT_CACHE_MONGO_ENABLED else None
+    result_cache = ResultCache(
+        max_size=settings.RESULT_CACHE_SIZE,
+        ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+        collection=database.get_result_cache_collection() if database else None,
+    )
+    language_detector = build_language_detector()
+    language_detector.warm_up()
+    detector = build_detector(result_cache, language_detector)
+    if settings.STARTUP_PRELOAD_EXPLAINERS:
+        detector.load_explainers()
+
+    server = InferenceWorkerServer(
+        detector,
+        address,
+        authkey=authkey,
+        allow_remote=settings.INFERENCE_WORKER_ALLOW_REMOTE,
+    )
+    logger.info("Inference worker listening on %s", server.address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if database is not None:
+            database.close()
+
+
+if __name__ == "__main__":
+    main()
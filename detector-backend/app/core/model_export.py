@@ -0,0 +1,172 @@
+"""
+Exports the detector models to ONNX and validates the alternative backends
+against the fp32 torch pipeline on a sample of the processed articles in
+MongoDB (run the data pipelines first).
+
+Usage:
+    uv run python -m app.core.model_export                 # export + validate
+    uv run python -m app.core.model_export --validate-only # validate existing exports
+    uv run python -m app.core.model_export --sample-size 1000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from pymongo.synchronous.collection import Collection
+from transformers import AutoTokenizer, Pipeline
+
+from app.core.config import Settings
+from app.core.detector import FakeNewsDetector
+from app.core.inference_backend import load_classification_pipeline, onnx_model_dir
+from app.core.logging_config import get_logger
+from app.db import Database
+from app.domain import InferenceBackend, Language
+
+logger = get_logger(__name__)
+
+# Tokens per text, as in FakeNewsDetector.
+MAX_LENGTH = 512
+
+
+def export_onnx(model_id: str, target_dir: Path) -> None:
+    """
+    Converts a Hugging Face model to ONNX and stores it together with its tokenizer.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except ImportError:
+        raise RuntimeError(
+            "Exporting to ONNX needs the optional dependencies: uv sync --extra onnx"
+        )
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    model = ORTModelForSequenceClassification.from_pretrained(model_id, export=True)
+    model.save_pretrained(target_dir)
+    AutoTokenizer.from_pretrained(model_id).save_pretrained(target_dir)
+    logger.info("Exported %s to %s", model_id, target_dir)
+
+
+def load_validation_texts(articles: Collection, language: Language, size: int) -> List[str]:
+    """
+    Returns up to `size` processed articles of the language. They are ordered
+    by their article key, a hash of the text, so the sample spreads over all
+    datasets and stays the same between runs while the data does not change.
+    """
+    cursor = (
+        articles.find(
+            {"language": language.value, "article_key": {"$exists": True}},
+            {"_id": 0, "text": 1},
+        )
+        .sort("article_key", 1)
+        .limit(size)
+    )
+    return [doc["text"] for doc in cursor if doc.get("text")]
+
+
+def compare_pipelines(
+    reference: Pipeline, candidate: Pipeline, texts: List[str]
+) -> Dict[str, float]:
+    """
+    Returns the label agreement and the largest score deviation of a candidate
+    pipeline compared to the reference on the given texts.
+    """
+    # top_k=None returns the scores of all labels, not just the winning one.
+    options = dict(top_k=None, truncation=True, max_length=MAX_LENGTH, batch_size=16)
+    expected = reference(texts, **options)
+    actual = candidate(texts, **options)
+
+    agreeing = 0
+    max_score_diff = 0.0
+    for exp, act in zip(expected, actual):
+        exp_scores = {entry["label"]: entry["score"] for entry in exp}
+        act_scores = {entry["label"]: entry["score"] for entry in act}
+        agreeing += max(exp_scores, key=exp_scores.get) == max(act_scores, key=act_scores.get)
+        max_score_diff = max(
+            max_score_diff,
+            max(abs(exp_scores[label] - act_scores[label]) for label in exp_scores),
+        )
+
+    return {
+        "agreement": agreeing / len(texts),
+        "max_score_diff": max_score_diff,
+    }
+
+
+def main() -> None:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output-dir", type=Path, default=settings.ONNX_MODEL_DIR)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        type=InferenceBackend,
+        default=[InferenceBackend.TORCH_INT8, InferenceBackend.ONNX],
+        help="Backends to validate against the fp32 torch pipeline.",
+    )
+    parser.add_argument("--validate-only", action="store_true")
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=300,
+        help="Processed articles per language to validate on.",
+    )
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        default=0.99,
+        help="Lowest accepted share of labels matching the fp32 pipeline.",
+    )
+    parser.add_argument(
+        "--max-score-diff",
+        type=float,
+        default=0.1,
+        help="Largest accepted score deviation from the fp32 pipeline.",
+    )
+    args = parser.parse_args()
+
+    db = Database(settings)
+    try:
+        articles = db.get_articles_collection()
+        samples = {
+            language: load_validation_texts(articles, language, args.sample_size)
+            for language in FakeNewsDetector.MODEL_IDS
+        }
+    finally:
+        db.close()
+    for language, texts in samples.items():
+        if not texts:
+            parser.error(
+                f"No processed {language.value} articles in MongoDB, run the data pipelines first."
+            )
+
+    passed = True
+    for language, model_id in FakeNewsDetector.MODEL_IDS.items():
+        target_dir = onnx_model_dir(args.output_dir, model_id)
+        if InferenceBackend.ONNX in args.backends and not args.validate_only:
+            export_onnx(model_id, target_dir)
+
+        reference = load_classification_pipeline(model_id, InferenceBackend.TORCH)
+        for backend in args.backends:
+            candidate = load_classification_pipeline(model_id, backend, onnx_dir=target_dir)
+            result = compare_pipelines(reference, candidate, samples[language])
+            ok = (
+                result["agreement"] >= args.min_agreement
+                and result["max_score_diff"] <= args.max_score_diff
+            )
+            passed = passed and ok
+            print(
+                f"{language.value} {backend.value:<11} "
+                f"{len(samples[language])} texts | "
+                f"label agreement {result['agreement']:.2%} | "
+                f"max score diff {result['max_score_diff']:.4f} | "
+                f"{'OK' if ok else 'FAILED'}"
+            )
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
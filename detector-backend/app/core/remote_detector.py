@@ -0,0 +1,258 @@
+import ipaddress
+import itertools
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Connection
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+from pydantic import SecretStr
+
+from app.core.logging_config import get_logger
+from app.domain import (
+    AggregationStrategy,
+    ChunkedPredictionResult,
+    HighlightMode,
+    HighlightResult,
+    Language,
+    PredictionResult,
+    TokenContribution,
+)
+
+logger = get_logger(__name__)
+
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(address: str) -> Address:
+    """
+    Turns "host:port" into a TCP address, anything else is a Unix socket path.
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def is_loopback(address: Address) -> bool:
+    """
+    Unix sockets and TCP addresses on localhost are only reachable from this machine.
+    """
+    if isinstance(address, str):
+        return True
+    host = address[0]
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def require_authkey(secret: SecretStr | None) -> bytes:
+    """
+    Returns the configured worker secret. multiprocessing connections unpickle
+    every message, so workers and clients must never run without one.
+    """
+    authkey = secret.get_secret_value().encode() if secret is not None else b""
+    if not authkey:
+        raise ValueError(
+            "INFERENCE_WORKER_AUTHKEY must be set to a secret shared by the API "
+            "and its inference workers."
+        )
+    return authkey
+
+
+class RemoteDetector:
+    """
+    Client proxy for detectors running in separate inference worker processes.
+
+    It offers the same interface as FakeNewsDetector, so routes, batching and
+    executors use it unchanged. Calls are spread round-robin over the workers.
+    If a worker is unreachable, the call moves on to the next worker; only if
+    none is left the request fails with a 503. A call is never replayed once a
+    worker received it: if that worker dies, the call fails with a 502, so a
+    request that crashes workers cannot take all of them down.
+    """
+
+    def __init__(
+        self,
+        addresses: List[str],
+        authkey: bytes,
+        timeout_seconds: float = 300.0,
+    ) -> None:
+        if not addresses:
+            raise ValueError("At least one inference worker address is required.")
+        if not authkey:
+            raise ValueError("An authkey for the inference workers is required.")
+        self.addresses = [parse_address(address) for address in addresses]
+        self.authkey = authkey
+        self.timeout_seconds = timeout_seconds
+        # Idle connections per worker, every call borrows one exclusively.
+        self._idle: Dict[int, List[Connection]] = {i: [] for i in range(len(addresses))}
+        self._lock = threading.Lock()
+        self._next_worker = itertools.count()
+
+    def _acquire(self, index: int) -> Tuple[Connection, bool]:
+        with self._lock:
+            if self._idle[index]:
+                return self._idle[index].pop(), True
+        return Client(self.addresses[index], authkey=self.authkey), False
+
+    def _release(self, index: int, conn: Connection) -> None:
+        with self._lock:
+            self._idle[index].append(conn)
+
+    def _discard_idle(self, index: int) -> None:
+        # After a failure all pooled connections of that worker are suspect.
+        with self._lock:
+            stale, self._idle[index] = self._idle[index], []
+        for conn in stale:
+            conn.close()
+
+    @staticmethod
+    def _is_stale(conn: Connection) -> bool:
+        # An idle connection has nothing to read unless its worker closed it.
+        try:
+            return conn.poll(0)
+        except (OSError, EOFError):
+            return True
+
+    def _call_worker(self, index: int, method: str, args: tuple, kwargs: dict) -> Any:
+        """
+        Runs a call on one worker. Raises ConnectionError if the request could
+        not be sent, so it may go to another worker. Once the worker has the
+        request, its death fails the call with a 502 instead of replaying it.
+        The error of the detector call itself is raised as HTTPException.
+        """
+        # A pooled connection may belong to a worker that restarted, retry with a new one.
+        for _ in range(2):
+            try:
+                conn, reused = self._acquire(index)
+            except (OSError, EOFError, AuthenticationError) as exc:
+                raise ConnectionError(f"Worker {self.addresses[index]} unreachable") from exc
+
+            if reused and RemoteDetector._is_stale(conn):
+                conn.close()
+                self._discard_idle(index)
+                continue
+
+            try:
+                conn.send((method, args, kwargs))
+            except (OSError, EOFError) as exc:
+                conn.close()
+                self._discard_idle(index)
+                if reused:
+                    continue
+                raise ConnectionError(f"Worker {self.addresses[index]} failed") from exc
+
+            try:
+                if not conn.poll(self.timeout_seconds):
+                    conn.close()
+                    raise HTTPException(
+                        status_code=504,
+                        detail=f"Inference worker did not answer within {self.timeout_seconds:g} seconds.",
+                    )
+                reply = conn.recv()
+            except (OSError, EOFError) as exc:
+                conn.close()
+                self._discard_idle(index)
+                logger.error(
+                    "Inference worker %s died during %s", self.addresses[index], method
+                )
+                raise HTTPException(
+                    status_code=502,
+                    detail="Inference worker failed while processing the request.",
+                ) from exc
+
+            self._release(index, conn)
+            status, *payload = reply
+            if status == "ok":
+                return payload[0]
+            status_code, detail = payload
+            raise HTTPException(status_code=status_code, detail=detail)
+
+        raise ConnectionError(f"Worker {self.addresses[index]} failed")
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        start = next(self._next_worker)
+        for offset in range(len(self.addresses)):
+            index = (start + offset) % len(self.addresses)
+            try:
+                return self._call_worker(index, method, args, kwargs)
+            except ConnectionError as exc:
+                logger.warning("Inference call %s failed: %s", method, exc)
+
+        raise HTTPException(
+            status_code=503, detail="No inference worker is available right now."
+        )
+
+    def wait_until_available(self, timeout_seconds: float) -> None:
+        """
+        Blocks until at least one worker answers, e.g. while workers still load models.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            try:
+                self._call("ping")
+                return
+            except HTTPException:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(1)
+
+    def detect_language(self, text: str) -> Language:
+        return self._call("detect_language", text)
+
+    def predict(self, text: str, language: Optional[Language] = None) -> PredictionResult:
+        return self._call("predict", text, language=language)
+
+    def predict_batch(self, texts: List[str], language: Language) -> List[PredictionResult]:
+        return self._call("predict_batch", texts, language)
+
+    def predict_chunked(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        strategy: AggregationStrategy = AggregationStrategy.MEAN,
+        overlap: int = 64,
+        max_chunks: int = 8,
+        max_length: int = 512,
+    ) -> ChunkedPredictionResult:
+        return self._call(
+            "predict_chunked",
+            text,
+            language=language,
+            strategy=strategy,
+            overlap=overlap,
+            max_chunks=max_chunks,
+            max_length=max_length,
+        )
+
+    def highlight(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> List[TokenContribution]:
+        return self._call("highlight", text, language=language, mode=mode)
+
+    def explain(
+        self,
+        text: str,
+        language: Optional[Language] = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> HighlightResult:
+        return self._call("explain", text, language=language, mode=mode)
+
+    def load_explainers(self) -> None:
+        # Every worker builds its own explainers.
+        for index in range(len(self.addresses)):
+            try:
+                self._call_worker(index, "load_explainers", (), {})
+            except ConnectionError as exc:
+                logger.warning("Could not preload explainers: %s", exc)
+
+    def close(self) -> None:
+        for index in self._idle:
+            self._discard_idle(index)
@@ -0,0 +1,111 @@
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ComponentStatus(str, Enum):
+    PENDING = "pending"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class ComponentState:
+    name: str
+    # Only required components decide whether the service is ready.
+    required: bool
+    status: ComponentStatus = ComponentStatus.PENDING
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class StartupTracker:
+    """
+    Tracks the background loading of the heavy application components.
+
+    Each component is loaded by its own task, so independent models load
+    concurrently and requests that only need finished components are served
+    right away. The per-component status and load times back the /ready endpoint.
+    """
+
+    def __init__(self) -> None:
+        self._components: Dict[str, ComponentState] = {}
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, required: bool = True) -> None:
+        with self._lock:
+            self._components[name] = ComponentState(name=name, required=required)
+
+    async def load(self, name: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs the loader of a registered component and records its outcome.
+        Failures are logged and reported instead of raised, so one broken
+        component does not stop the others. Returns None on failure.
+        """
+        self._set(name, status=ComponentStatus.LOADING)
+        started = time.perf_counter()
+        try:
+            result = await loader()
+        except Exception as exc:
+            logger.exception("Loading %s failed", name)
+            self._set(
+                name,
+                status=ComponentStatus.FAILED,
+                seconds=time.perf_counter() - started,
+                error=str(exc),
+            )
+            return None
+
+        seconds = time.perf_counter() - started
+        logger.info("Loaded %s in %.2f s", name, seconds)
+        self._set(name, status=ComponentStatus.READY, seconds=seconds)
+        return result
+
+    def _set(self, name: str, **changes: Any) -> None:
+        with self._lock:
+            component = self._components[name]
+            for field, value in changes.items():
+                setattr(component, field, value)
+            if self._finished is None and all(
+                c.status in (ComponentStatus.READY, ComponentStatus.FAILED)
+                for c in self._components.values()
+            ):
+                self._finished = time.perf_counter()
+                logger.info(
+                    "Startup finished in %.2f s", self._finished - self._started
+                )
+
+    def is_ready(self) -> bool:
+        return self.report()["ready"]
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self._finished or time.perf_counter()
+            components = {
+                c.name: {
+                    "status": c.status.value,
+                    "required": c.required,
+                    "seconds": round(c.seconds, 3) if c.seconds is not None else None,
+                    "error": c.error,
+                }
+                for c in self._components.values()
+            }
+            return {
+                "ready": all(
+                    c.status == ComponentStatus.READY
+                    for c in self._components.values()
+                    if c.required
+                ),
+                "startup_seconds": round(end - self._started, 3),
+                "finished": self._finished is not None,
+                "components": components,
+            }
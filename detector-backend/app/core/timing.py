@@ -0,0 +1,68 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+class RequestTimings:
+    """
+    Per-request breakdown of the time spent in each processing stage.
+
+    Stages are recorded via `timed` from anywhere in the call stack, including
+    inference threads, as long as the request context is propagated.
+    """
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+            self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: {"ms": round(seconds * 1000, 2), "calls": self.counts[stage]}
+            for stage, seconds in self.durations.items()
+        }
+
+    def server_timing_header(self) -> str:
+        """
+        Formats the stages for the Server-Timing HTTP header.
+        """
+        return ", ".join(
+            f'{stage};dur={seconds * 1000:.2f};desc="{self.counts[stage]}x"'
+            for stage, seconds in self.durations.items()
+        )
+
+
+def start_request_timings() -> RequestTimings:
+    timings = RequestTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current_timings.get()
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    Records the duration of the enclosed block for the current request.
+    Outside of a request this is a no-op apart from the clock calls.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(stage, time.perf_counter() - started)
@@ -26,6 +26,16 @@ class Database:
 
         return db["articles"]
 
+    def get_result_cache_collection(self) -> Collection:
+        db = self._get_client()[self.settings.MONGO_DB_NAME]
+
+        return db["result_cache"]
+
+    def get_extraction_cache_collection(self) -> Collection:
+        db = self._get_client()[self.settings.MONGO_DB_NAME]
+
+        return db["extraction_cache"]
+
     def close(self) -> None:
         if self._client:
             self._client.close()
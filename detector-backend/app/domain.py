@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -22,6 +22,28 @@ class TokenContribution:
     score_normalized: float
 
 
+@dataclass
+class ChunkPrediction:
+    index: int
+    token_count: int
+    label: str
+    score: float
+    fake_score: float
+
+
+@dataclass
+class ChunkedPredictionResult:
+    prediction: PredictionResult
+    chunks: List[ChunkPrediction]
+    total_tokens: int
+
+
+@dataclass
+class HighlightResult:
+    highlights: List[TokenContribution]
+    prediction: PredictionResult
+
+
 class Label(str, Enum):
     FAKE = "fake"
     REAL = "real"
@@ -41,6 +63,31 @@ class Language(str, Enum):
     EN = "en"
 
 
+class AggregationStrategy(str, Enum):
+    # Average fake probability over all chunks.
+    MEAN = "mean"
+    # The most suspicious chunk decides.
+    MAX_FAKE = "max_fake"
+    # Average weighted by the number of tokens per chunk.
+    LENGTH_WEIGHTED = "length_weighted"
+
+
+class HighlightMode(str, Enum):
+    # SHAP Partition explanation, accurate but slow on CPU.
+    EXACT = "exact"
+    # Gradient x input from a single forward and backward pass.
+    FAST = "fast"
+
+
+class InferenceBackend(str, Enum):
+    # Full precision PyTorch model, the reference for all other backends.
+    TORCH = "torch"
+    # PyTorch with dynamically int8-quantized linear layers (CPU only).
+    TORCH_INT8 = "torch-int8"
+    # Exported ONNX graph executed by onnxruntime, needs the "onnx" extra.
+    ONNX = "onnx"
+
+
 @dataclass
 class ScrapedArticle:
     url: str
@@ -1,17 +1,32 @@
+import asyncio
 from contextlib import asynccontextmanager
+from importlib import metadata
 import os
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
+from app.api.routes_analyze import router as analyze_router
 from app.api.routes_predict import router as predict_router
 from app.api.routes_highlight import router as highlight_router
 from app.api.routes_fact_check import router as fact_check_router
+from app.api.routes_metrics import router as metrics_router
+from app.core.batching import PredictionBatcher
+from app.core.cache import ExtractionCache, ResultCache
+from app.core.config import Settings
 from app.core.detector import FakeNewsDetector
+from app.core.inference_executor import InferenceExecutor
 from app.core.fact_check_agent import FactCheckAgent
 from app.core.logging_config import configure_logging
+from app.core.remote_detector import RemoteDetector, require_authkey
+from app.core.startup import StartupTracker
+from app.core.timing import start_request_timings
+from app.db import Database
 from app.domain import Language
 from app.services.article_extractor import ArticleExtractor
+from app.services.article_fetcher import AsyncArticleFetcher
+from app.services.language_service import LanguageDetectionService
 
 
 # Disabling parallelism prevents deadlocks on macOS/Linux when
@@ -20,32 +35,245 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 # Global storage for heavy model instances to avoid re-loading them on every request.
 model = {}
 logger = configure_logging()
+settings = Settings()
+
+
+# Components loaded once before app.serve forks its workers.
+preloaded: Dict[str, Any] = {}
+
+
+def build_language_detector() -> LanguageDetectionService:
+    # Language models are loaded on first use.
+    return LanguageDetectionService(
+        restrict_to=settings.LANGUAGE_DETECTION_CANDIDATES,
+        low_accuracy=settings.LANGUAGE_DETECTION_LOW_ACCURACY,
+    )
+
+
+def build_detector(
+    result_cache: ResultCache | None, language_detector: LanguageDetectionService
+) -> FakeNewsDetector:
+    return FakeNewsDetector(
+        result_cache=result_cache,
+        language_prefix_chars=settings.LANGUAGE_DETECTION_PREFIX_CHARS,
+        language_detector=language_detector,
+        backend=settings.INFERENCE_BACKEND,
+        onnx_base_dir=settings.ONNX_MODEL_DIR,
+    )
+
+
+def build_article_extractor(
+    cache: ExtractionCache | None = None,
+    prefetch_robots: bool = settings.EXTRACTION_ROBOTS_PREFETCH,
+) -> ArticleExtractor:
+    return ArticleExtractor(
+        {Language.DE.value, Language.EN.value},
+        max_workers=settings.EXTRACTION_MAX_WORKERS,
+        per_host_limit=settings.EXTRACTION_PER_HOST_LIMIT,
+        multi_url_timeout_seconds=settings.EXTRACTION_MULTI_URL_TIMEOUT_SECONDS,
+        cache=cache,
+        robots_refresh_seconds=settings.EXTRACTION_ROBOTS_REFRESH_SECONDS,
+        prefetch_robots=prefetch_robots,
+        publisher_index_dir=settings.PUBLISHER_INDEX_DIR,
+        fetcher=AsyncArticleFetcher(
+            connect_timeout_seconds=settings.EXTRACTION_CONNECT_TIMEOUT_SECONDS,
+            read_timeout_seconds=settings.EXTRACTION_READ_TIMEOUT_SECONDS,
+            max_response_bytes=settings.EXTRACTION_MAX_RESPONSE_BYTES,
+            max_connections_per_host=settings.EXTRACTION_PER_HOST_LIMIT,
+            http2=settings.EXTRACTION_HTTP2,
+        ),
+    )
+
+
+def preload_components() -> None:
+    """
+    Loads the models in the parent process of app.serve before the workers are
+    forked. The workers pick them up in the lifespan and share the weight pages
+    copy-on-write instead of each loading its own copy.
+    """
+    # Inference workers hold their own models, the API process then needs none.
+    if not settings.INFERENCE_WORKER_ADDRESSES:
+        language_detector = build_language_detector()
+        language_detector.warm_up()
+        detector = build_detector(None, language_detector)
+        if settings.STARTUP_PRELOAD_EXPLAINERS:
+            detector.load_explainers()
+        preloaded["language_detector"] = language_detector
+        preloaded["detector"] = detector
+
+    # Open HTTP connections must not be shared with the workers, so robots.txt
+    # files are fetched after the fork.
+    preloaded["article_extractor"] = build_article_extractor(prefetch_robots=False)
+
+
+def _publish(app: FastAPI, name: str, component: Any) -> None:
+    # Components become visible to requests as soon as they are loaded.
+    model[name] = component
+    setattr(app.state, name, component)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("Loading detector, article extractor and fact checker")
-    detector = FakeNewsDetector()
-    article_extractor = ArticleExtractor({Language.DE.value, Language.EN.value})
-    fact_checker = FactCheckAgent()
-    logger.info("Detector, article extractor and fact checker loaded")
+    database = None
+    if settings.RESULT_CACHE_MONGO_ENABLED or settings.EXTRACTION_CACHE_MONGO_ENABLED:
+        database = Database(settings)
+    result_cache = ResultCache(
+        max_size=settings.RESULT_CACHE_SIZE,
+        ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+        collection=(
+            database.get_result_cache_collection()
+            if settings.RESULT_CACHE_MONGO_ENABLED
+            else None
+        ),
+    )
+    extraction_cache = ExtractionCache(
+        max_size=settings.EXTRACTION_CACHE_SIZE,
+        ttl_seconds=settings.EXTRACTION_CACHE_TTL_SECONDS,
+        fresh_seconds=settings.EXTRACTION_CACHE_FRESH_SECONDS,
+        parser_version=metadata.version("fundus"),
+        collection=(
+            database.get_extraction_cache_collection()
+            if settings.EXTRACTION_CACHE_MONGO_ENABLED
+            else None
+        ),
+    )
+
+    # Separate pools keep slow highlight jobs from starving fast predictions.
+    inference_executors = {
+        "predict": InferenceExecutor(
+            "predict",
+            max_workers=settings.PREDICT_WORKERS,
+            max_queue=settings.PREDICT_QUEUE_SIZE,
+            retry_after_seconds=settings.INFERENCE_RETRY_AFTER_SECONDS,
+        ),
+        "highlight": InferenceExecutor(
+            "highlight",
+            max_workers=settings.HIGHLIGHT_WORKERS,
+            max_queue=settings.HIGHLIGHT_QUEUE_SIZE,
+            retry_after_seconds=settings.INFERENCE_RETRY_AFTER_SECONDS,
+        ),
+    }
+    _publish(app, "inference_executors", inference_executors)
+    _publish(app, "result_cache", result_cache)
+    _publish(app, "extraction_cache", extraction_cache)
 
-    model["detector"] = detector
-    model["article_extractor"] = article_extractor
-    model["fact_checker"] = fact_checker
+    # With inference workers the models live in separate processes.
+    remote_inference = bool(settings.INFERENCE_WORKER_ADDRESSES)
+    # Without a worker secret the API refuses to start instead of failing every request.
+    worker_authkey = (
+        require_authkey(settings.INFERENCE_WORKER_AUTHKEY) if remote_inference else b""
+    )
+    language_detector = preloaded.get("language_detector") or build_language_detector()
 
-    app.state.detector = detector
-    app.state.article_extractor = article_extractor
-    app.state.fact_checker = fact_checker
+    startup = StartupTracker()
+    _publish(app, "startup", startup)
+    startup.register("detector")
+    startup.register("article_extractor")
+    if not remote_inference:
+        startup.register("language_detector", required=False)
+    startup.register("fact_checker", required=False)
+    if settings.STARTUP_PRELOAD_EXPLAINERS:
+        startup.register("explainers", required=False)
+
+    async def load_detector() -> FakeNewsDetector | RemoteDetector:
+        if remote_inference:
+            detector = RemoteDetector(
+                settings.INFERENCE_WORKER_ADDRESSES,
+                authkey=worker_authkey,
+                timeout_seconds=settings.INFERENCE_WORKER_TIMEOUT_SECONDS,
+            )
+            await asyncio.to_thread(
+                detector.wait_until_available,
+                settings.INFERENCE_WORKER_STARTUP_TIMEOUT_SECONDS,
+            )
+        elif "detector" in preloaded:
+            detector = preloaded["detector"]
+            # The cache holds a Mongo client, which must be created after the fork.
+            detector.result_cache = result_cache
+        else:
+            detector = await asyncio.to_thread(
+                build_detector, result_cache, language_detector
+            )
+        if settings.PREDICT_BATCH_MAX_SIZE > 1:
+            _publish(
+                app,
+                "prediction_batcher",
+                PredictionBatcher(
+                    detector,
+                    max_batch_size=settings.PREDICT_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.PREDICT_BATCH_MAX_WAIT_MS,
+                    run_blocking=inference_executors["predict"].run,
+                ),
+            )
+        _publish(app, "detector", detector)
+        return detector
+
+    async def load_article_extractor() -> None:
+        article_extractor = preloaded.get("article_extractor")
+        if article_extractor is None:
+            article_extractor = await asyncio.to_thread(
+                build_article_extractor, extraction_cache
+            )
+        else:
+            article_extractor.cache = extraction_cache
+            if settings.EXTRACTION_ROBOTS_PREFETCH:
+                article_extractor.prefetch_robots()
+        _publish(app, "article_extractor", article_extractor)
+
+    async def load_fact_checker() -> None:
+        _publish(app, "fact_checker", await asyncio.to_thread(FactCheckAgent))
+
+    detector_task = asyncio.ensure_future(startup.load("detector", load_detector))
+
+    async def load_explainers() -> None:
+        # Predictions are served already while the SHAP explainers are built.
+        detector = await asyncio.shield(detector_task)
+        if detector is None:
+            raise RuntimeError("The detector could not be loaded.")
+        await asyncio.to_thread(detector.load_explainers)
+
+    # Independent components load concurrently, each in its own thread.
+    loaders = [
+        detector_task,
+        startup.load("article_extractor", load_article_extractor),
+        startup.load("fact_checker", load_fact_checker),
+    ]
+    if not remote_inference:
+        loaders.append(
+            startup.load(
+                "language_detector",
+                lambda: asyncio.to_thread(language_detector.warm_up),
+            )
+        )
+    if settings.STARTUP_PRELOAD_EXPLAINERS:
+        loaders.append(startup.load("explainers", load_explainers))
+    loading = asyncio.gather(*loaders)
+    if not settings.STARTUP_BACKGROUND_LOADING:
+        await loading
 
     try:
         yield {
-            "detector": detector,
-            "article_extractor": article_extractor,
-            "fact_checker": fact_checker,
+            "inference_executors": inference_executors,
+            "result_cache": result_cache,
+            "extraction_cache": extraction_cache,
+            "startup": startup,
         }
     finally:
         logger.info("Shutting down application state")
+        # Threads that are still loading finish on their own, their results are dropped.
+        loading.cancel()
+        prediction_batcher = model.get("prediction_batcher")
+        if prediction_batcher is not None:
+            await prediction_batcher.close()
+        for executor in inference_executors.values():
+            executor.shutdown()
+        article_extractor = model.get("article_extractor")
+        if article_extractor is not None:
+            await article_extractor.aclose()
+        if isinstance(model.get("detector"), RemoteDetector):
+            model["detector"].close()
+        if database is not None:
+            database.close()
         model.clear()
 
 
@@ -54,6 +282,24 @@ app = FastAPI(title="Fake News Backend", lifespan=lifespan)
 app.include_router(predict_router, prefix="/api")
 app.include_router(highlight_router, prefix="/api")
 app.include_router(fact_check_router, prefix="/api")
+app.include_router(analyze_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+
+
+@app.middleware("http")
+async def add_server_timing(request: Request, call_next):
+    # Stages recorded during the request are reported in the Server-Timing header.
+    timings = start_request_timings()
+    response = await call_next(request)
+    if timings.durations:
+        response.headers["Server-Timing"] = timings.server_timing_header()
+        logger.debug(
+            "Timings for %s %s: %s",
+            request.method,
+            request.url.path,
+            timings.as_dict(),
+        )
+    return response
 
 
 @app.middleware("http")
@@ -73,6 +319,19 @@ def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready(request: Request) -> JSONResponse:
+    """
+    Readiness of the loaded components with their load times.
+    Returns 503 until every required component is available.
+    """
+    startup: StartupTracker | None = getattr(request.app.state, "startup", None)
+    if startup is None:
+        return JSONResponse({"ready": False, "components": {}}, status_code=503)
+    report = startup.report()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,48 +1,120 @@
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional, Set
 
 import pandas as pd
 
-from app.services.language_service import LanguageDetectionService
+from app.core.config import Settings
+from app.services.language_service import LanguageCodeCache, LanguageDetectionService
+
+settings = Settings()
 
 
 class BaseDataPipeline(ABC):
     """
     Abstract base class defining the blueprint for dataset processing.
+
+    With a chunk_size the raw data is streamed in chunks of that many rows and
+    processed chunk by chunk, so only one chunk is held in memory at a time.
+    Pipelines whose source cannot be streamed ignore the chunk size and return
+    the whole frame as a single chunk.
     """
 
-    def __init__(self, dataset_name: str):
+    def __init__(self, dataset_name: str, chunk_size: int | None = None):
         self.dataset_name = dataset_name
+        self.chunk_size = chunk_size
         self.lang_service = LanguageDetectionService()
+        self._language_cache: Optional[LanguageCodeCache] = None
 
     @abstractmethod
-    def _load_data(self) -> pd.DataFrame:
-        pass
+    def _load_data(
+        self, chunksize: int | None = None
+    ) -> pd.DataFrame | Iterable[pd.DataFrame]:
+        """
+        Returns the raw data, or an iterator of raw chunks if chunksize is set.
+        """
 
     @abstractmethod
     def _run_processing(self, df: pd.DataFrame) -> pd.DataFrame:
         pass
 
-    def process_data(self) -> pd.DataFrame | None:
+    def _detect_languages(self, texts: pd.Series) -> pd.Series:
+        """
+        Detects the language codes of all texts in one parallel batch.
+
+        Only the first LANGUAGE_DETECTION_PREFIX_CHARS characters of every text
+        are analyzed, and results are cached per dataset across runs.
+        """
+        if self._language_cache is None:
+            self._language_cache = LanguageCodeCache(
+                settings.LANGUAGE_CACHE_DIR / f"{self.dataset_name}.json",
+                self.lang_service.fingerprint,
+            )
+        cached = len(self._language_cache)
+        started = time.perf_counter()
+        codes = self.lang_service.detect_codes(
+            texts,
+            max_chars=settings.LANGUAGE_DETECTION_PREFIX_CHARS,
+            cache=self._language_cache,
+        )
+        seconds = time.perf_counter() - started
+        self._language_cache.save()
+
+        detected = len(self._language_cache) - cached
+        print(
+            f"[{self.__class__.__name__}] Detected languages of {len(codes)} texts "
+            f"({detected} new, {len(codes) - detected} cached or duplicate) in {seconds:.2f} s "
+            f"({len(codes) / max(seconds, 1e-9):.0f} texts/s)"
+        )
+        return pd.Series(codes, index=texts.index, dtype=object)
+
+    @staticmethod
+    def _drop_seen_texts(df: pd.DataFrame, seen: Set[bytes]) -> pd.DataFrame:
+        """
+        Drops articles whose text already appeared in this or an earlier chunk.
+        Only a short digest per text is kept, not the texts themselves.
+        """
+        digests = df["text"].map(
+            lambda text: hashlib.blake2b(str(text).encode("utf-8"), digest_size=16).digest()
+        )
+        keep = ~digests.duplicated() & ~digests.isin(seen)
+        seen.update(digests[keep])
+        return df[keep]
+
+    def process_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Yields the processed data chunk by chunk, de-duplicated across chunks.
+        """
         print(
             f"[{self.__class__.__name__}] Starting processing for {self.dataset_name} dataset."
         )
 
         try:
-            df = self._load_data()
+            data = self._load_data(chunksize=self.chunk_size)
+            chunks = [data] if isinstance(data, pd.DataFrame) else iter(data)
+            seen: Set[bytes] = set()
+            rows = 0
+            for chunk in chunks:
+                # Execute the specific transformations defined in the subclass
+                processed_df = self._drop_seen_texts(self._run_processing(chunk), seen)
+                processed_df = processed_df.assign(dataset=self.dataset_name)
+                rows += len(processed_df)
+                yield processed_df
         except FileNotFoundError:
             # prevents the entire training batch from crashing if one file is missing.
             print(
                 f"[{self.__class__.__name__}] Could not find the file for {self.dataset_name}."
             )
-            return None
-
-        # Execute the specific transformations defined in the subclass
-        processed_df = self._run_processing(df)
-
-        processed_df["dataset"] = self.dataset_name
+            return
 
         print(
-            f"[{self.__class__.__name__}] Finished processing for {self.dataset_name} dataset."
+            f"[{self.__class__.__name__}] Finished processing for {self.dataset_name} dataset ({rows} rows)."
         )
 
-        return processed_df
+    def process_data(self) -> pd.DataFrame | None:
+        chunks = list(self.process_chunks())
+        if not chunks:
+            return None
+
+        return pd.concat(chunks) if len(chunks) > 1 else chunks[0]
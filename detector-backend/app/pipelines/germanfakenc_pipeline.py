@@ -2,13 +2,14 @@ import pandas as pd
 
 from app.core.config import Settings
 from app.pipelines.base_pipeline import BaseDataPipeline
+from app.pipelines.text_normalization import normalize_whitespace
 from app.domain import Language
 
 settings = Settings()
 
 
 class GermanFakeNCPipeline(BaseDataPipeline):
-    def _load_data(self) -> pd.DataFrame:
+    def _load_data(self, chunksize: int | None = None):
         csv_path = (
                 settings.BASE_DIR.parent
                 / "rawdata"
@@ -16,17 +17,11 @@ class GermanFakeNCPipeline(BaseDataPipeline):
                 / "scraped"
                 / "germanfakenc_training_articles.csv"
         )
-        return pd.read_csv(csv_path)
+        return pd.read_csv(csv_path, chunksize=chunksize)
 
     def _run_processing(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
 
-        df["text"] = (
-            df["text"]
-            .astype(str)
-            .str.strip()
-            .str.replace(r"\s+", " ", regex=True)
-        )
+        df["text"] = normalize_whitespace(df["text"])
 
         df["title"] = df["title"].astype(str)
         df.loc[df["title"].str.strip() == "", "title"] = pd.NA
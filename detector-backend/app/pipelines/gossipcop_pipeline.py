@@ -3,6 +3,7 @@ import pandas as pd
 
 from app.core.config import Settings
 from app.pipelines.base_pipeline import BaseDataPipeline
+from app.pipelines.text_normalization import normalize_whitespace
 
 settings = Settings()
 
@@ -13,7 +14,7 @@ LABEL_MAP = {
 }
 
 class GossipCopPipeline(BaseDataPipeline):
-    def _load_data(self) -> pd.DataFrame:
+    def _load_data(self, chunksize: int | None = None) -> pd.DataFrame:
         json_path = (
             settings.BASE_DIR.parent
             / "rawdata"
@@ -53,12 +54,7 @@ class GossipCopPipeline(BaseDataPipeline):
         df = df.copy()
 
         # Clean text and title
-        df["text"] = (
-            df["text"]
-            .astype(str)
-            .str.strip()
-            .str.replace(r"\s+", " ", regex=True)
-        )
+        df["text"] = normalize_whitespace(df["text"])
         df["title"] = df["title"].astype(str).str.strip()
         df.loc[df["title"] == "", "title"] = pd.NA
 
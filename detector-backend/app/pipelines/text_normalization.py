@@ -0,0 +1,134 @@
+"""
+Shared text normalization of the data pipelines.
+
+All patterns are compiled once at import. A column is cleaned in a single pass
+over its values, every value goes through all steps at once instead of one
+pandas pass per step, quote character or brand. Steps whose trigger (a URL
+scheme, "<", a brand name) does not occur in a value are skipped for it.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Sequence, Tuple
+
+import pandas as pd
+
+# Typographic quotes, apostrophes, dashes and the ellipsis in their ASCII form.
+# Applied with chained str.replace, which is much faster than str.translate on
+# non-ASCII text in CPython (see benchmarks.text_normalization).
+QUOTES_AND_DASHES = {
+    "„": '"', "“": '"',
+    "‚": "'", "‘": "'", "’": "'",
+    "´": "'", "`": "'",
+    "–": "-", "—": "-",
+    "…": "...",
+}
+
+# Stripped from both ends of cleaned texts and titles.
+BOUNDARY_CHARS = " \"'„“‚‘’«»›‹|[](){}-–—"
+
+# Title values that mean "no title".
+PLACEHOLDER_TITLES = frozenset({"nan", "NaN", "None", "none", "null", "Null", "-", "--"})
+
+_URL = re.compile(r"http\S+|www\.\S+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_TITLE_PIPE = re.compile(r"\s*\|\s*")
+_TITLE_DASH = re.compile(r"\s*[-–—:]\s*")
+_REPEATED_MARKS = re.compile(r"[!?]{3,}")
+
+
+@lru_cache(maxsize=None)
+def _branding_patterns(brands: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """
+    Compiles the patterns finding any of the brands and removing them as title
+    prefix, suffix or "|" segment, each one alternation over all brands.
+    """
+    any_brand = "|".join(re.escape(brand) for brand in brands)
+    return (
+        re.compile(any_brand, re.IGNORECASE),
+        re.compile(rf"^\s*(?:{any_brand})\s*[-–—:|]\s*", re.IGNORECASE),
+        re.compile(rf"[-–—:|]\s*(?:{any_brand})\s*$", re.IGNORECASE),
+        re.compile(rf"\|\s*(?:{any_brand})\s*(?=\||$)", re.IGNORECASE),
+    )
+
+
+def _collapse_whitespace(text: str) -> str:
+    # Splits at the same Unicode whitespace as `\s` and drops the ends.
+    return " ".join(text.split())
+
+
+def _clean_markup(text: str) -> str:
+    if "http" in text or "www." in text:
+        text = _URL.sub(" ", text)
+    if "<" in text:
+        text = _HTML_TAG.sub(" ", text)
+    for old, new in QUOTES_AND_DASHES.items():
+        text = text.replace(old, new)
+    return _collapse_whitespace(text)
+
+
+def clean_text(text: str) -> str:
+    """
+    Removes URLs and HTML tags, normalizes quotes, dashes and whitespace and
+    strips quotes, brackets and separators from the ends.
+    """
+    return _clean_markup(text).strip(BOUNDARY_CHARS)
+
+
+def _clean_title(title: Any, branding: Tuple[re.Pattern, ...] | None) -> str:
+    if not isinstance(title, str):
+        if pd.isna(title):
+            return ""
+        title = str(title)
+    if title in PLACEHOLDER_TITLES:
+        return ""
+
+    title = _clean_markup(title)
+    if branding:
+        any_brand, prefix, suffix, segment = branding
+        # Most titles mention no brand, the removal patterns are skipped then.
+        if any_brand.search(title):
+            title = segment.sub("", suffix.sub("", prefix.sub("", title)))
+        title = _TITLE_DASH.sub(" - ", _TITLE_PIPE.sub(" | ", title))
+        title = _collapse_whitespace(title)
+    title = _REPEATED_MARKS.sub("!!", title.strip(BOUNDARY_CHARS))
+    return title if len(title) >= 3 else ""
+
+
+def clean_title(title: Any, brands: Tuple[str, ...] = ()) -> str:
+    """
+    Cleans a title like `clean_text`, additionally removes the given brand
+    names, shortens runs of "!" and "?" and empties placeholders and titles
+    shorter than three characters.
+    """
+    return _clean_title(title, _branding_patterns(tuple(brands)) if brands else None)
+
+
+def _column(s: pd.Series, values: Iterable[Any]) -> pd.Series:
+    return pd.Series(list(values), index=s.index, name=s.name)
+
+
+def normalize_whitespace(s: pd.Series) -> pd.Series:
+    """
+    Converts the column to str and collapses all whitespace runs to a single
+    space without leading or trailing whitespace. Missing values stay missing.
+    """
+    s = s.astype(str)
+    return _column(
+        s, (_collapse_whitespace(v) if isinstance(v, str) else v for v in s.tolist())
+    )
+
+
+def clean_text_column(s: pd.Series) -> pd.Series:
+    """
+    Applies `clean_text` to every value, missing values become "".
+    """
+    return _column(s, (clean_text(value) for value in s.fillna("").tolist()))
+
+
+def clean_title_column(s: pd.Series, brands: Sequence[str] = ()) -> pd.Series:
+    """
+    Applies `clean_title` with the given brand names to every value.
+    """
+    branding = _branding_patterns(tuple(brands)) if brands else None
+    return _column(s, (_clean_title(value, branding) for value in s.tolist()))
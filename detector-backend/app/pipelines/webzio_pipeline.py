@@ -6,12 +6,13 @@ import pandas as pd
 from app.core.config import Settings
 from app.domain import Label
 from app.pipelines.base_pipeline import BaseDataPipeline
+from app.pipelines.text_normalization import normalize_whitespace
 
 settings = Settings()
 
 
 class WebzioPipeline(BaseDataPipeline):
-    def _load_data(self) -> pd.DataFrame:
+    def _load_data(self, chunksize: int | None = None) -> pd.DataFrame:
         domains = []
         titles = []
         texts = []
@@ -48,19 +49,14 @@ class WebzioPipeline(BaseDataPipeline):
         df = df.copy()
 
         df["label"] = Label.FAKE.value
-        df["text"] = (
-            df["text"]
-            .astype(str)
-            .str.strip()
-            .str.replace(r"\s+", " ", regex=True)
-        )
+        df["text"] = normalize_whitespace(df["text"])
         df["publish_date"] = pd.to_datetime(
             df["publish_date"], errors="coerce", utc=True
         )
         df["title"] = df["title"].astype(str)
         df.loc[df["title"].str.strip() == "", "title"] = pd.NA
         df = df.dropna(subset=["text", "label"]).drop_duplicates(subset=["text"])
-        df["language"] = df["text"].apply(self.lang_service.detect_code)
+        df["language"] = self._detect_languages(df["text"])
 
         df = df[df["language"] == "en"]
 
@@ -22,7 +22,7 @@ class WelfakePipeline(BaseDataPipeline):
         re.VERBOSE,
     )
 
-    def _load_data(self) -> pd.DataFrame:
+    def _load_data(self, chunksize: int | None = None):
         csv_path = (
                 settings.BASE_DIR.parent
                 / "rawdata"
@@ -30,10 +30,9 @@ class WelfakePipeline(BaseDataPipeline):
                 / "WELFake_Dataset.csv"
         )
 
-        return pd.read_csv(csv_path, index_col=0)
+        return pd.read_csv(csv_path, index_col=0, chunksize=chunksize)
 
     def _run_processing(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
         df["text"] = (
             df["text"]
             .astype(str)
@@ -50,6 +49,6 @@ class WelfakePipeline(BaseDataPipeline):
             0: Label.REAL.value,
             1: Label.FAKE.value,
         })
-        df["language"] = df["text"].apply(self.lang_service.detect_code)
+        df["language"] = self._detect_languages(df["text"])
         df = df[df["language"] == "en"]
         return df
@@ -1,9 +1,9 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
 from fastapi import Query
 from pydantic import BaseModel, Field
 
-from app.domain import PredictionResult, TokenContribution
+from app.domain import ChunkPrediction, Label, Language, PredictionResult, TokenContribution
 
 
 class TextRequest(BaseModel):
@@ -21,10 +21,54 @@ class PredictionResponse(BaseModel):
     prediction_result: PredictionResult
     confidence_fake: float
     confidence_real: float
+    # Only set for chunked classification of long articles.
+    chunks: Optional[List[ChunkPrediction]] = None
+
+    @classmethod
+    def from_prediction(cls, result: PredictionResult, **kwargs):
+        """
+        Derives the confidence of both classes from the winning label's score.
+        """
+        fake_score = (
+            result.score if result.label == Label.FAKE else round(1 - result.score, 4)
+        )
+        real_score = result.score if result.label == Label.REAL else 1 - result.score
+
+        return cls(
+            prediction_result=result,
+            confidence_fake=fake_score,
+            confidence_real=real_score,
+            **kwargs,
+        )
+
+
+# /predict/batch
+class BatchPredictionRequest(BaseModel):
+    texts: List[str] = Field(
+        min_length=1,
+        description="One item per article: plain text or a single article URL.",
+    )
+
+
+class BatchPredictionItem(BaseModel):
+    index: int = Field(description="Position of the item in the request.")
+    status: str = Field(description="'ok' or 'error'.")
+    language: Optional[Language] = None
+    result: Optional[PredictionResponse] = None
+    # Only set for failed items; other items of the batch are unaffected.
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchPredictionResponse(BaseModel):
+    results: List[BatchPredictionItem]
+    succeeded: int
+    failed: int
 
 
 # /highlight
-class HighlightResponse(BaseModel):
+class HighlightResponse(PredictionResponse):
+    # The prediction comes from the same model run as the highlights.
     highlights: List[TokenContribution]
 
 
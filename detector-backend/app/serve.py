@@ -0,0 +1,129 @@
+"""
+Pre-fork server: loads the models once, then forks the uvicorn workers.
+
+`uvicorn --workers N` spawns fresh interpreters that each load both classifiers,
+both explainers and the language models. Here the parent loads them once and
+the forked workers share the weight pages copy-on-write, so every additional
+worker only costs its own Python heap.
+
+Usage:
+    uv run python -m app.serve --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+from typing import Dict
+
+import torch
+import uvicorn
+
+from app.core.logging_config import configure_logging
+
+logger = configure_logging()
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    # All workers accept connections on the same listening socket.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, torch_threads: int, log_level: str) -> None:
+    from app.main import app
+
+    # Workers share the cores, so each one only gets its part of the intra-op threads.
+    torch.set_num_threads(torch_threads)
+    # The parent's signal handlers are not meant for the workers.
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _fork_worker(sock: socket.socket, torch_threads: int, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            _run_worker(sock, torch_threads, log_level)
+        except BaseException:
+            logger.exception("Worker %s crashed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    logger.info("Started worker %s", pid)
+    return pid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-fork server for the backend.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--torch-threads",
+        type=int,
+        default=None,
+        help="Intra-op threads per worker, defaults to cores divided by workers.",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        sys.exit("The pre-fork server needs os.fork, use uvicorn --workers instead.")
+
+    from app.main import preload_components
+
+    logger.info("Preloading models before forking %s workers", args.workers)
+    preload_components()
+    # Objects that exist now are never collected, so the collector does not
+    # touch their pages in the workers and break the sharing.
+    gc.freeze()
+
+    torch_threads = args.torch_threads or max(1, (os.cpu_count() or 1) // args.workers)
+    sock = _bind(args.host, args.port)
+    workers: Dict[int, int] = {}
+    for index in range(args.workers):
+        workers[_fork_worker(sock, torch_threads, args.log_level)] = index
+
+    stopping = False
+
+    def stop(signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        index = workers.pop(pid, None)
+        if index is None:
+            continue
+        if not stopping:
+            # A crashed worker is replaced by a fresh fork of the preloaded parent.
+            logger.warning(
+                "Worker %s exited with %s, restarting", pid, os.waitstatus_to_exitcode(status)
+            )
+            workers[_fork_worker(sock, torch_threads, args.log_level)] = index
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,82 +18,241 @@ ZIEL:
 
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from queue import Empty, SimpleQueue
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
 from urllib.parse import urlparse
 
-import tldextract
 import validators
 
-from fundus.publishers import PublisherCollection, Publisher, PublisherGroup
+from fundus.parser.base_parser import BaseParser
+from fundus.publishers import Publisher
+from fundus.publishers.base_objects import Robots
 from fundus.scraping.article import Article
 from fundus.scraping.html import HTML, SourceInfo
 from fundus.scraping.session import session_handler
 
+from app.core.cache import ExtractionCache
+from app.core.logging_config import get_logger
+from app.services.article_fetcher import (
+    AsyncArticleFetcher,
+    FetchError,
+    FetchedPage,
+    read_limited_text,
+)
+from app.services.publisher_index import load_domain_index, resolve_publishers, root_domain
+
+logger = get_logger(__name__)
+
+
+class ParserRegistry:
+    """
+    Einsatzbereite Parser und gecachte robots.txt-Regeln je Publisher.
+
+    Fundus liefert über `publisher.parser()` für jeden Publisher dieselbe
+    Parser-Instanz, deren `parse` internen Zustand setzt. Bei parallelen
+    Extraktionen desselben Publishers würden sich die Aufrufe gegenseitig
+    überschreiben. Die Registry hält deshalb je Publisher einen Pool fertiger
+    Parser-Instanzen; jeder Aufruf leiht sich exklusiv eine davon. Die erste
+    Instanz eines Publishers entsteht erst beim ersten Ausleihen, damit der
+    Start nicht für jeden unterstützten Publisher einen Parser erzeugt.
+
+    Die robots.txt wird je Publisher einmal geladen und nach
+    `robots_refresh_seconds` im Hintergrund erneuert, während Anfragen
+    weiterhin die bisherigen Regeln verwenden.
+    """
+
+    def __init__(
+        self, publishers: Iterable[Publisher], robots_refresh_seconds: float = 6 * 3600
+    ) -> None:
+        self._robots_refresh_seconds = robots_refresh_seconds
+        # Mehrere Domains können auf denselben Publisher verweisen
+        self._publishers = {publisher.name: publisher for publisher in publishers}
+        # Leere Pools je Publisher; Parser-Instanzen entstehen beim ersten Ausleihen
+        self._parsers: Dict[str, SimpleQueue[BaseParser]] = {
+            name: SimpleQueue() for name in self._publishers
+        }
+        self._robots: Dict[str, Tuple[float, Robots]] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
 
-class ArticleExtractor:
-    def __init__(self, supported_languages: set) -> None:
+    @contextmanager
+    def parser(self, publisher: Publisher) -> Iterator[BaseParser]:
         """
-        Initialisiert den ArticleExtractor.
+        Leiht eine Parser-Instanz exklusiv für die Dauer des with-Blocks aus.
+        Ist der Pool leer (erstes Ausleihen oder alle Instanzen belegt), wird
+        eine weitere erzeugt und danach ebenfalls im Pool behalten.
+        """
+        with self._lock:
+            pool = self._parsers.setdefault(publisher.name, SimpleQueue())
+        try:
+            parser = pool.get_nowait()
+        except Empty:
+            parser = publisher.parser.latest_version()
+        try:
+            yield parser
+        finally:
+            pool.put(parser)
 
-        Beim Erzeugen der Instanz wird einmalig eine Lookup-Struktur aufgebaut,
-        welche registrierbare Domains (z. B. 'spiegel.de') den entsprechenden
-        FUNDUS-Publishern zuordnet. Zudem werden nur Publisher berücksichtigt,
-        die auch Artikel in unterstützten Sprachen des Detectors veröffentlichen.
+    def can_fetch(self, publisher: Publisher, url: str) -> bool:
         """
-        self._supported_languages = supported_languages
-        self._publisher_map: Dict[str, Publisher] = {}
-        self._build_publisher_map()
+        Prüft die robots.txt-Regeln des Publishers für eine URL.
 
-    def _build_publisher_map(self) -> None:
+        Nur wenn die Regeln eines Publishers noch nie geladen wurden, wartet
+        der Aufruf auf den Abruf. Veraltete Regeln werden weiter genutzt und
+        parallel im Hintergrund erneuert.
         """
-        Erstellt eine Mapping-Struktur von Domains zu FUNDUS-Publishern.
+        if not publisher.robots:
+            return True
+
+        with self._lock:
+            entry = self._robots.get(publisher.name)
 
-        FUNDUS organisiert Publisher teilweise in PublisherGroups. Diese Funktion
-        normalisiert die Struktur, indem alle Publisher – unabhängig von ihrer
-        Gruppierung – iteriert werden.
+        if entry is None:
+            robots = self._load_robots(publisher)
+        else:
+            loaded_at, robots = entry
+            if time.monotonic() - loaded_at > self._robots_refresh_seconds:
+                self._refresh_robots_in_background(publisher)
 
-        Für jede Publisher-Domain wird die registrierbare Root-Domain
-        (z. B. 'spiegel.de') extrahiert und als Schlüssel im Dictionary verwendet.
-        Dadurch können unterschiedliche Subdomains (z. B. 'www.', 'm.', 'amp.')
-        zuverlässig dem gleichen Publisher zugeordnet werden.
+        user_agent = publisher.request_header.get("user-agent") or "*"
+        return robots.can_fetch(user_agent, url)
+
+    def _load_robots(self, publisher: Publisher) -> Robots:
+        # Eigenes Robots-Objekt, damit die globalen Fundus-Publisher unverändert bleiben
+        robots = Robots(publisher.robots.url, headers=publisher.request_header)
+        try:
+            robots.ensure_ready()
+        except Exception as exc:
+            # Wie Fundus: nicht ladbare robots.txt wird ignoriert
+            logger.warning("robots.txt von %s nicht ladbar: %s", publisher.name, exc)
+            robots.robots_file_parser.allow_all = True
+            robots.ready = True
+
+        with self._lock:
+            self._robots[publisher.name] = (time.monotonic(), robots)
+        return robots
+
+    def _refresh_robots_in_background(self, publisher: Publisher) -> None:
+        with self._lock:
+            if publisher.name in self._refreshing:
+                return
+            self._refreshing.add(publisher.name)
+
+        def refresh() -> None:
+            try:
+                self._load_robots(publisher)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(publisher.name)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def prefetch_robots(self, max_workers: int = 8) -> None:
+        """
+        Lädt die robots.txt aller Publisher im Hintergrund vorab, damit
+        Anfragen nicht auf den ersten Abruf warten müssen.
         """
 
-        for entry in PublisherCollection:
-            # PublisherCollection kann einzelne Publisher oder PublisherGroups enthalten
+        def prefetch() -> None:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="robots-prefetch"
+            ) as pool:
+                pool.map(
+                    self._load_robots,
+                    [p for p in self._publishers.values() if p.robots],
+                )
 
-            if isinstance(entry, PublisherGroup):
-                publishers = entry.publishers
-            else:
-                publishers = [entry]
+        threading.Thread(target=prefetch, daemon=True).start()
 
-            for publisher in publishers:
-                if publisher.languages.isdisjoint(self._supported_languages):
-                    continue
 
-                domains = publisher.domain
+@dataclass
+class _PendingExtraction:
+    """
+    Zwischenstand einer Extraktion vor dem Abruf des Artikel-HTML.
+    """
 
-                # Fundus erlaubt Domains sowohl als String als auch als Liste
-                if isinstance(domains, str):
-                    domains = [domains]
+    url: str
+    publisher: Publisher
+    cached: Optional[Dict[str, Any]]
+    headers: Dict[str, str]
 
-                for domain in domains:
-                    if not domain:
-                        continue
 
-                    extracted = tldextract.extract(domain)
+class ArticleExtractor:
+    def __init__(
+        self,
+        supported_languages: set,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        multi_url_timeout_seconds: float = 30.0,
+        cache: Optional[ExtractionCache] = None,
+        robots_refresh_seconds: float = 6 * 3600,
+        prefetch_robots: bool = False,
+        publisher_index_dir: Optional[Path] = None,
+        fetcher: Optional[AsyncArticleFetcher] = None,
+    ) -> None:
+        """
+        Initialisiert den ArticleExtractor.
 
-                    # Ungültige oder unvollständige Domains überspringen
-                    if not extracted.domain or not extracted.suffix:
-                        continue
+        Beim Erzeugen der Instanz wird einmalig eine Lookup-Struktur geladen,
+        welche registrierbare Domains (z. B. 'spiegel.de') den entsprechenden
+        FUNDUS-Publishern zuordnet. Zudem werden nur Publisher berücksichtigt,
+        die auch Artikel in unterstützten Sprachen des Detectors veröffentlichen.
+        Mit publisher_index_dir wird der Index je Fundus-Version gespeichert
+        und bei späteren Starts nur noch eingelesen.
 
-                    # Zusammensetzen der Root-Domain (z. B. 'spiegel.de')
-                    root_domain = f"{extracted.domain}.{extracted.suffix}"
+        Mehrere URLs werden parallel in einem begrenzten Thread-Pool extrahiert:
+        - max_workers: maximale Anzahl gleichzeitiger Extraktionen insgesamt
+        - per_host_limit: maximale Anzahl gleichzeitiger Abrufe pro Host,
+          damit einzelne Publisher nicht mit Anfragen überflutet werden
+        - multi_url_timeout_seconds: Gesamtfrist für alle URLs einer Eingabe
 
-                    # Speicherung im Lookup-Dictionary
-                    self._publisher_map[root_domain] = publisher
+        Mit einem ExtractionCache werden bereits extrahierte Artikel anhand
+        ihrer kanonischen URL wiederverwendet, statt sie erneut zu laden.
 
+        Parser und robots.txt-Regeln der Publisher verwaltet eine ParserRegistry;
+        mit prefetch_robots werden alle robots.txt im Hintergrund vorab geladen.
+
+        `process_async` lädt Artikel über den AsyncArticleFetcher (gepoolte
+        Verbindungen je Host, Zeit- und Größenlimits); `process` nutzt
+        weiterhin die synchrone Fundus-Session.
+        """
+        self._supported_languages = supported_languages
+        self._publisher_map: Dict[str, Publisher] = resolve_publishers(
+            load_domain_index(publisher_index_dir), supported_languages
+        )
+        self._parsers = ParserRegistry(
+            self._publisher_map.values(), robots_refresh_seconds=robots_refresh_seconds
+        )
+
+        self._per_host_limit = max(1, per_host_limit)
+        self._multi_url_timeout_seconds = multi_url_timeout_seconds
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="article-extraction"
+        )
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
+        self.cache = cache
+        self.fetcher = fetcher or AsyncArticleFetcher(
+            max_connections_per_host=self._per_host_limit
+        )
+
+        if prefetch_robots:
+            self.prefetch_robots()
+
+    def prefetch_robots(self) -> None:
+        """
+        Lädt die robots.txt aller unterstützten Publisher im Hintergrund vorab.
+        """
+        self._parsers.prefetch_robots()
 
     def _is_pure_url(self, text: str) -> bool:
         """
@@ -134,11 +293,7 @@ class ArticleExtractor:
             return False
 
         # TLD prüfen
-        extracted = tldextract.extract(parsed.netloc)
-        if not extracted.domain or not extracted.suffix:
-            return False
-
-        return True
+        return root_domain(parsed.hostname or "") is not None
 
     def _find_publisher_for_url(self, hostname: str) -> Optional[Publisher]:
         """
@@ -162,16 +317,14 @@ class ArticleExtractor:
             return None
 
         # Normalisierung der Host-Domain auf registrierbare Root-Domain
-        extracted = tldextract.extract(hostname)
+        root = root_domain(hostname)
 
         # Falls Domain oder Suffix fehlen, kann keine gültige Root-Domain gebildet werden
-        if not extracted.domain or not extracted.suffix:
+        if root is None:
             return None
 
-        root_domain = f"{extracted.domain}.{extracted.suffix}"
-
         # Direkter Lookup im Dictionary (O(1))
-        return self._publisher_map.get(root_domain)
+        return self._publisher_map.get(root)
 
 
     def _extract_article_with_fundus(self, url: str) -> Dict[str, Any]:
@@ -187,9 +340,13 @@ class ArticleExtractor:
         1. URL parsen → Publisher-Domain bestimmen
         2. Publisher in FUNDUS identifizieren
         3. robots.txt prüfen
-        4. Artikel-HTML direkt abrufen
-        5. Passenden Parser anwenden
-        6. Extrahierten Artikel zurückgeben
+        4. Cache prüfen (frische Einträge direkt zurückgeben)
+        5. Artikel-HTML direkt abrufen, bei Cache-Eintrag als bedingte Anfrage
+        6. Passenden Parser anwenden
+        7. Extrahierten Artikel zurückgeben und im Cache ablegen
+
+        Der Abruf läuft hier synchron über die Fundus-Session;
+        `_extract_article_async` ist das Gegenstück für die Event-Loop.
 
         :param url: Vollständige URL eines Nachrichtenartikels.
         :return: Dict[str, Any]:
@@ -202,6 +359,57 @@ class ArticleExtractor:
                     "error": str | None
                 }
         """
+        pending = self._prepare_extraction(url)
+        if isinstance(pending, dict):
+            return pending
+
+        # ---------------------------------------------------------
+        # 4. HTML direkt laden (kein Crawling durch RSS/Sitemaps)
+        # ---------------------------------------------------------
+        session = session_handler.get_session()
+        try:
+            # Gestreamt, damit zu große oder Nicht-HTML-Antworten früh abbrechen
+            response = session.get_with_interrupt(url, headers=pending.headers, stream=True)
+            if response.status_code == 304:
+                response.close()
+                text = ""
+            else:
+                text = read_limited_text(response, self.fetcher.max_response_bytes)
+        except Exception as exc:
+            return self._load_error(pending.publisher, exc)
+
+        page = FetchedPage(
+            url=str(response.url),
+            status_code=response.status_code,
+            headers=response.headers,
+            text=text,
+        )
+        return self._complete_extraction(pending, page)
+
+    async def _extract_article_async(self, url: str) -> Dict[str, Any]:
+        """
+        Wie `_extract_article_with_fundus`, der Abruf läuft aber über den
+        AsyncArticleFetcher. Während auf den Publisher gewartet wird, ist kein
+        Thread belegt; nur Cache-Zugriff und Parsen laufen kurz im Thread-Pool.
+        """
+        pending = await asyncio.to_thread(self._prepare_extraction, url)
+        if isinstance(pending, dict):
+            return pending
+
+        try:
+            page = await self.fetcher.fetch(url, pending.headers)
+        except FetchError as exc:
+            return self._load_error(pending.publisher, exc)
+
+        return await asyncio.to_thread(self._complete_extraction, pending, page)
+
+    def _prepare_extraction(self, url: str) -> Union[Dict[str, Any], _PendingExtraction]:
+        """
+        Schritte vor dem Abruf: Publisher bestimmen, robots.txt und Cache prüfen.
+
+        Liefert entweder bereits das Ergebnis (Fehler oder frischer Cache-Eintrag)
+        oder die Angaben für den Abruf.
+        """
         # ---------------------------------------------------------
         # 1. Publisher aus URL bestimmen
         # ---------------------------------------------------------
@@ -224,10 +432,10 @@ class ArticleExtractor:
             }
 
         # ---------------------------------------------------------
-        # 2. robots.txt prüfen (Fundus nutzt ebenfalls robots-Regeln)
+        # 2. robots.txt prüfen (Fundus nutzt ebenfalls robots-Regeln),
+        #    die Regeln sind je Publisher in der ParserRegistry gecacht
         # ---------------------------------------------------------
-        user_agent = publisher.request_header.get("user-agent") or "*"
-        if publisher.robots and not publisher.robots.can_fetch(user_agent, url):
+        if not self._parsers.can_fetch(publisher, url):
             return {
                 "success": False,
                 "input_type": "url",
@@ -238,35 +446,67 @@ class ArticleExtractor:
             }
 
         # ---------------------------------------------------------
-        # 3. HTML direkt laden (kein Crawling durch RSS/Sitemaps)
+        # 3. Cache prüfen: Frische Einträge werden ohne Anfrage genutzt,
+        #    ältere per ETag/Last-Modified beim Publisher revalidiert
         # ---------------------------------------------------------
-        session = session_handler.get_session()
-        try:
-            response = session.get_with_interrupt(url, headers=publisher.request_header)
-        except Exception as exc:
-            return {
-                "success": False,
-                "input_type": "url",
-                "publisher": publisher.name,
-                "title": None,
-                "text": None,
-                "error": f"Artikel konnte nicht geladen werden: {exc}",
-            }
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None and self.cache.is_fresh(cached):
+            return dict(cached["result"])
+
+        headers = dict(publisher.request_header)
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        return _PendingExtraction(url, publisher, cached, headers)
+
+    @staticmethod
+    def _load_error(publisher: Publisher, exc: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "input_type": "url",
+            "publisher": publisher.name,
+            "title": None,
+            "text": None,
+            "error": f"Artikel konnte nicht geladen werden: {exc}",
+        }
+
+    def _complete_extraction(
+        self, pending: _PendingExtraction, page: FetchedPage
+    ) -> Dict[str, Any]:
+        """
+        Schritte nach dem Abruf: Revalidierung auswerten, parsen, cachen.
+        """
+        url, publisher, cached = pending.url, pending.publisher, pending.cached
+
+        etag = page.headers.get("ETag")
+        last_modified = page.headers.get("Last-Modified")
+        if cached is not None and page.status_code == 304:
+            # Artikel unverändert → bisheriges Ergebnis weiterverwenden
+            self.cache.set(
+                [url, page.url],
+                cached["result"],
+                etag=etag or cached["etag"],
+                last_modified=last_modified or cached["last_modified"],
+            )
+            return dict(cached["result"])
 
         html = HTML(
             requested_url=url,
-            responded_url=str(response.url),
-            content=response.text,
+            responded_url=page.url,
+            content=page.text,
             crawl_date=datetime.now(timezone.utc),
             source_info=SourceInfo(publisher.name),
         )
 
         # ---------------------------------------------------------
-        # 4. Parser auf Basis der neuesten Version anwenden
+        # 5. Parser auf Basis der neuesten Version anwenden
         # ---------------------------------------------------------
         try:
-            parser = publisher.parser()
-            extraction = parser.parse(html.content, error_handling="raise")
+            with self._parsers.parser(publisher) as parser:
+                extraction = parser.parse(html.content, error_handling="raise")
         except Exception as exc:
             return {
                 "success": False,
@@ -288,7 +528,7 @@ class ArticleExtractor:
                 "error": "Artikel konnte nicht extrahiert werden.",
             }
 
-        return {
+        result = {
             "success": True,
             "input_type": "url",
             "publisher": publisher.name,
@@ -297,6 +537,123 @@ class ArticleExtractor:
             "error": None,
         }
 
+        # Unter angefragter und weitergeleiteter URL speichern, damit beide treffen
+        if self.cache is not None:
+            self.cache.set([url, page.url], result, etag=etag, last_modified=last_modified)
+
+        return result
+
+
+    async def aclose(self) -> None:
+        """
+        Schließt die HTTP-Verbindungen des AsyncArticleFetcher.
+        """
+        await self.fetcher.aclose()
+
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """
+        Liefert die Semaphore, welche gleichzeitige Abrufe pro Host begrenzt.
+        """
+        host = (urlparse(url).hostname or "").lower()
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self._per_host_limit)
+                self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _extract_with_host_limit(self, url: str, deadline: float) -> Dict[str, Any]:
+        """
+        Extrahiert eine URL, sobald für ihren Host ein freier Slot verfügbar ist.
+        Ist bis zur Gesamtfrist kein Slot frei, wird die URL nicht mehr abgerufen.
+        """
+        started = time.perf_counter()
+        semaphore = self._host_semaphore(url)
+        if not semaphore.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            result = self._timeout_result()
+        else:
+            try:
+                result = self._extract_article_with_fundus(url)
+            except Exception as exc:
+                result = ArticleExtractor._url_error(
+                    f"Artikel konnte nicht extrahiert werden: {exc}"
+                )
+            finally:
+                semaphore.release()
+
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+    @staticmethod
+    def _url_error(error: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "input_type": "url",
+            "publisher": None,
+            "title": None,
+            "text": None,
+            "error": error,
+        }
+
+    def _timeout_result(self) -> Dict[str, Any]:
+        return ArticleExtractor._url_error(
+            f"Zeitlimit von {self._multi_url_timeout_seconds:g} Sekunden "
+            "für die Extraktion überschritten."
+        )
+
+    def _extract_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extrahiert mehrere URLs parallel und liefert die Ergebnisse in der
+        Reihenfolge der Eingabe.
+
+        Die Gesamtdauer entspricht damit ungefähr der des langsamsten Publishers
+        statt der Summe aller Antwortzeiten. URLs, die bis zur Gesamtfrist nicht
+        fertig sind, erhalten ein Fehlerergebnis; ihre Threads laufen im
+        Hintergrund zu Ende, das Ergebnis wird verworfen.
+        """
+        deadline = time.monotonic() + self._multi_url_timeout_seconds
+        futures = [
+            self._pool.submit(self._extract_with_host_limit, url, deadline)
+            for url in urls
+        ]
+        wait(futures, timeout=self._multi_url_timeout_seconds)
+
+        results = []
+        for future in futures:
+            if future.done():
+                results.append(future.result())
+            else:
+                future.cancel()
+                results.append(
+                    {**self._timeout_result(), "seconds": self._multi_url_timeout_seconds}
+                )
+        return results
+
+    async def _extract_many_async(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Asynchrones Gegenstück zu `_extract_many`.
+
+        Alle URLs werden gleichzeitig angefragt; die Begrenzung pro Host
+        übernimmt der Verbindungspool des Fetchers. URLs, die bis zur
+        Gesamtfrist nicht fertig sind, werden abgebrochen.
+        """
+
+        async def extract(url: str) -> Dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    self._extract_article_async(url), self._multi_url_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                result = self._timeout_result()
+            except Exception as exc:
+                result = ArticleExtractor._url_error(
+                    f"Artikel konnte nicht extrahiert werden: {exc}"
+                )
+            result["seconds"] = round(time.perf_counter() - started, 3)
+            return result
+
+        return list(await asyncio.gather(*(extract(url) for url in urls)))
 
     def process(self, user_input: str) -> Dict[str, Any]:
         """
@@ -326,6 +683,39 @@ class ArticleExtractor:
                     "text": str | None,
                     "error": str | None
                 }
+                Bei mehreren URLs zusätzlich "articles": eine Liste mit
+                url, success, publisher, title, error und seconds je URL
+                in der Reihenfolge der Eingabe.
+        """
+
+        result, urls = self._classify_input(user_input)
+        if result is not None:
+            return result
+
+        # Die URLs werden parallel abgerufen, die Texte in Eingabereihenfolge kombiniert.
+        if len(urls) > 1:
+            return self._combine_results(urls, self._extract_many(urls))
+
+        return self._extract_article_with_fundus(urls[0])
+
+    async def process_async(self, user_input: str) -> Dict[str, Any]:
+        """
+        Wie `process`, aber für die Event-Loop: Artikel werden über den
+        AsyncArticleFetcher geladen, ohne dabei einen Thread zu blockieren.
+        """
+        result, urls = self._classify_input(user_input)
+        if result is not None:
+            return result
+
+        if len(urls) > 1:
+            return self._combine_results(urls, await self._extract_many_async(urls))
+
+        return await self._extract_article_async(urls[0])
+
+    def _classify_input(self, user_input: str) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Ordnet die Eingabe ein: Liefert entweder direkt ein Ergebnis (leere
+        Eingabe oder Rohtext) oder die zu extrahierenden URLs.
         """
 
         if not user_input or not user_input.strip():
@@ -336,7 +726,7 @@ class ArticleExtractor:
                 "title": None,
                 "text": None,
                 "error": "Leere Eingabe.",
-            }
+            }, []
 
         user_input = user_input.strip()
         lines = [line.strip() for line in user_input.splitlines() if line.strip()]
@@ -346,40 +736,13 @@ class ArticleExtractor:
         # (Hinweis: Der Code erzwingt aktuell NICHT, dass alle URLs zum selben Publisher gehören.)
         # ---------------------------------------------------------
         if len(lines) > 1 and all(self._is_pure_url(line) for line in lines):
-            combined_text = []
-            errors = []
-            title = None
-            publisher = None
-            result = None
-
-            for line in lines:
-                result = self._extract_article_with_fundus(line)
-
-                if result["success"] and result["text"]:
-
-                    if title is None and publisher is None:
-                        title = result["title"]
-                        publisher = result["publisher"]
-
-                    combined_text.append(result["text"])
-
-                if result["error"]:
-                    errors.append(f"{line}: {result['error']}")
-
-            return {
-                "success": (len(combined_text) > 0 and len(errors) == 0),
-                "input_type": "multi_url",
-                "publisher": publisher,
-                "title": title,
-                "text": "\n\n".join(combined_text) if combined_text else None,
-                "error": "\n".join(errors) if errors else None,
-            }
+            return None, lines
 
         # ---------------------------------------------------------
         # Fall 2: Einzelne URL
         # ---------------------------------------------------------
         if self._is_pure_url(user_input):
-            return self._extract_article_with_fundus(user_input)
+            return None, [user_input]
 
         # ---------------------------------------------------------
         # Fall 3: Eingabe ist kein Link → als Artikeltext behandeln
@@ -391,4 +754,48 @@ class ArticleExtractor:
             "title": None,
             "text": user_input,
             "error": None,
-        }
\ No newline at end of file
+        }, []
+
+    @staticmethod
+    def _combine_results(urls: List[str], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Kombiniert die Ergebnisse mehrerer URLs zu einem Gesamtergebnis.
+        """
+        combined_text = []
+        errors = []
+        articles = []
+        title = None
+        publisher = None
+
+        for line, result in zip(urls, results):
+            articles.append(
+                {
+                    "url": line,
+                    "success": result["success"],
+                    "publisher": result["publisher"],
+                    "title": result["title"],
+                    "error": result["error"],
+                    "seconds": result["seconds"],
+                }
+            )
+
+            if result["success"] and result["text"]:
+
+                if title is None and publisher is None:
+                    title = result["title"]
+                    publisher = result["publisher"]
+
+                combined_text.append(result["text"])
+
+            if result["error"]:
+                errors.append(f"{line}: {result['error']}")
+
+        return {
+            "success": (len(combined_text) > 0 and len(errors) == 0),
+            "input_type": "multi_url",
+            "publisher": publisher,
+            "title": title,
+            "text": "\n\n".join(combined_text) if combined_text else None,
+            "error": "\n".join(errors) if errors else None,
+            "articles": articles,
+        }
@@ -0,0 +1,229 @@
+"""
+Async Article Fetcher
+---------------------------------------
+
+Lädt Artikelseiten asynchron mit httpx, damit ein langsamer Publisher nur eine
+wartende Koroutine statt eines blockierten Worker-Threads kostet.
+
+- Je Publisher-Host ein eigener Client mit Keep-Alive-Verbindungspool
+- Getrennte Zeitlimits für Verbindungsaufbau und Lesen
+- Größenlimit für Antworten, der Abruf bricht beim Überschreiten sofort ab
+- Nur HTML-Antworten werden gelesen, andere Content-Types sofort verworfen
+- Der Body wird beim Empfang schrittweise dekodiert
+- HTTP/2, sofern das Paket `h2` installiert ist und der Server es anbietet
+
+Größenlimit und Content-Type-Prüfung gibt es mit `read_limited_text` auch für
+synchrone requests-Antworten (Fundus-Session, Scraper der Trainingsdaten).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import importlib.util
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional
+
+import httpx
+import requests
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Content-Types, die als Artikelseite gelesen werden.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Blockgröße beim Lesen synchroner Antworten.
+_CHUNK_SIZE = 64 * 1024
+
+
+class FetchError(Exception):
+    """
+    Abruf einer Seite fehlgeschlagen; die Meldung ist für Nutzer gedacht.
+    """
+
+
+class ResponseTooLargeError(FetchError):
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(
+            f"Die Seite ist größer als {max_bytes // 1024} KiB und wurde nicht geladen."
+        )
+
+
+class UnsupportedContentTypeError(FetchError):
+    def __init__(self, content_type: str) -> None:
+        super().__init__(
+            f"Die URL liefert keine HTML-Seite (Content-Type: {content_type})."
+        )
+
+
+def check_html_response(headers: Mapping[str, str], max_bytes: int) -> None:
+    """
+    Prüft vor dem Lesen des Body Content-Type und angekündigte Größe.
+    Fehlt der Content-Type, wird die Antwort wie HTML behandelt.
+    """
+    content_type = headers.get("Content-Type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type and media_type not in HTML_CONTENT_TYPES:
+        raise UnsupportedContentTypeError(media_type)
+
+    declared = headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseTooLargeError(max_bytes)
+
+
+def decode_limited(chunks: Iterable[bytes], encoding: str, max_bytes: int) -> str:
+    """
+    Dekodiert Datenblöcke schrittweise und bricht ab, sobald mehr als
+    max_bytes empfangen wurden.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts = []
+    received = 0
+    for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise ResponseTooLargeError(max_bytes)
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def read_limited_text(response: requests.Response, max_bytes: int) -> str:
+    """
+    Liest eine mit `stream=True` angeforderte requests-Antwort mit Größenlimit
+    und Content-Type-Prüfung. Die Verbindung wird in jedem Fall freigegeben.
+    """
+    with response:
+        check_html_response(response.headers, max_bytes)
+        return decode_limited(
+            response.iter_content(chunk_size=_CHUNK_SIZE),
+            response.encoding or "utf-8",
+            max_bytes,
+        )
+
+
+@dataclass
+class FetchedPage:
+    """
+    Antwort eines Abrufs, unabhängig davon, ob sie synchron über die
+    Fundus-Session oder asynchron über httpx geladen wurde.
+    """
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    text: str
+
+
+class AsyncArticleFetcher:
+    def __init__(
+        self,
+        connect_timeout_seconds: float = 5.0,
+        read_timeout_seconds: float = 15.0,
+        max_response_bytes: int = 5 * 1024 * 1024,
+        max_connections_per_host: int = 2,
+        http2: bool = True,
+    ) -> None:
+        """
+        :param connect_timeout_seconds: Frist für den Verbindungsaufbau
+        :param read_timeout_seconds: maximale Pause zwischen zwei empfangenen Datenblöcken
+        :param max_response_bytes: Obergrenze für den (dekomprimierten) Body
+        :param max_connections_per_host: gleichzeitige Verbindungen je Host; weitere
+            Abrufe warten, bis eine Verbindung frei wird
+        :param http2: HTTP/2 aushandeln, falls `h2` verfügbar ist
+        """
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout_seconds,
+            read=read_timeout_seconds,
+            write=read_timeout_seconds,
+            # Auf eine freie Verbindung wird gewartet; die Gesamtfrist setzt der Aufrufer.
+            pool=None,
+        )
+        self.max_response_bytes = max_response_bytes
+        self.limits = httpx.Limits(
+            max_connections=max(1, max_connections_per_host),
+            max_keepalive_connections=max(1, max_connections_per_host),
+        )
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _client(self, url: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # httpx-Clients gehören zu der Event-Loop, in der sie erzeugt wurden.
+            self._clients = {}
+            self._loop = loop
+
+        host = (httpx.URL(url).host or "").lower()
+        client = self._clients.get(host)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=self.limits,
+                follow_redirects=True,
+            )
+            self._clients[host] = client
+        return client
+
+    async def fetch(self, url: str, headers: Mapping[str, str]) -> FetchedPage:
+        """
+        Lädt eine Seite und liefert sie dekodiert zurück.
+
+        Antworten mit Status 304 werden unverändert zurückgegeben, damit der
+        Aufrufer gecachte Ergebnisse weiterverwenden kann. Fehlerstatus,
+        Nicht-HTML-Antworten, Zeitüberschreitungen und zu große Antworten
+        lösen einen FetchError aus.
+        """
+        try:
+            async with self._client(url).stream("GET", url, headers=headers) as response:
+                if response.status_code >= 400:
+                    raise FetchError(
+                        f"Der Server antwortete mit Status {response.status_code}."
+                    )
+                if response.status_code != 304:
+                    check_html_response(response.headers, self.max_response_bytes)
+                return FetchedPage(
+                    url=str(response.url),
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    text=await self._read_text(response),
+                )
+        except httpx.TimeoutException as exc:
+            raise FetchError(f"Zeitüberschreitung beim Abruf ({type(exc).__name__}).") from exc
+        except httpx.HTTPError as exc:
+            raise FetchError(f"Verbindungsfehler: {exc}") from exc
+
+    async def _read_text(self, response: httpx.Response) -> str:
+        """
+        Liest den Body blockweise, dekodiert ihn dabei und bricht ab, sobald
+        das Größenlimit überschritten ist.
+        """
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+            errors="replace"
+        )
+        parts = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > self.max_response_bytes:
+                raise ResponseTooLargeError(self.max_response_bytes)
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except RuntimeError:
+                # Client einer anderen, bereits beendeten Event-Loop
+                logger.debug("Could not close HTTP client", exc_info=True)
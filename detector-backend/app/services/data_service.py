@@ -1,4 +1,21 @@
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import resource
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
 import pandas as pd
+from pymongo import DeleteMany, UpdateOne
+from pymongo.synchronous.collection import Collection
 
 from app.core.config import Settings
 from app.db import Database
@@ -11,6 +28,112 @@ from app.pipelines.germanfakenc_pipeline import GermanFakeNCPipeline
 from app.pipelines.gossipcop_pipeline import GossipCopPipeline
 
 
+@dataclass
+class ImportStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+
+@dataclass
+class PipelineReport:
+    name: str
+    status: str = "ok"
+    seconds: float = 0.0
+    rows: int = 0
+    peak_rss_mb: float = 0.0
+    import_stats: Optional[ImportStats] = None
+    error: Optional[str] = None
+
+
+class PipelineFailed(Exception):
+    pass
+
+
+def _produce_chunks(
+    pipeline_cls: Type[BaseDataPipeline],
+    name: str,
+    chunk_size: int | None,
+    chunks: Connection,
+) -> None:
+    """
+    Runs one pipeline in its own process and sends its chunks to the importer.
+    The stream ends with ("done", report) or ("error", report).
+    """
+    started = time.perf_counter()
+    report = PipelineReport(name=name)
+    try:
+        for chunk in pipeline_cls(name, chunk_size=chunk_size).process_chunks():
+            report.rows += len(chunk)
+            chunks.send(("chunk", chunk))
+        kind = "done"
+    except Exception as e:
+        traceback.print_exc()
+        report.status = "failed"
+        report.error = f"{type(e).__name__}: {e}"
+        kind = "error"
+
+    report.seconds = time.perf_counter() - started
+    # The process runs a single pipeline, so this is the peak of that pipeline (KiB on Linux).
+    report.peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    chunks.send((kind, report))
+    chunks.close()
+
+
+class _QueuedPipeline:
+    """
+    Importer-side view of a pipeline running in its own process.
+
+    Chunks arrive through a one-way pipe whose only write end belongs to the
+    pipeline process, so every chunk is pickled once and the pipe reports its
+    end as soon as the process is gone. If the process dies without ending its
+    stream (OOM kill, segfault), the stream is ended with an error here, so the
+    importer never waits forever.
+    """
+
+    def __init__(
+        self, dataset_name: str, chunks: Connection, process: BaseProcess
+    ) -> None:
+        self.dataset_name = dataset_name
+        self.chunks = chunks
+        self.process = process
+        self.started = time.perf_counter()
+        self.rows = 0
+        self.report: Optional[PipelineReport] = None
+
+    def _receive(self) -> tuple:
+        try:
+            return self.chunks.recv()
+        except (EOFError, OSError):
+            self.process.join()
+            return "error", PipelineReport(
+                name=self.dataset_name,
+                status="failed",
+                seconds=time.perf_counter() - self.started,
+                rows=self.rows,
+                error=f"Pipeline process died with exit code {self.process.exitcode}.",
+            )
+
+    def process_chunks(self) -> Iterator[pd.DataFrame]:
+        while self.report is None:
+            kind, payload = self._receive()
+            if kind == "chunk":
+                self.rows += len(payload)
+                yield payload
+                continue
+            self.report = payload
+            if kind == "error":
+                raise PipelineFailed(payload.error)
+
+    def drain(self) -> None:
+        # Unblocks the process if the import stopped before its last chunk.
+        while self.report is None:
+            kind, payload = self._receive()
+            if kind != "chunk":
+                self.report = payload
+
+
 class DataService:
     """
     Orchestrator for the ETL-Process.
@@ -28,8 +151,19 @@ class DataService:
         # "gossipcop": GossipCopPipeline,
     }
 
-    def __init__(self) -> None:
-        self.db = Database(Settings())
+    # Records per bulk_write call of the incremental import.
+    IMPORT_CHUNK_SIZE = 1000
+
+    def __init__(
+        self, chunk_size: int | None = None, workers: int | None = None
+    ) -> None:
+        settings = Settings()
+        self.db = Database(settings)
+        # Rows per pipeline chunk, None processes every dataset in one piece.
+        if chunk_size is None:
+            chunk_size = settings.PIPELINE_CHUNK_SIZE
+        self.chunk_size = chunk_size or None
+        self.workers = max(1, workers or settings.PIPELINE_WORKERS)
 
     @staticmethod
     def validate_df(df: pd.DataFrame, dataset: str) -> None:
@@ -45,36 +179,277 @@ class DataService:
                 f"[DataService] Dataframe of {dataset} is missing at least on of {required_cols} Columns."
             )
 
-    def import_to_mongo(self, pipeline: BaseDataPipeline) -> None:
+    @staticmethod
+    def _validated_frames(
+        frames: Iterable[pd.DataFrame], dataset: str
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Validates every non-empty chunk; raises if the pipeline produced no data at all.
+        """
+        empty = True
+        for df in frames:
+            if df.empty:
+                continue
+            DataService.validate_df(df, dataset)
+            empty = False
+            yield df
+
+        if empty:
+            raise ValueError(f"[DataService] No data found for {dataset}")
+
+    @staticmethod
+    def article_key(dataset: str, record: Dict[str, Any]) -> str:
+        """
+        Stable identity of an article within its dataset, derived from its text.
+        """
+        digest = hashlib.sha256()
+        for part in (dataset, str(record["text"])):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def content_hash(record: Dict[str, Any]) -> str:
+        """
+        Hash over all stored fields, used to detect changed articles.
+        """
+        payload = json.dumps(record, sort_keys=True, default=str, ensure_ascii=False)
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _iter_records(
+        frames: Iterable[pd.DataFrame], chunk_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        # Only one chunk of dicts exists at a time; missing values become None.
+        for df in frames:
+            for start in range(0, len(df), chunk_size):
+                chunk = df.iloc[start : start + chunk_size]
+                yield chunk.astype(object).where(chunk.notna(), None).to_dict("records")
+
+    def _import_incremental(
+        self, coll: Collection, dataset: str, frames: Iterable[pd.DataFrame]
+    ) -> ImportStats:
+        """
+        Upserts new and changed articles in unordered bulk writes and removes
+        only the articles that are no longer part of the dataset.
+        """
+        stats = ImportStats()
+        coll.create_index([("dataset", 1), ("article_key", 1)])
+        existing = {
+            doc["article_key"]: doc.get("content_hash")
+            for doc in coll.find(
+                {"dataset": dataset, "article_key": {"$exists": True}},
+                {"_id": 0, "article_key": 1, "content_hash": 1},
+            )
+        }
+        seen = set()
+
+        for records in DataService._iter_records(frames, DataService.IMPORT_CHUNK_SIZE):
+            operations = []
+            for record in records:
+                key = DataService.article_key(dataset, record)
+                if key in seen:
+                    # Duplicate text within the dataset, the first occurrence wins.
+                    continue
+                seen.add(key)
+
+                content_hash = DataService.content_hash(record)
+                previous = existing.get(key)
+                if previous == content_hash:
+                    stats.unchanged += 1
+                    continue
+
+                if key in existing:
+                    stats.updated += 1
+                else:
+                    stats.inserted += 1
+                document = {**record, "article_key": key, "content_hash": content_hash}
+                operations.append(
+                    UpdateOne(
+                        {"dataset": dataset, "article_key": key},
+                        {"$set": document},
+                        upsert=True,
+                    )
+                )
+
+            if operations:
+                coll.bulk_write(operations, ordered=False)
+
+        removed = [key for key in existing if key not in seen]
+        deletions = [
+            DeleteMany(
+                {
+                    "dataset": dataset,
+                    "article_key": {"$in": removed[start : start + DataService.IMPORT_CHUNK_SIZE]},
+                }
+            )
+            for start in range(0, len(removed), DataService.IMPORT_CHUNK_SIZE)
+        ]
+        # Records of earlier full-refresh imports have no key and are replaced.
+        deletions.append(DeleteMany({"dataset": dataset, "article_key": {"$exists": False}}))
+        result = coll.bulk_write(deletions, ordered=False)
+        stats.removed = result.deleted_count
+
+        return stats
+
+    def import_to_mongo(
+        self, pipeline: BaseDataPipeline, full_refresh: bool = False
+    ) -> ImportStats | None:
         """
         Executes a single pipeline and stores the result in MongoDB.
-        Uses a full refresh, where all existing records of this dataset are deleted.
+
+        By default the import is incremental: articles are keyed by a hash of
+        their text, only new or changed articles are written and only vanished
+        ones are deleted, so readers never see an empty dataset and re-running an
+        unchanged pipeline writes (almost) nothing. With full_refresh all existing
+        records of this dataset are deleted and inserted again.
         """
-        df = pipeline.process_data()
         dataset = pipeline.dataset_name
+        # Chunked pipelines stream their output, every chunk is written right away.
+        frames = DataService._validated_frames(pipeline.process_chunks(), dataset)
 
         try:
-            DataService.validate_df(df, dataset)
+            first = next(frames)
         except ValueError as e:
             print(f"[DataService] Validation failed for {dataset}: {e}")
-            return
+            return None
 
         print(f"[DataService] Starting import for {dataset}")
 
         coll = self.db.get_articles_collection()
-        coll.delete_many({"dataset": dataset})
-        coll.insert_many(df.to_dict("records"))
+        try:
+            if full_refresh:
+                stats = ImportStats(
+                    removed=coll.delete_many({"dataset": dataset}).deleted_count
+                )
+                for records in DataService._iter_records(
+                    itertools.chain([first], frames), DataService.IMPORT_CHUNK_SIZE
+                ):
+                    coll.insert_many(records)
+                    stats.inserted += len(records)
+            else:
+                stats = self._import_incremental(
+                    coll, dataset, itertools.chain([first], frames)
+                )
+        except ValueError as e:
+            # A later chunk failed validation; vanished articles are not deleted then.
+            print(f"[DataService] Validation failed for {dataset}: {e}")
+            return None
 
         print(
-            f"[DataService] Finished import for {dataset}. Inserted {len(df)} documents into 'articles' collection."
+            f"[DataService] Finished import for {dataset}: "
+            + ", ".join(f"{count} {name}" for name, count in asdict(stats).items())
         )
+        return stats
+
+    def _run_pipeline(
+        self,
+        name: str,
+        pipeline_cls: Type[BaseDataPipeline],
+        slots: threading.Semaphore,
+        full_refresh: bool,
+    ) -> PipelineReport:
+        """
+        Starts the pipeline in a fresh process once a slot is free and imports its chunks.
+        """
+        spawn = multiprocessing.get_context("spawn")
+        with slots:
+            chunks, sender = spawn.Pipe(duplex=False)
+            process = spawn.Process(
+                target=_produce_chunks,
+                args=(pipeline_cls, name, self.chunk_size, sender),
+                name=f"pipeline-{name}",
+            )
+            process.start()
+            # Only the pipeline process may hold the write end, its exit ends the stream.
+            sender.close()
+            pipeline = _QueuedPipeline(name, chunks, process)
+            import_stats, import_error = None, None
+            try:
+                import_stats = self.import_to_mongo(pipeline, full_refresh=full_refresh)
+            except PipelineFailed:
+                pass
+            except Exception as e:
+                import_error = f"Import failed: {type(e).__name__}: {e}"
+            finally:
+                pipeline.drain()
+                chunks.close()
+                process.join()
+
+        report = pipeline.report
+        report.import_stats = import_stats
+        if report.status == "ok" and import_error:
+            report.status, report.error = "failed", import_error
+        elif report.status == "ok" and import_stats is None:
+            report.status = "skipped"
+        return report
 
-    def run_and_import_all_pipelines(self) -> None:
-        for name, pipeline in DataService.PIPELINES.items():
-            self.import_to_mongo(pipeline(name))
+    def run_and_import_all_pipelines(
+        self, full_refresh: bool = False
+    ) -> List[PipelineReport]:
+        """
+        Runs the registered pipelines concurrently, at most `workers` at a time.
+
+        Every pipeline runs in its own process and streams its processed chunks
+        through a pipe to an importer thread in this process, which writes them
+        to MongoDB while the pipeline processes the next chunk. A failing or
+        crashing pipeline only fails its own dataset: its import stops before
+        vanished articles are removed and the other pipelines carry on.
+        """
+        started = time.perf_counter()
+        slots = threading.Semaphore(self.workers)
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.PIPELINES),
+            thread_name_prefix="pipeline-import",
+        ) as importers:
+            jobs = [
+                importers.submit(self._run_pipeline, name, pipeline_cls, slots, full_refresh)
+                for name, pipeline_cls in self.PIPELINES.items()
+            ]
+            reports = [job.result() for job in jobs]
+
+        DataService._print_reports(reports, time.perf_counter() - started)
+        return reports
+
+    @staticmethod
+    def _print_reports(reports: List[PipelineReport], seconds: float) -> None:
+        print(f"[DataService] Ran {len(reports)} pipelines in {seconds:.1f} s")
+        for report in reports:
+            stats = report.import_stats or ImportStats()
+            print(
+                f"[DataService] {report.name:<14} {report.status:<8} "
+                f"{report.seconds:7.1f} s {report.rows:>8} rows "
+                f"peak {report.peak_rss_mb:7.1f} MB | "
+                + ", ".join(f"{count} {name}" for name, count in asdict(stats).items())
+            )
+            if report.error:
+                print(f"[DataService] {report.name}: {report.error}")
 
 
 if __name__ == "__main__":
-    data_service = DataService()
-    data_service.run_and_import_all_pipelines()
+    parser = argparse.ArgumentParser(description="Runs all data pipelines and imports them.")
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Delete and re-insert every dataset instead of importing incrementally.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows per pipeline chunk, 0 processes every dataset in one piece.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Pipelines that run at the same time, each in its own process.",
+    )
+    args = parser.parse_args()
+
+    data_service = DataService(chunk_size=args.chunk_size, workers=args.workers)
+    data_service.run_and_import_all_pipelines(full_refresh=args.full_refresh)
     data_service.db.close()
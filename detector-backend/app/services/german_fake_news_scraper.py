@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from app.domain import Label, ScrapedArticle, TrainingArticle, Language
+from app.services.article_fetcher import read_limited_text
 
 HERE = Path(__file__).resolve()
 BACKEND_DIR = HERE.parents[2]
@@ -20,9 +21,14 @@ class GermanFakeNCScraper:
         self,
         json_path: Path = JSON_PATH,
         output_dir: Path = OUTPUT_DIR,
+        max_response_bytes: int = 5 * 1024 * 1024,
+        html_parser: str = "lxml",
     ) -> None:
         self.json_path = json_path
         self.output_dir = output_dir
+        # Larger pages and non-HTML responses are aborted while downloading.
+        self.max_response_bytes = max_response_bytes
+        self.html_parser = html_parser
         self.output_dir.mkdir(parents=True, exist_ok=True)
         # Faking a header so we can bypass some filters....
         self.headers = {
@@ -57,18 +63,24 @@ class GermanFakeNCScraper:
         except ValueError:
             return None
 
-    def _scrape_url(self, url: str) -> ScrapedArticle:
-        resp = requests.get(url, headers=self.headers, timeout=15)
+    def _fetch_html(self, url: str) -> str:
+        resp = requests.get(url, headers=self.headers, timeout=15, stream=True)
         resp.raise_for_status()
-        html = resp.text
+        return read_limited_text(resp, self.max_response_bytes)
 
-        soup = BeautifulSoup(html, "html.parser")
+    @staticmethod
+    def _parse_html(html: str, parser: str = "lxml") -> tuple[Optional[str], Optional[str]]:
+        soup = BeautifulSoup(html, parser)
         title = soup.title.string.strip() if soup.title and soup.title.string else None
 
         paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
         text = "\n".join(p for p in paragraphs if p)
 
-        return ScrapedArticle(url=url, title=title, text=text or None)
+        return title, text or None
+
+    def _scrape_url(self, url: str) -> ScrapedArticle:
+        title, text = self._parse_html(self._fetch_html(url), self.html_parser)
+        return ScrapedArticle(url=url, title=title, text=text)
 
     def load_raw_metadata(self) -> list[dict]:
         with self.json_path.open(encoding="utf-8") as f:
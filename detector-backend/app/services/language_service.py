@@ -1,45 +1,197 @@
 from __future__ import annotations
 
-from typing import Optional
+import hashlib
+import json
+import os
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
-from lingua import Language, LanguageDetectorBuilder
+from lingua import IsoCode639_1, LanguageDetector, LanguageDetectorBuilder
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class LanguageDetectionService:
     """
     Service for identifying the natural language of a given text.
+
+    By default all spoken languages are considered. `restrict_to` limits the
+    candidates to a few ISO 639-1 codes, which keeps only those language models
+    in memory. A restricted detector always answers with one of its candidates,
+    so it cannot tell unsupported languages apart from similar candidates.
+    `low_accuracy` switches lingua to its faster, smaller n-gram mode, which
+    is much less reliable on short texts.
+    Language models are loaded by lingua on the first detection.
     """
 
-    def __init__(self, restrict_to: Optional[list[str]] = None) -> None:
+    def __init__(
+        self,
+        restrict_to: Optional[list[str]] = None,
+        low_accuracy: bool = False,
+    ) -> None:
+        self._restrict_to = restrict_to
+        self._low_accuracy = low_accuracy
+        self._detector = self._build()
+
+    def _build(self) -> LanguageDetector:
         # Optional language filter
-        if restrict_to:
-            langs = []
-            for code in restrict_to:
-                code = code.lower()
-                if code == "en":
-                    langs.append(Language.ENGLISH)
-                elif code == "de":
-                    langs.append(Language.GERMAN)
-            self._detector = LanguageDetectorBuilder.from_languages(*langs).build()
+        if self._restrict_to:
+            codes = []
+            unknown = []
+            for code in self._restrict_to:
+                try:
+                    codes.append(IsoCode639_1.from_str(code.strip().lower()))
+                except ValueError:
+                    unknown.append(code)
+            if unknown:
+                logger.warning("Ignoring unknown ISO 639-1 codes: %s", ", ".join(unknown))
+            if len(set(codes)) < 2:
+                raise ValueError(
+                    "Language detection needs at least two valid ISO 639-1 codes, "
+                    f"got {self._restrict_to}."
+                )
+            builder = LanguageDetectorBuilder.from_iso_codes_639_1(*codes)
         else:
-            self._detector = LanguageDetectorBuilder.from_all_spoken_languages().build()
+            builder = LanguageDetectorBuilder.from_all_spoken_languages()
 
-    def detect_code(self, text: str) -> Optional[str]:
+        if self._low_accuracy:
+            builder = builder.with_low_accuracy_mode()
+
+        # Language models are loaded lazily by lingua on the first detection.
+        return builder.build()
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Identifies the detector configuration whose results a cache may reuse.
+        """
+        candidates = ",".join(sorted(self._restrict_to or [])) or "all"
+        mode = "low" if self._low_accuracy else "high"
+        return f"lingua-{version('lingua-language-detector')}/{candidates}/{mode}"
+
+    def warm_up(self) -> None:
+        """
+        Builds the detector and loads its language models ahead of the first request.
+        """
+        self._detector.detect_language_of("warm up")
+
+    def detect_code(self, text: str, max_chars: Optional[int] = None) -> Optional[str]:
         """
         Identifies the language and returns its ISO 639-1 code ('en', 'de' etc.).
+        If max_chars is set, only a prefix of the text is analyzed, which is
+        sufficient for full articles and bounds the detection cost.
         """
         if not isinstance(text, str):
             return None
         text = text.strip()
         if not text:
             return None
+        if max_chars and len(text) > max_chars:
+            text = LanguageDetectionService._prefix(text, max_chars)
         lang = self._detector.detect_language_of(text)
         if lang is None:
             return None
         return lang.iso_code_639_1.name.lower()
 
+    def detect_codes(
+        self,
+        texts: Iterable[Any],
+        max_chars: Optional[int] = None,
+        cache: Optional[LanguageCodeCache] = None,
+    ) -> List[Optional[str]]:
+        """
+        Bulk variant of `detect_code` for many texts at once.
+
+        The texts are detected by lingua's multi-threaded batch detection, so
+        all CPU cores are used and the GIL is released while detecting. With a
+        cache, texts whose prefix was detected before are not analyzed again
+        and new results are added to it.
+        """
+        codes: List[Optional[str]] = []
+        pending: Dict[str, List[int]] = {}
+        for text in texts:
+            codes.append(None)
+            if not isinstance(text, str) or not text.strip():
+                continue
+            text = text.strip()
+            if max_chars and len(text) > max_chars:
+                text = LanguageDetectionService._prefix(text, max_chars)
+            pending.setdefault(text, []).append(len(codes) - 1)
+
+        if cache is not None:
+            for text in list(pending):
+                key = LanguageCodeCache.key(text)
+                if key in cache:
+                    for i in pending.pop(text):
+                        codes[i] = cache[key]
+
+        unique = list(pending)
+        languages = self._detector.detect_languages_in_parallel_of(unique) if unique else []
+        for text, lang in zip(unique, languages):
+            code = lang.iso_code_639_1.name.lower() if lang is not None else None
+            for i in pending[text]:
+                codes[i] = code
+            if cache is not None:
+                cache[LanguageCodeCache.key(text)] = code
+        return codes
+
+    @staticmethod
+    def _prefix(text: str, max_chars: int) -> str:
+        # Cut at the last whitespace so no partial word confuses the detector.
+        prefix = text[:max_chars]
+        cut = prefix.rfind(" ")
+        return prefix[:cut] if cut > 0 else prefix
+
     def is_english(self, text: str) -> bool:
         return self.detect_code(text) == "en"
 
     def is_german(self, text: str) -> bool:
         return self.detect_code(text) == "de"
+
+
+class LanguageCodeCache(dict):
+    """
+    Detected language codes by hash of the analyzed text, persisted as JSON so
+    re-running a data pipeline does not detect unchanged texts again.
+
+    The file also stores the detector fingerprint; entries of a different
+    lingua version or configuration are discarded on load.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        super().__init__()
+        self.path = path
+        self.fingerprint = fingerprint
+        self._saved = 0
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("fingerprint") == fingerprint:
+            self.update(payload.get("codes", {}))
+            self._saved = len(self)
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def save(self) -> None:
+        """
+        Writes the cache atomically, but only if entries were added since the last save.
+        """
+        if len(self) == self._saved:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"fingerprint": self.fingerprint, "codes": self}, handle)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._saved = len(self)
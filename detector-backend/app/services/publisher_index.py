@@ -0,0 +1,190 @@
+"""
+Publisher Domain Index
+---------------------------------------
+
+Ordnet registrierbare Root-Domains (z. B. 'spiegel.de') den FUNDUS-Publishern zu.
+
+Der Aufbau des Index zerlegt jede Publisher-Domain mit tldextract. Damit das
+nicht bei jedem Prozessstart passiert, wird der Index einmal je Fundus-Version
+als JSON-Datei gespeichert und danach nur noch geladen. Die Sprachfilterung
+erfolgt erst beim Laden, eine Datei dient also allen Sprachkonfigurationen.
+
+tldextract arbeitet ausschließlich mit der mitgelieferten Public-Suffix-Liste
+und versucht nie, eine aktuelle Liste aus dem Netz zu laden.
+
+Usage:
+    uv run python -m app.services.publisher_index --output-dir cache/publisher_index
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import tldextract
+from fundus.publishers import PublisherCollection, Publisher, PublisherGroup
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Nur die mit tldextract ausgelieferte Suffix-Liste, kein Download, kein Datei-Cache.
+_OFFLINE_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=8192)
+def root_domain(hostname: str) -> Optional[str]:
+    """
+    Normalisiert einen Hostnamen auf seine registrierbare Root-Domain.
+
+    'www.spiegel.de' → 'spiegel.de', 'news.bbc.co.uk' → 'bbc.co.uk'.
+    Gibt None zurück, wenn Domain oder Suffix fehlen. Die Ergebnisse werden
+    zwischengespeichert, da dieselben Hosts immer wieder angefragt werden.
+    """
+    extracted = _OFFLINE_EXTRACT(hostname.lower())
+    if not extracted.domain or not extracted.suffix:
+        return None
+    return f"{extracted.domain}.{extracted.suffix}"
+
+
+def fundus_version() -> str:
+    return metadata.version("fundus")
+
+
+def iter_publishers() -> Iterator[Publisher]:
+    """
+    Iteriert alle Publisher der PublisherCollection, auch die in PublisherGroups.
+    """
+    for entry in PublisherCollection:
+        if isinstance(entry, PublisherGroup):
+            yield from entry.publishers
+        else:
+            yield entry
+
+
+def build_domain_index() -> Dict[str, List[str]]:
+    """
+    Baut den Index Root-Domain → Publisher-Namen für alle Publisher auf.
+
+    Eine Root-Domain kann mehreren Publishern gehören (z. B. Sprachausgaben),
+    daher werden alle Namen in Collection-Reihenfolge gespeichert.
+    """
+    index: Dict[str, List[str]] = {}
+    for publisher in iter_publishers():
+        domains = publisher.domain
+        # Fundus erlaubt Domains sowohl als String als auch als Liste
+        if isinstance(domains, str):
+            domains = [domains]
+
+        for domain in domains:
+            if not domain:
+                continue
+            root = root_domain(domain)
+            # Ungültige oder unvollständige Domains überspringen
+            if root is None:
+                continue
+            names = index.setdefault(root, [])
+            if publisher.__name__ not in names:
+                names.append(publisher.__name__)
+    return index
+
+
+def index_path(directory: Path, version: Optional[str] = None) -> Path:
+    return Path(directory) / f"fundus-{version or fundus_version()}.json"
+
+
+def write_domain_index(path: Path, index: Dict[str, List[str]]) -> None:
+    """
+    Schreibt den Index atomar, damit parallel startende Worker nie eine halbe
+    Datei lesen.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"fundus_version": fundus_version(), "domains": index}
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_domain_index(directory: Optional[Path]) -> Dict[str, List[str]]:
+    """
+    Lädt den gespeicherten Index der installierten Fundus-Version.
+
+    Fehlt die Datei oder ist sie unlesbar, wird der Index neu gebaut und
+    – soweit das Verzeichnis beschreibbar ist – gespeichert. Ohne Verzeichnis
+    wird er nur im Speicher aufgebaut.
+    """
+    if directory is None:
+        return build_domain_index()
+
+    path = index_path(directory)
+    try:
+        with path.open(encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("fundus_version") == fundus_version():
+            return payload["domains"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as exc:
+        logger.warning("Ignoring unreadable publisher index %s: %s", path, exc)
+
+    index = build_domain_index()
+    try:
+        write_domain_index(path, index)
+    except OSError as exc:
+        logger.warning("Could not store publisher index at %s: %s", path, exc)
+    return index
+
+
+def resolve_publishers(
+    index: Dict[str, List[str]], supported_languages: Iterable[str]
+) -> Dict[str, Publisher]:
+    """
+    Setzt den gespeicherten Index in Root-Domain → Publisher um und behält nur
+    Publisher, die in einer der unterstützten Sprachen veröffentlichen.
+
+    Teilen sich mehrere passende Publisher eine Root-Domain, gewinnt wie beim
+    direkten Durchlauf der Collection der zuletzt aufgeführte.
+    """
+    languages = set(supported_languages)
+    by_name = {publisher.__name__: publisher for publisher in iter_publishers()}
+    publisher_map: Dict[str, Publisher] = {}
+    for root, names in index.items():
+        for name in names:
+            publisher = by_name.get(name)
+            if publisher is None or publisher.languages.isdisjoint(languages):
+                continue
+            publisher_map[root] = publisher
+    return publisher_map
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Precomputes the publisher domain index for the installed Fundus version."
+    )
+    parser.add_argument("--output-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.output_dir is None:
+        from app.core.config import Settings
+
+        args.output_dir = Settings().PUBLISHER_INDEX_DIR
+
+    path = index_path(args.output_dir)
+    index = build_domain_index()
+    write_domain_index(path, index)
+    print(f"Wrote {len(index)} domains to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,41 @@
+import json
+import time
+from types import SimpleNamespace
 from typing import List
 
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 import pytest
 from unittest.mock import patch
 
 
-from app.main import app, model
-from app.domain import Label, PredictionResult, TokenContribution
+from app.core.detector import FakeNewsDetector
+from app.main import app, build_language_detector, model
+from app.domain import (
+    AggregationStrategy,
+    ChunkedPredictionResult,
+    ChunkPrediction,
+    HighlightMode,
+    HighlightResult,
+    Label,
+    Language,
+    PredictionResult,
+    TokenContribution,
+)
 from app.schemas import FactCheckResponse
+from app.services.language_service import LanguageDetectionService
 
 
 class MockArticleExtractor:
     def __init__(self, *args, **kwargs):
         self.calls = []
 
+    async def process_async(self, user_input: str):
+        return self.process(user_input)
+
+    async def aclose(self):
+        pass
+
     def process(self, user_input: str):
         self.calls.append(user_input)
         if "fail" in user_input:
@@ -47,21 +69,73 @@ class MockArticleExtractor:
 
 
 class MockFakeNewsDetector:
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         self.last_predict_input = None
         self.last_highlight_input = None
+        self.last_highlight_mode = None
+
+    def load_explainers(self) -> None:
+        self.explainers_loaded = True
 
-    def predict(self, text: str) -> PredictionResult:
+    def detect_language(self, text: str) -> Language:
+        if text.startswith("Bonjour"):
+            raise HTTPException(
+                status_code=422, detail="Language has to be either German or English. Got fr."
+            )
+        return Language.EN
+
+    def predict(self, text: str, language: Language | None = None) -> PredictionResult:
         self.last_predict_input = text
         return PredictionResult(label=Label.FAKE, score=0.95)
 
-    def highlight(self, text: str) -> List[TokenContribution]:
+    def predict_batch(
+        self, texts: List[str], language: Language
+    ) -> List[PredictionResult]:
+        self.last_batch_size = len(texts)
+        return [self.predict(text) for text in texts]
+
+    def predict_chunked(
+        self,
+        text: str,
+        language: Language | None = None,
+        strategy: AggregationStrategy = AggregationStrategy.MEAN,
+        **kwargs,
+    ) -> ChunkedPredictionResult:
+        self.last_chunked_strategy = strategy
+        chunks = [
+            ChunkPrediction(0, 510, Label.FAKE, 0.9, 0.9),
+            ChunkPrediction(1, 120, Label.REAL, 0.7, 0.3),
+        ]
+        return ChunkedPredictionResult(
+            prediction=PredictionResult(label=Label.FAKE, score=0.6),
+            chunks=chunks,
+            total_tokens=630,
+        )
+
+    def highlight(
+        self,
+        text: str,
+        language: Language | None = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> List[TokenContribution]:
         self.last_highlight_input = text
+        self.last_highlight_mode = mode
         return [
             TokenContribution("Fake", 0.9, 0.9),
             TokenContribution("Article", 0.1, 0.1),
         ]
 
+    def explain(
+        self,
+        text: str,
+        language: Language | None = None,
+        mode: HighlightMode = HighlightMode.EXACT,
+    ) -> HighlightResult:
+        return HighlightResult(
+            highlights=self.highlight(text, language=language, mode=mode),
+            prediction=PredictionResult(label=Label.FAKE, score=0.95),
+        )
+
 
 class MockFactCheckAgent:
     def __init__(self):
@@ -76,17 +150,38 @@ class MockFactCheckAgent:
         )
 
 
+def _wait_until_ready(client: TestClient, timeout: float = 10.0) -> None:
+    # Models load in the background, requests need all of them to be available.
+    deadline = time.monotonic() + timeout
+    while not client.get("/ready").json().get("finished"):
+        assert time.monotonic() < deadline, "Components did not become ready"
+        time.sleep(0.01)
+
+
 @pytest.fixture(scope="module")
 def client():
     with patch("app.main.FakeNewsDetector", new=MockFakeNewsDetector):
         with patch("app.main.FactCheckAgent", new=MockFactCheckAgent):
             with patch("app.main.ArticleExtractor", new=MockArticleExtractor):
                 with TestClient(app) as c:
+                    _wait_until_ready(c)
                     yield c
 
     model.clear()
 
 
+def test_ready_reports_component_load_times(client):
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ready"] is True
+    assert data["components"]["detector"]["status"] == "ready"
+    assert data["components"]["article_extractor"]["seconds"] is not None
+    assert data["components"]["explainers"]["required"] is False
+    assert model["detector"].explainers_loaded is True
+
+
 def test_predict_endpoint_success(client):
     payload = {"text": "Fake Article."}
 
@@ -116,6 +211,21 @@ def test_highlight_endpoint_success(client):
     assert isinstance(data["highlights"], list)
     assert len(data["highlights"]) == 2
     assert data["highlights"][0]["token"] == "Fake"
+    assert data["prediction_result"]["label"] == Label.FAKE
+    assert data["confidence_fake"] == pytest.approx(0.95)
+
+
+def test_highlight_fast_mode_is_passed_to_detector(client):
+    response = client.post("/api/highlight?mode=fast", json={"text": "Fake Article."})
+
+    assert response.status_code == 200
+    assert model["detector"].last_highlight_mode == HighlightMode.FAST
+
+
+def test_highlight_invalid_mode(client):
+    response = client.post("/api/highlight?mode=slow", json={"text": "Fake Article."})
+
+    assert response.status_code == 422
 
 
 def test_fact_check_endpoint_success(client):
@@ -131,6 +241,18 @@ def test_fact_check_endpoint_success(client):
     assert isinstance(data["checked_claims"], list)
 
 
+def test_predict_chunked_returns_chunk_scores(client):
+    response = client.post(
+        "/api/predict?chunked=true&aggregation=max_fake", json={"text": "Fake Article."}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["confidence_fake"] == pytest.approx(0.6)
+    assert [chunk["fake_score"] for chunk in data["chunks"]] == [0.9, 0.3]
+    assert model["detector"].last_chunked_strategy == AggregationStrategy.MAX_FAKE
+
+
 def test_predict_validation_error(client):
     response = client.post("/api/predict", json={})
 
@@ -169,3 +291,149 @@ def test_fact_check_uses_extracted_text(client):
 
     assert response.status_code == 200
     assert model["fact_checker"].last_text == "Extracted article body"
+
+
+def test_predict_reports_server_timing(client):
+    response = client.post("/api/predict", json={"text": "Fake Article."})
+
+    assert response.status_code == 200
+    assert "extraction;dur=" in response.headers["Server-Timing"]
+
+
+def test_metrics_report_prediction_batches(client):
+    client.post("/api/predict", json={"text": "Fake Article."})
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    batching = response.json()["batching"]
+    assert batching["en"]["requests"] >= 1
+    assert batching["en"]["batches"] >= 1
+
+
+def test_predict_batch_returns_per_item_results(client):
+    texts = ["A first article text.", "fail-url", "https://example.com/article"]
+
+    response = client.post("/api/predict/batch", json={"texts": texts})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["index"] for item in data["results"]] == [0, 1, 2]
+    assert data["succeeded"] == 2
+    assert data["failed"] == 1
+    assert data["results"][0]["result"]["prediction_result"]["label"] == Label.FAKE
+    assert data["results"][0]["language"] == Language.EN
+    assert data["results"][1]["status"] == "error"
+    assert data["results"][1]["error"] == "Extraction failed"
+    # Both successful items went through the classifier in one batch.
+    assert model["detector"].last_batch_size == 2
+
+
+def test_predict_batch_unsupported_language_only_fails_its_item(client):
+    texts = ["A first article text.", "Bonjour tout le monde.", "A second article text."]
+
+    response = client.post("/api/predict/batch", json={"texts": texts})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["status"] for item in data["results"]] == ["ok", "error", "ok"]
+    assert data["results"][1]["status_code"] == 422
+    assert data["succeeded"] == 2
+    assert model["detector"].last_batch_size == 2
+
+
+def test_predict_batch_fails_items_when_executor_rejects_detection(client):
+    executor = app.state.inference_executors["predict"]
+    rejected = HTTPException(status_code=503, detail="Inference queue is full.")
+    texts = ["A first article text.", "fail-url", "A second article text."]
+
+    with patch.object(executor, "run", side_effect=rejected):
+        response = client.post(
+            "/api/predict/batch",
+            json={"texts": texts},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    items = sorted(lines[:-1], key=lambda item: item["index"])
+    assert [item["status_code"] for item in items] == [503, 400, 503]
+    assert lines[-1]["done"] is True
+    assert lines[-1]["failed"] == 3
+
+
+def test_predict_batch_streams_ndjson(client):
+    texts = [f"Article number {i}." for i in range(5)]
+
+    response = client.post(
+        "/api/predict/batch",
+        json={"texts": texts},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert sorted(line["index"] for line in lines[:-1]) == list(range(5))
+    assert lines[-1]["done"] is True
+    assert lines[-1]["succeeded"] == 5
+
+
+def test_analyze_streams_all_stages_with_single_extraction(client):
+    extractor = model["article_extractor"]
+    calls_before = len(extractor.calls)
+
+    response = client.post("/api/analyze", json={"text": "https://example.com/article"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines() if line]
+    by_stage = {event["stage"]: event for event in events}
+
+    assert set(by_stage) == {"prediction", "highlight", "fact_check", "done"}
+    assert events[-1]["stage"] == "done"
+    assert by_stage["prediction"]["result"]["prediction_result"]["label"] == Label.FAKE
+    assert by_stage["highlight"]["result"]["highlights"][0]["token"] == "Fake"
+    assert by_stage["fact_check"]["result"]["fake_score"] == pytest.approx(0.4)
+    assert len(extractor.calls) == calls_before + 1
+    assert model["fact_checker"].last_text == "Extracted article body"
+
+
+def test_analyze_can_skip_stages(client):
+    response = client.post(
+        "/api/analyze?highlight=false&fact_check=false", json={"text": "Fake Article."}
+    )
+
+    stages = [json.loads(line)["stage"] for line in response.text.splitlines() if line]
+    assert stages == ["prediction", "done"]
+
+
+def test_analyze_extraction_failure_returns_error(client):
+    response = client.post("/api/analyze", json={"text": "fail-url"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Regeringen meddelade på måndagen att den nya lagen träder i kraft nästa år "
+        "och att kommunerna får mer pengar till skolor och sjukvård.",
+        "Pemerintah mengumumkan pada hari Senin bahwa undang-undang baru akan mulai "
+        "berlaku tahun depan dan pemerintah daerah akan menerima lebih banyak uang.",
+    ],
+)
+def test_serving_language_detector_rejects_similar_languages(text):
+    # Swedish and Indonesian used to be reported as German and English.
+    detector = SimpleNamespace(
+        language_detector=build_language_detector(), language_prefix_chars=2000
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        FakeNewsDetector.detect_language(detector, text)
+    assert exc.value.status_code == 422
+
+
+def test_language_detector_needs_two_valid_candidates():
+    with pytest.raises(ValueError):
+        LanguageDetectionService(restrict_to=["en", "xx"])
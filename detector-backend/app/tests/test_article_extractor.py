@@ -0,0 +1,316 @@
+import asyncio
+import threading
+from contextlib import nullcontext
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.cache import ExtractionCache
+from app.services import article_extractor as article_extractor_module
+from app.services import publisher_index
+from app.services.article_extractor import ArticleExtractor
+from app.services.article_fetcher import FetchedPage
+
+
+def _fake_extraction(delays, running, peak):
+    lock = threading.Lock()
+
+    def extract(url):
+        host = url.split("/")[2]
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), running[host])
+        time.sleep(delays.get(url, 0.05))
+        with lock:
+            running[host] -= 1
+        return {
+            "success": True,
+            "input_type": "url",
+            "publisher": host,
+            "title": f"Title {url}",
+            "text": f"Text {url}",
+            "error": None,
+        }
+
+    return extract
+
+
+def test_multi_url_extraction_runs_in_parallel_and_keeps_order(monkeypatch):
+    extractor = ArticleExtractor({"de", "en"}, max_workers=4, per_host_limit=2)
+    urls = [
+        "https://www.spiegel.de/a",
+        "https://www.zeit.de/b",
+        "https://www.tagesschau.de/c",
+    ]
+    delays = {urls[0]: 0.3, urls[1]: 0.1, urls[2]: 0.2}
+    monkeypatch.setattr(
+        extractor, "_extract_article_with_fundus", _fake_extraction(delays, {}, {})
+    )
+
+    started = time.perf_counter()
+    result = extractor.process("\n".join(urls))
+    elapsed = time.perf_counter() - started
+
+    assert result["success"] is True
+    assert result["input_type"] == "multi_url"
+    assert result["text"].split("\n\n") == [f"Text {url}" for url in urls]
+    assert result["title"] == f"Title {urls[0]}"
+    assert [article["url"] for article in result["articles"]] == urls
+    assert result["articles"][0]["seconds"] >= 0.3
+    assert elapsed < 0.55
+
+
+def test_multi_url_extraction_limits_requests_per_host(monkeypatch):
+    extractor = ArticleExtractor({"de", "en"}, max_workers=8, per_host_limit=2)
+    urls = [f"https://www.spiegel.de/article-{i}" for i in range(6)]
+    peak = {}
+    monkeypatch.setattr(
+        extractor, "_extract_article_with_fundus", _fake_extraction({}, {}, peak)
+    )
+
+    result = extractor.process("\n".join(urls))
+
+    assert result["success"] is True
+    assert peak["www.spiegel.de"] == 2
+
+
+def test_multi_url_extraction_reports_urls_missing_the_deadline(monkeypatch):
+    extractor = ArticleExtractor(
+        {"de", "en"}, max_workers=4, multi_url_timeout_seconds=0.2
+    )
+    urls = ["https://www.spiegel.de/slow", "https://www.zeit.de/fast"]
+    delays = {urls[0]: 1.0, urls[1]: 0.01}
+    monkeypatch.setattr(
+        extractor, "_extract_article_with_fundus", _fake_extraction(delays, {}, {})
+    )
+
+    result = extractor.process("\n".join(urls))
+
+    assert result["success"] is False
+    assert result["text"] == f"Text {urls[1]}"
+    assert "Zeitlimit" in result["articles"][0]["error"]
+    assert result["articles"][1]["success"] is True
+
+
+class FakeResponse:
+    def __init__(self, url, status_code, headers, body=b""):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.encoding = "utf-8"
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FakeSession:
+    def __init__(self):
+        self.requests = []
+        self.not_modified = False
+        self.response_headers = {}
+        self.body = b"<html>Artikel</html>"
+
+    def get_with_interrupt(self, url, headers, stream=False):
+        self.requests.append((url, headers))
+        if self.not_modified and "If-None-Match" in headers:
+            return FakeResponse(url, 304, {})
+        return FakeResponse(
+            # The publisher redirects to the canonical article URL.
+            "https://www.spiegel.de/politik/artikel-123.html",
+            200,
+            {
+                "ETag": '"v1"',
+                "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                **self.response_headers,
+            },
+            self.body,
+        )
+
+
+@pytest.fixture
+def cached_extractor(monkeypatch):
+    extractor = ArticleExtractor({"de", "en"}, cache=ExtractionCache(max_size=16))
+    publisher = extractor._find_publisher_for_url("www.spiegel.de")
+    session = FakeSession()
+
+    fake_parser = SimpleNamespace(
+        parse=lambda content, error_handling: {"title": "Titel", "text": content}
+    )
+    monkeypatch.setattr(publisher, "robots", None)
+    monkeypatch.setattr(
+        extractor._parsers, "parser", lambda publisher: nullcontext(fake_parser)
+    )
+    monkeypatch.setattr(
+        article_extractor_module,
+        "Article",
+        lambda html, **extraction: SimpleNamespace(
+            title=extraction["title"], plaintext=extraction["text"]
+        ),
+    )
+    monkeypatch.setattr(
+        article_extractor_module.session_handler, "get_session", lambda: session
+    )
+    return extractor, session
+
+
+def test_extraction_cache_serves_tracking_and_redirect_variants(cached_extractor):
+    extractor, session = cached_extractor
+
+    first = extractor.process("https://spiegel.de/a?utm_source=twitter")
+    same_article = extractor.process("http://www.spiegel.de/a#comments")
+    redirect_target = extractor.process("https://www.spiegel.de/politik/artikel-123.html")
+
+    assert first["text"] == "<html>Artikel</html>"
+    assert same_article == first
+    assert redirect_target == first
+    assert len(session.requests) == 1
+
+
+def test_extraction_cache_revalidates_stale_entries(cached_extractor):
+    extractor, session = cached_extractor
+    extractor.cache.fresh_seconds = 0
+    session.not_modified = True
+
+    first = extractor.process("https://www.spiegel.de/a")
+    revalidated = extractor.process("https://www.spiegel.de/a")
+
+    assert revalidated == first
+    assert len(session.requests) == 2
+    assert session.requests[1][1]["If-None-Match"] == '"v1"'
+    assert session.requests[1][1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class FakeRobots:
+    loads = 0
+
+    def __init__(self, url, headers=None):
+        self.url = url
+
+    def ensure_ready(self):
+        FakeRobots.loads += 1
+
+    def can_fetch(self, user_agent, url):
+        return "/private/" not in url
+
+
+def test_parser_registry_leases_separate_parsers_concurrently():
+    extractor = ArticleExtractor({"de", "en"})
+    publisher = extractor._find_publisher_for_url("www.spiegel.de")
+    registry = extractor._parsers
+    # No parser is created before the first lease.
+    assert all(pool.empty() for pool in registry._parsers.values())
+
+    with registry.parser(publisher) as first:
+        with registry.parser(publisher) as second:
+            assert first is not second
+    with registry.parser(publisher) as reused:
+        assert reused in (first, second)
+
+
+def test_parser_registry_caches_and_refreshes_robots(monkeypatch):
+    monkeypatch.setattr(article_extractor_module, "Robots", FakeRobots)
+    FakeRobots.loads = 0
+    extractor = ArticleExtractor({"de", "en"}, robots_refresh_seconds=0.05)
+    publisher = extractor._find_publisher_for_url("www.spiegel.de")
+    registry = extractor._parsers
+
+    assert registry.can_fetch(publisher, "https://www.spiegel.de/a") is True
+    assert registry.can_fetch(publisher, "https://www.spiegel.de/private/b") is False
+    assert FakeRobots.loads == 1
+
+    time.sleep(0.1)
+    # Stale rules are still answered right away and reloaded in the background.
+    assert registry.can_fetch(publisher, "https://www.spiegel.de/a") is True
+    deadline = time.monotonic() + 2
+    while FakeRobots.loads < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert FakeRobots.loads == 2
+
+
+def test_publisher_index_is_stored_per_fundus_version(tmp_path, monkeypatch):
+    reference = ArticleExtractor({"de", "en"})
+    ArticleExtractor({"de", "en"}, publisher_index_dir=tmp_path)
+    assert publisher_index.index_path(tmp_path).exists()
+
+    def no_rebuild():
+        raise AssertionError("index should be loaded, not rebuilt")
+
+    monkeypatch.setattr(publisher_index, "build_domain_index", no_rebuild)
+    loaded = ArticleExtractor({"de", "en"}, publisher_index_dir=tmp_path)
+    assert loaded._publisher_map == reference._publisher_map
+    assert loaded._find_publisher_for_url("amp.spiegel.de") is not None
+
+    # A new Fundus version gets its own index file.
+    monkeypatch.undo()
+    monkeypatch.setattr(publisher_index, "fundus_version", lambda: "0.0.0-test")
+    ArticleExtractor({"de"}, publisher_index_dir=tmp_path)
+    assert publisher_index.index_path(tmp_path, "0.0.0-test").exists()
+
+
+def test_root_domain_uses_the_bundled_suffix_list():
+    assert publisher_index.root_domain("news.bbc.co.uk") == "bbc.co.uk"
+    assert publisher_index.root_domain("localhost") is None
+    assert publisher_index._OFFLINE_EXTRACT.suffix_list_urls == ()
+
+
+def test_async_extraction_uses_the_fetcher_and_cache(cached_extractor, monkeypatch):
+    extractor, session = cached_extractor
+    fetched = []
+
+    async def fetch(url, headers):
+        fetched.append(url)
+        await asyncio.sleep(0.01)
+        return FetchedPage(
+            url="https://www.spiegel.de/politik/artikel-123.html",
+            status_code=200,
+            headers={},
+            text=f"<html>{url}</html>",
+        )
+
+    monkeypatch.setattr(extractor.fetcher, "fetch", fetch)
+
+    async def scenario():
+        multi = await extractor.process_async(
+            "https://www.spiegel.de/a\nhttps://www.spiegel.de/b"
+        )
+        single = await extractor.process_async("https://www.spiegel.de/a?utm_medium=x")
+        return multi, single
+
+    multi, single = asyncio.run(scenario())
+
+    assert multi["success"] is True
+    assert [article["url"] for article in multi["articles"]] == [
+        "https://www.spiegel.de/a",
+        "https://www.spiegel.de/b",
+    ]
+    assert single["text"] == "<html>https://www.spiegel.de/a</html>"
+    assert sorted(fetched) == ["https://www.spiegel.de/a", "https://www.spiegel.de/b"]
+    assert session.requests == []
+
+
+def test_sync_extraction_rejects_oversized_and_non_html_pages(cached_extractor):
+    extractor, session = cached_extractor
+    extractor.fetcher.max_response_bytes = 1024
+
+    session.body = b"x" * 4096
+    too_large = extractor.process("https://www.spiegel.de/gross")
+    session.body = b"%PDF-1.7"
+    session.response_headers = {"Content-Type": "application/pdf"}
+    pdf = extractor.process("https://www.spiegel.de/dokument.pdf")
+
+    assert too_large["success"] is False
+    assert "größer als 1 KiB" in too_large["error"]
+    assert pdf["success"] is False
+    assert "keine HTML-Seite" in pdf["error"]
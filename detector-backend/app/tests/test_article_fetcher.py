@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app.services.article_fetcher import (
+    AsyncArticleFetcher,
+    FetchError,
+    ResponseTooLargeError,
+    UnsupportedContentTypeError,
+    read_limited_text,
+)
+
+
+class ArticleHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        ArticleHandler.connections.add(self.client_address)
+        if self.path == "/slow":
+            time.sleep(1)
+        if self.path == "/stream":
+            # No Content-Length, the body ends when the connection closes.
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for _ in range(256):
+                self.wfile.write(b"x" * 1024)
+            self.close_connection = True
+            return
+
+        body = "<html>Grüße aus Köln</html>".encode("latin-1")
+        content_type = "text/html; charset=iso-8859-1"
+        if self.path == "/large":
+            body = b"x" * 64 * 1024
+        if self.path == "/feed":
+            content_type = "application/rss+xml"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class QuietServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients that gave up early (timeouts, size limit) break the pipe.
+        pass
+
+
+@pytest.fixture
+def server_url():
+    ArticleHandler.connections = set()
+    server = QuietServer(("127.0.0.1", 0), ArticleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch(fetcher, *urls):
+    async def scenario():
+        try:
+            return [await fetcher.fetch(url, {}) for url in urls]
+        finally:
+            await fetcher.aclose()
+
+    return asyncio.run(scenario())
+
+
+def test_fetcher_decodes_pages_and_reuses_connections(server_url):
+    fetcher = AsyncArticleFetcher()
+
+    pages = _fetch(fetcher, f"{server_url}/a", f"{server_url}/b", f"{server_url}/c")
+
+    assert [page.text for page in pages] == ["<html>Grüße aus Köln</html>"] * 3
+    assert pages[0].status_code == 200
+    assert len(ArticleHandler.connections) == 1
+
+
+def test_fetcher_rejects_oversized_pages(server_url):
+    fetcher = AsyncArticleFetcher(max_response_bytes=16 * 1024)
+
+    with pytest.raises(FetchError, match="größer als 16 KiB"):
+        _fetch(fetcher, f"{server_url}/large")
+    with pytest.raises(FetchError, match="größer als 16 KiB"):
+        _fetch(fetcher, f"{server_url}/stream")
+
+
+def test_fetcher_rejects_non_html_responses(server_url):
+    with pytest.raises(UnsupportedContentTypeError, match="application/rss"):
+        _fetch(AsyncArticleFetcher(), f"{server_url}/feed")
+
+
+def test_read_limited_text_stops_sync_downloads_early(server_url):
+    response = requests.get(f"{server_url}/stream", stream=True)
+
+    with pytest.raises(ResponseTooLargeError):
+        read_limited_text(response, max_bytes=16 * 1024)
+    assert response.raw.tell() < 256 * 1024
+
+
+def test_fetcher_applies_read_timeout(server_url):
+    fetcher = AsyncArticleFetcher(read_timeout_seconds=0.2)
+
+    with pytest.raises(FetchError, match="Zeitüberschreitung"):
+        _fetch(fetcher, f"{server_url}/slow")
@@ -0,0 +1,42 @@
+import asyncio
+
+from app.core.batching import MicroBatcher
+
+
+def test_micro_batcher_groups_concurrent_requests():
+    calls = []
+
+    def run_batch(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    async def scenario():
+        batcher = MicroBatcher(run_batch, max_batch_size=4, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(t) for t in "abcde"))
+        await batcher.close()
+        return batcher, results
+
+    batcher, results = asyncio.run(scenario())
+
+    assert results == ["A", "B", "C", "D", "E"]
+    assert [len(batch) for batch in calls] == [4, 1]
+    assert batcher.metrics.batches == 2
+    assert batcher.metrics.max_batch_size == 4
+
+
+def test_micro_batcher_propagates_errors_to_all_callers():
+    def run_batch(texts):
+        raise RuntimeError("model failure")
+
+    async def scenario():
+        batcher = MicroBatcher(run_batch, max_batch_size=2, max_wait_ms=10)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.close()
+        return batcher, results
+
+    batcher, results = asyncio.run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert batcher.metrics.failed_batches == 1
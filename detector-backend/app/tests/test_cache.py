@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.core.cache import (
+    ExtractionCache,
+    LRUCache,
+    ResultCache,
+    canonicalize_url,
+    normalize_text,
+)
+from app.core.detector import FakeNewsDetector
+from app.domain import InferenceBackend
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    cache = LRUCache(max_size=2, ttl_seconds=10)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("app.core.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+
+def test_result_cache_key_depends_on_content_and_model():
+    text = normalize_text("Breaking   news\n today ")
+    key = ResultCache.make_key("predict", text, "model-a", "rev1")
+
+    assert text == "Breaking news today"
+    assert key == ResultCache.make_key("predict", "Breaking news today", "model-a", "rev1")
+    assert key != ResultCache.make_key("predict", text, "model-a", "rev2")
+    assert key != ResultCache.make_key("highlight", text, "model-a", "rev1")
+
+
+def test_detector_cache_key_does_not_tokenize():
+    def tokenize(*args, **kwargs):
+        raise AssertionError("cache keys must not run the tokenizer")
+
+    detector = FakeNewsDetector.__new__(FakeNewsDetector)
+    detector.result_cache = ResultCache(max_size=4)
+    detector.backend = InferenceBackend.TORCH
+    config = SimpleNamespace(name_or_path="model-a", _commit_hash="rev1")
+    pipe = SimpleNamespace(
+        model=SimpleNamespace(config=config),
+        tokenizer=SimpleNamespace(encode=tokenize, decode=tokenize),
+    )
+
+    key = detector._cache_key("predict", "Breaking   news\n today ", pipe)
+
+    assert key == detector._cache_key("predict", "Breaking news today", pipe)
+    assert key == ResultCache.make_key(
+        "predict", "Breaking news today", "model-a", f"rev1:{InferenceBackend.TORCH.value}"
+    )
+    detector.backend = InferenceBackend.ONNX
+    assert key != detector._cache_key("predict", "Breaking news today", pipe)
+
+
+def test_result_cache_counts_hits_and_misses():
+    cache = ResultCache(max_size=4)
+
+    assert cache.get("key") is None
+    cache.set("key", {"label": "fake", "score": 0.9})
+
+    assert cache.get("key") == {"label": "fake", "score": 0.9}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_canonicalize_url_strips_tracking_and_normalizes_host():
+    assert (
+        canonicalize_url("http://WWW.Spiegel.de:80/politik/a.html?utm_source=x&b=2&a=1#top")
+        == "https://spiegel.de/politik/a.html?a=1&b=2"
+    )
+    assert canonicalize_url("spiegel.de") == "https://spiegel.de/"
+    assert canonicalize_url("https://zeit.de/a?fbclid=1") == "https://zeit.de/a"
+    assert canonicalize_url("https://zeit.de/a?page=2") != canonicalize_url("https://zeit.de/a")
+
+
+def test_extraction_cache_key_depends_on_parser_version():
+    cache = ExtractionCache(max_size=4, parser_version="0.5.3")
+    cache.set(["https://zeit.de/a"], {"text": "Artikel"}, etag='"v1"')
+    updated = ExtractionCache(max_size=4, parser_version="0.5.4")
+
+    entry = cache.get("https://www.zeit.de/a?utm_medium=social")
+
+    assert entry["result"] == {"text": "Artikel"}
+    assert entry["etag"] == '"v1"'
+    assert cache.is_fresh(entry)
+    assert updated._key("https://zeit.de/a") != cache._key("https://zeit.de/a")
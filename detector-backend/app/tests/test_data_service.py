@@ -0,0 +1,169 @@
+import os
+import signal
+from types import SimpleNamespace
+
+import pandas as pd
+from pymongo import DeleteMany, UpdateOne
+
+from app.pipelines.base_pipeline import BaseDataPipeline
+from app.services.data_service import DataService, ImportStats
+
+
+class FakeArticlesCollection:
+    """
+    Applies the upserts and deletes of the incremental import to a dict.
+    """
+
+    def __init__(self, documents=()):
+        self.documents = list(documents)
+        self.written = 0
+
+    def create_index(self, keys):
+        pass
+
+    def find(self, query, projection):
+        return [
+            doc
+            for doc in self.documents
+            if doc["dataset"] == query["dataset"] and "article_key" in doc
+        ]
+
+    def bulk_write(self, operations, ordered):
+        deleted = 0
+        for operation in operations:
+            if isinstance(operation, UpdateOne):
+                self.written += 1
+                key = operation._filter["article_key"]
+                self.documents = [
+                    doc for doc in self.documents if doc.get("article_key") != key
+                ]
+                self.documents.append(operation._doc["$set"])
+            else:
+                assert isinstance(operation, DeleteMany)
+                condition = operation._filter["article_key"]
+                keep = []
+                for doc in self.documents:
+                    if "$in" in condition:
+                        matches = doc.get("article_key") in condition["$in"]
+                    else:
+                        matches = "article_key" not in doc
+                    if matches and doc["dataset"] == operation._filter["dataset"]:
+                        deleted += 1
+                    else:
+                        keep.append(doc)
+                self.documents = keep
+        return SimpleNamespace(deleted_count=deleted)
+
+
+class TwoChunkPipeline(BaseDataPipeline):
+    def _load_data(self, chunksize=None):
+        return iter(
+            [
+                pd.DataFrame([_row(f"{self.dataset_name} {i}") for i in range(3)]),
+                pd.DataFrame([_row(f"{self.dataset_name} {i}") for i in range(3, 5)]),
+            ]
+        )
+
+    def _run_processing(self, df):
+        return df
+
+
+class BrokenPipeline(TwoChunkPipeline):
+    def _run_processing(self, df):
+        if df["text"].iloc[0].endswith(" 3"):
+            raise RuntimeError("corrupt source file")
+        return df
+
+
+class CrashingPipeline(TwoChunkPipeline):
+    def _run_processing(self, df):
+        if df["text"].iloc[0].endswith(" 3"):
+            # Dies like an OOM kill, without a Python exception.
+            os.kill(os.getpid(), signal.SIGKILL)
+        return df
+
+
+def _import(coll, rows):
+    service = DataService()
+    service.db = SimpleNamespace(get_articles_collection=lambda: coll)
+    df = pd.DataFrame(rows)
+    df["dataset"] = "welfake"
+    pipeline = SimpleNamespace(dataset_name="welfake", process_chunks=lambda: iter([df]))
+    return service.import_to_mongo(pipeline)
+
+
+def _row(text, label="fake", title=None):
+    return {"title": title, "text": text, "label": label, "language": "en"}
+
+
+def test_incremental_import_only_writes_changes():
+    legacy = {"dataset": "welfake", "text": "old import", "label": "fake"}
+    coll = FakeArticlesCollection([legacy])
+
+    first = _import(coll, [_row("a"), _row("b"), _row("c")])
+    assert first == ImportStats(inserted=3, removed=1)
+
+    coll.written = 0
+    rerun = _import(coll, [_row("a"), _row("b"), _row("c")])
+    assert rerun == ImportStats(unchanged=3)
+    assert coll.written == 0
+
+    changed = _import(coll, [_row("a"), _row("b", label="real"), _row("d")])
+    assert changed == ImportStats(inserted=1, updated=1, unchanged=1, removed=1)
+    assert sorted(doc["text"] for doc in coll.documents) == ["a", "b", "d"]
+    assert next(doc for doc in coll.documents if doc["text"] == "b")["label"] == "real"
+
+
+def test_incremental_import_stores_missing_values_as_none():
+    coll = FakeArticlesCollection()
+
+    _import(coll, [_row("a", title=pd.NA), _row("b", title="Title")])
+
+    titles = {doc["text"]: doc["title"] for doc in coll.documents}
+    assert titles == {"a": None, "b": "Title"}
+
+
+def test_parallel_run_isolates_failing_pipelines():
+    coll = FakeArticlesCollection()
+    service = DataService(workers=2)
+    service.db = SimpleNamespace(get_articles_collection=lambda: coll)
+    service.PIPELINES = {"first": TwoChunkPipeline, "broken": BrokenPipeline}
+
+    reports = {report.name: report for report in service.run_and_import_all_pipelines()}
+
+    assert reports["first"].status == "ok"
+    assert reports["first"].rows == 5
+    assert reports["first"].import_stats == ImportStats(inserted=5)
+    assert reports["first"].seconds > 0
+    assert reports["first"].peak_rss_mb > 0
+
+    assert reports["broken"].status == "failed"
+    assert "corrupt source file" in reports["broken"].error
+    assert reports["broken"].import_stats is None
+    # The chunk before the failure was imported, nothing was removed.
+    assert sorted(doc["text"] for doc in coll.documents if doc["dataset"] == "broken") == [
+        "broken 0",
+        "broken 1",
+        "broken 2",
+    ]
+
+
+def test_parallel_run_isolates_crashing_pipeline_processes():
+    coll = FakeArticlesCollection()
+    service = DataService(workers=2)
+    service.db = SimpleNamespace(get_articles_collection=lambda: coll)
+    service.PIPELINES = {
+        "crashing": CrashingPipeline,
+        "first": TwoChunkPipeline,
+        "second": TwoChunkPipeline,
+    }
+
+    reports = {report.name: report for report in service.run_and_import_all_pipelines()}
+
+    assert reports["crashing"].status == "failed"
+    assert f"exit code {-signal.SIGKILL}" in reports["crashing"].error
+    assert reports["crashing"].rows == 3
+    assert reports["crashing"].import_stats is None
+    for name in ("first", "second"):
+        assert reports[name].status == "ok"
+        assert reports[name].import_stats == ImportStats(inserted=5)
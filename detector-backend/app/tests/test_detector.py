@@ -1,7 +1,16 @@
 import pytest
+from fastapi import HTTPException
 
 from app.core.detector import FakeNewsDetector
-from app.domain import Label, TokenContribution, PredictionResult
+from app.domain import (
+    AggregationStrategy,
+    ChunkPrediction,
+    HighlightMode,
+    InferenceBackend,
+    Label,
+    TokenContribution,
+    PredictionResult,
+)
 
 
 @pytest.fixture(scope="module")
@@ -34,6 +43,35 @@ def test_highlight_structure(detector):
     assert isinstance(first_token.score_normalized, float)
 
 
+def test_explain_returns_prediction_of_same_run(detector):
+    text = "Donald Trump left the office."
+
+    result = detector.explain(text)
+
+    assert isinstance(result.prediction, PredictionResult)
+    assert result.prediction.label == detector.predict(text).label
+    assert 0.0 <= result.prediction.score <= 1.0
+
+
+def test_highlight_fast_mode_structure(detector):
+    text = "Donald Trump left the office."
+
+    highlights = detector.highlight(text, mode=HighlightMode.FAST)
+
+    assert len(highlights) == len(text.split())
+    assert highlights[0].token == "Donald"
+    assert max(abs(h.score_normalized) for h in highlights) == pytest.approx(1.0)
+
+
+def test_fast_highlight_requires_torch_backend(detector, monkeypatch):
+    monkeypatch.setattr(detector, "backend", InferenceBackend.ONNX)
+
+    with pytest.raises(HTTPException) as exc:
+        detector.highlight("Donald Trump left the office.", mode=HighlightMode.FAST)
+
+    assert exc.value.status_code == 400
+
+
 def test_merge_tokens_to_words(detector):
     original = "Donald Trump left the office."
 
@@ -58,3 +96,30 @@ def test_merge_tokens_to_words(detector):
     assert result[4].score == pytest.approx(0.1) and result[
         4
     ].score_normalized == pytest.approx(0.1)
+
+
+def test_predict_chunked_covers_long_text(detector):
+    text = " ".join(["Donald Trump left the office."] * 300)
+
+    result = detector.predict_chunked(text, max_chunks=3)
+
+    assert 1 < len(result.chunks) <= 3
+    assert result.total_tokens > 512
+    assert isinstance(result.prediction.label, Label)
+
+
+def test_aggregate_fake_score_strategies():
+    chunks = [
+        ChunkPrediction(0, 300, Label.FAKE, 0.9, 0.9),
+        ChunkPrediction(1, 100, Label.REAL, 0.7, 0.3),
+    ]
+
+    assert FakeNewsDetector._aggregate_fake_score(
+        chunks, AggregationStrategy.MEAN
+    ) == pytest.approx(0.6)
+    assert FakeNewsDetector._aggregate_fake_score(
+        chunks, AggregationStrategy.MAX_FAKE
+    ) == pytest.approx(0.9)
+    assert FakeNewsDetector._aggregate_fake_score(
+        chunks, AggregationStrategy.LENGTH_WEIGHTED
+    ) == pytest.approx(0.75)
@@ -0,0 +1,29 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.inference_executor import InferenceExecutor
+
+
+def test_executor_rejects_when_queue_is_full():
+    release = threading.Event()
+    executor = InferenceExecutor("test", max_workers=1, max_queue=0, retry_after_seconds=7)
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(lambda: None)
+        release.set()
+        await running
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    executor.shutdown()
+
+    assert error.status_code == 503
+    assert error.headers["Retry-After"] == "7"
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["in_flight"] == 0
@@ -0,0 +1,52 @@
+from app.core.model_export import compare_pipelines, load_validation_texts
+from app.domain import Language
+
+
+class FakeCursor(list):
+    def sort(self, key, direction):
+        return FakeCursor(sorted(self, key=lambda doc: doc[key], reverse=direction < 0))
+
+    def limit(self, size):
+        return FakeCursor(self[:size])
+
+
+class FakeArticles:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query, projection):
+        return FakeCursor(
+            doc
+            for doc in self.documents
+            if doc["language"] == query["language"] and "article_key" in doc
+        )
+
+
+def _scores(fake):
+    return [{"label": "fake", "score": fake}, {"label": "real", "score": 1 - fake}]
+
+
+def test_validation_sample_is_stable_and_per_language():
+    articles = FakeArticles(
+        [
+            {"language": "en", "article_key": "c", "text": "third"},
+            {"language": "de", "article_key": "a", "text": "german"},
+            {"language": "en", "article_key": "b", "text": "second"},
+            {"language": "en", "text": "legacy import without key"},
+            {"language": "en", "article_key": "a", "text": "first"},
+        ]
+    )
+
+    assert load_validation_texts(articles, Language.EN, 2) == ["first", "second"]
+    assert load_validation_texts(articles, Language.DE, 10) == ["german"]
+
+
+def test_compare_pipelines_reports_agreement_and_max_score_diff():
+    texts = ["a", "b", "c", "d"]
+    reference = lambda texts, **options: [_scores(s) for s in (0.9, 0.8, 0.2, 0.55)]
+    candidate = lambda texts, **options: [_scores(s) for s in (0.88, 0.8, 0.25, 0.45)]
+
+    result = compare_pipelines(reference, candidate, texts)
+
+    assert result["agreement"] == 0.75
+    assert abs(result["max_score_diff"] - 0.1) < 1e-9
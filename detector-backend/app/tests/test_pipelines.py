@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from app.pipelines import base_pipeline
+from app.pipelines.german_news_pipeline import GermanNewsPipeline
+from app.pipelines.welfake_pipeline import WelfakePipeline
+
+
+class CsvGermanNewsPipeline(GermanNewsPipeline):
+    def __init__(self, csv_path, chunk_size=None):
+        super().__init__("germannews", chunk_size=chunk_size)
+        self.csv_path = csv_path
+
+    def _load_data(self, chunksize=None):
+        return pd.read_csv(self.csv_path, chunksize=chunksize)
+
+
+@pytest.fixture
+def news_csv(tmp_path):
+    texts = [f"Artikel {i % 7} mit <b>Text</b> „Zitat“" for i in range(25)]
+    df = pd.DataFrame(
+        {
+            "title": [f"Titel {i}" for i in range(25)],
+            "text": texts,
+            "published": [1700000000 + i * 86400 for i in range(25)],
+            "source": ["tagesschau.de"] * 25,
+        }
+    )
+    path = tmp_path / "data.csv"
+    df.to_csv(path)
+    return path
+
+
+def test_chunked_processing_matches_whole_file(news_csv):
+    whole = CsvGermanNewsPipeline(news_csv).process_data()
+    chunks = list(CsvGermanNewsPipeline(news_csv, chunk_size=4).process_chunks())
+
+    assert len(chunks) == 7
+    chunked = pd.concat(chunks)
+    # Duplicates spread over several chunks are dropped globally.
+    assert len(chunked) == 7
+    pd.testing.assert_frame_equal(chunked, whole)
+    assert (chunked["dataset"] == "germannews").all()
+
+
+def test_missing_file_yields_no_chunks(tmp_path):
+    pipeline = CsvGermanNewsPipeline(tmp_path / "missing.csv", chunk_size=4)
+
+    assert list(pipeline.process_chunks()) == []
+    assert pipeline.process_data() is None
+
+
+class CsvWelfakePipeline(WelfakePipeline):
+    def __init__(self, csv_path):
+        super().__init__("welfake")
+        self.csv_path = csv_path
+
+    def _load_data(self, chunksize=None):
+        return pd.read_csv(self.csv_path, index_col=0, chunksize=chunksize)
+
+
+def test_language_detection_is_batched_and_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_pipeline.settings, "LANGUAGE_CACHE_DIR", tmp_path / "cache")
+    english = "The government announced on Monday that the new policy takes effect next year."
+    german = "Die Bundesregierung hat am Montag angekündigt, dass die Regelung nächstes Jahr gilt."
+    path = tmp_path / "welfake.csv"
+    pd.DataFrame(
+        {
+            "title": ["Title"] * 4,
+            "text": [english, german, english + " Again.", german + " Nochmal."],
+            "label": [0, 1, 1, 0],
+        }
+    ).to_csv(path)
+
+    first = CsvWelfakePipeline(path).process_data()
+    assert first["text"].tolist() == [english, english + " Again."]
+    assert (first["language"] == "en").all()
+
+    assert (tmp_path / "cache" / "welfake.json").exists()
+
+    # A re-run finds every text in the cache and never touches the detector.
+    def detect(*args):
+        pytest.fail("cached texts must not be detected again")
+
+    no_detection = SimpleNamespace(
+        detect_language_of=detect, detect_languages_in_parallel_of=detect
+    )
+    monkeypatch.setattr(
+        base_pipeline.LanguageDetectionService, "_build", lambda self: no_detection
+    )
+    pd.testing.assert_frame_equal(CsvWelfakePipeline(path).process_data(), first)
+
+
+def test_welfake_text_cleaning_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_pipeline.settings, "LANGUAGE_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "welfake.csv"
+    pd.DataFrame(
+        {
+            "title": ["Title", " "],
+            "text": [
+                "  WASHINGTON (Reuters) -  The government announced on Monday\n\nthat "
+                "the new policy takes effect next year.  ",
+                "The   central bank kept\tinterest rates unchanged (Reuters) - citing inflation.",
+            ],
+            "label": [0, 1],
+        }
+    ).to_csv(path)
+
+    df = CsvWelfakePipeline(path).process_data()
+
+    assert df["text"].tolist() == [
+        "The government announced on Monday that the new policy takes effect next year.",
+        "The central bank kept interest rates unchanged (Reuters) - citing inflation.",
+    ]
+    assert df["title"].tolist()[0] == "Title"
+    assert pd.isna(df["title"].tolist()[1])
+    assert df["label"].tolist() == ["real", "fake"]
@@ -0,0 +1,199 @@
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+
+import pytest
+from fastapi import HTTPException
+from pydantic import SecretStr
+
+from app.core.inference_worker import InferenceWorkerServer
+from app.core.remote_detector import RemoteDetector, parse_address, require_authkey
+from app.domain import HighlightMode, Label, Language, PredictionResult
+
+AUTHKEY = b"test"
+
+
+class StubDetector:
+    def __init__(self):
+        self.highlight_modes = []
+
+    def detect_language(self, text):
+        if text.startswith("Bonjour"):
+            raise HTTPException(status_code=422, detail="Unsupported language.")
+        return Language.EN
+
+    def predict(self, text, language=None):
+        return PredictionResult(label=Label.FAKE, score=0.9)
+
+    def predict_batch(self, texts, language):
+        return [self.predict(text) for text in texts]
+
+    def highlight(self, text, language=None, mode=HighlightMode.EXACT):
+        self.highlight_modes.append(mode)
+        return []
+
+    def explain(self, text, language=None, mode=HighlightMode.EXACT):
+        raise RuntimeError("explainer broken")
+
+    def load_explainers(self):
+        time.sleep(0.2)
+
+
+def _start_worker(tmp_path, name="worker.sock"):
+    server = InferenceWorkerServer(StubDetector(), str(tmp_path / name), AUTHKEY)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _start_fake_worker(address, requests, answer):
+    """
+    Fake worker that closes every connection after one call. Without `answer`
+    it dies like a worker the call crashed, with `answer` it replies first,
+    like a worker that restarts between two calls.
+    """
+    listener = Listener(address, authkey=AUTHKEY)
+
+    def serve():
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError:
+                return
+            requests.append(conn.recv())
+            if answer:
+                conn.send(("ok", PredictionResult(label=Label.FAKE, score=0.9)))
+            conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener
+
+
+def test_parse_address():
+    assert parse_address("127.0.0.1:9100") == ("127.0.0.1", 9100)
+    assert parse_address("/tmp/inference.sock") == "/tmp/inference.sock"
+
+
+def test_remote_detector_forwards_calls_and_errors(tmp_path):
+    server = _start_worker(tmp_path)
+    detector = RemoteDetector([server.address], authkey=AUTHKEY)
+
+    assert detector.detect_language("Hello world") == Language.EN
+    assert detector.predict_batch(["a", "b"], Language.EN) == [
+        PredictionResult(label=Label.FAKE, score=0.9)
+    ] * 2
+    detector.highlight("text", mode=HighlightMode.FAST)
+    assert server.detector.highlight_modes == [HighlightMode.FAST]
+
+    with pytest.raises(HTTPException) as exc:
+        detector.detect_language("Bonjour tout le monde")
+    assert exc.value.status_code == 422
+
+    with pytest.raises(HTTPException) as exc:
+        detector.explain("text")
+    assert exc.value.status_code == 500
+    assert "explainer broken" in exc.value.detail
+
+    detector.close()
+    server.close()
+
+
+def test_remote_detector_skips_unavailable_workers(tmp_path):
+    server = _start_worker(tmp_path)
+    detector = RemoteDetector(
+        [str(tmp_path / "missing.sock"), server.address], authkey=AUTHKEY
+    )
+
+    for _ in range(3):
+        assert detector.predict("text").label == Label.FAKE
+
+    detector.close()
+    server.close()
+
+
+def test_remote_detector_does_not_replay_calls_that_kill_a_worker(tmp_path):
+    requests = []
+    listeners = [
+        _start_fake_worker(str(tmp_path / f"dying-{i}.sock"), requests, answer=False)
+        for i in range(2)
+    ]
+    detector = RemoteDetector([l.address for l in listeners], authkey=AUTHKEY)
+
+    with pytest.raises(HTTPException) as exc:
+        detector.predict("text")
+
+    assert exc.value.status_code == 502
+    assert len(requests) == 1
+    detector.close()
+    for listener in listeners:
+        listener.close()
+
+
+@pytest.mark.parametrize("transport", ["unix", "tcp"])
+def test_remote_detector_reconnects_when_worker_closed_pooled_connection(tmp_path, transport):
+    requests = []
+    address = str(tmp_path / "restarting.sock") if transport == "unix" else ("127.0.0.1", 0)
+    listener = _start_fake_worker(address, requests, answer=True)
+    address = listener.address
+    if transport == "tcp":
+        address = "%s:%d" % address
+    detector = RemoteDetector([address], authkey=AUTHKEY)
+
+    assert detector.predict("text").label == Label.FAKE
+    time.sleep(0.1)
+    # The worker closed the pooled connection, the call goes over a new one.
+    assert detector.predict("text").label == Label.FAKE
+    assert len(requests) == 2
+
+    detector.close()
+    listener.close()
+
+
+def test_remote_detector_without_workers_returns_503(tmp_path):
+    detector = RemoteDetector([str(tmp_path / "missing.sock")], authkey=AUTHKEY)
+
+    with pytest.raises(HTTPException) as exc:
+        detector.predict("text")
+
+    assert exc.value.status_code == 503
+
+
+def test_worker_and_client_require_authkey(tmp_path):
+    with pytest.raises(ValueError):
+        require_authkey(None)
+    with pytest.raises(ValueError):
+        require_authkey(SecretStr(""))
+    assert require_authkey(SecretStr("secret")) == b"secret"
+
+    with pytest.raises(ValueError):
+        RemoteDetector([str(tmp_path / "worker.sock")], authkey=b"")
+    with pytest.raises(ValueError):
+        InferenceWorkerServer(StubDetector(), str(tmp_path / "worker.sock"), b"")
+
+
+def test_worker_listens_on_loopback_unless_remote_is_allowed():
+    with pytest.raises(ValueError):
+        InferenceWorkerServer(StubDetector(), ("0.0.0.0", 0), AUTHKEY)
+
+    server = InferenceWorkerServer(StubDetector(), ("127.0.0.1", 0), AUTHKEY)
+    server.close()
+    server = InferenceWorkerServer(StubDetector(), ("0.0.0.0", 0), AUTHKEY, allow_remote=True)
+    server.close()
+
+
+def test_worker_survives_client_leaving_before_reply(tmp_path, monkeypatch):
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+    server = _start_worker(tmp_path)
+
+    # Like a client running into its timeout: send a call and hang up.
+    conn = Client(server.address, authkey=AUTHKEY)
+    conn.send(("load_explainers", (), {}))
+    conn.close()
+    time.sleep(0.4)
+
+    detector = RemoteDetector([server.address], authkey=AUTHKEY)
+    assert detector.predict("text").label == Label.FAKE
+    assert errors == []
+
+    detector.close()
+    server.close()
@@ -0,0 +1,45 @@
+import asyncio
+
+from app.core.startup import StartupTracker
+
+
+def test_tracker_reports_ready_once_required_components_loaded():
+    tracker = StartupTracker()
+    tracker.register("detector")
+    tracker.register("fact_checker", required=False)
+
+    async def load_detector():
+        return "detector"
+
+    async def load_fact_checker():
+        raise RuntimeError("no api key")
+
+    async def scenario():
+        assert tracker.is_ready() is False
+        return await asyncio.gather(
+            tracker.load("detector", load_detector),
+            tracker.load("fact_checker", load_fact_checker),
+        )
+
+    results = asyncio.run(scenario())
+    report = tracker.report()
+
+    assert results == ["detector", None]
+    assert report["ready"] is True
+    assert report["finished"] is True
+    assert report["components"]["detector"]["status"] == "ready"
+    assert report["components"]["fact_checker"]["status"] == "failed"
+    assert report["components"]["fact_checker"]["error"] == "no api key"
+
+
+def test_tracker_is_not_ready_when_required_component_fails():
+    tracker = StartupTracker()
+    tracker.register("detector")
+
+    async def load_detector():
+        raise RuntimeError("download failed")
+
+    asyncio.run(tracker.load("detector", load_detector))
+
+    assert tracker.is_ready() is False
+    assert tracker.report()["components"]["detector"]["status"] == "failed"
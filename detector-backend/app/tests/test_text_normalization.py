@@ -0,0 +1,133 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.pipelines.germa_pipeline import GermaPipeline
+from app.pipelines.text_normalization import (
+    clean_text_column,
+    clean_title_column,
+    normalize_whitespace,
+)
+
+SAMPLES = [
+    "„Zitat“ – mit ‚einfachen‘ Anführungen… und `Backticks´",
+    "  Text\r\nmit\n\nZeilen\tund Leerzeichen  ",
+    "Siehe https://example.org/a?b=1 und www.example.de/x für <b>mehr</b> Infos",
+    '<a href=http://x.de>Link</a> "Ende"',
+    "COMPACT - Die Schlagzeile des Tages",
+    "Die Schlagzeile des Tages | Berliner Tageszeitung",
+    "QS24 - COMPACT: Doppelt gebrandet",
+    "Titel | apolut.net | Teil 2",
+    "schweizer gesundheitsfernsehen: Kleinschreibung",
+    "Was ist hier los???!!",
+    "[Eilmeldung] (Update) — Neues –",
+    "ab",
+    "nan",
+    "--",
+    "",
+    "   ",
+    "Unsere Natur",
+    "Contra24 — Die Unbestechlichen | Naturstoff Medizin",
+]
+
+
+# Per-step pandas cleaning of the German pipelines before the shared module,
+# the reference the compiled cleaning must reproduce.
+def _legacy_normalize_whitespace(s):
+    return (
+        s.astype(str)
+        .str.replace(r"\r\n|\r|\n", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _legacy_remove_html_and_urls(s):
+    s = s.str.replace(r"http\S+|www\.\S+", " ", regex=True)
+    return s.str.replace(r"<[^>]+>", " ", regex=True)
+
+
+def _legacy_normalize_quotes_and_dashes(s):
+    repl = {
+        "„": '"', "“": '"',
+        "‚": "'", "‘": "'", "’": "'",
+        "´": "'", "`": "'",
+        "–": "-", "—": "-",
+        "…": "...",
+    }
+    for old, new in repl.items():
+        s = s.str.replace(old, new)
+    return s
+
+
+def _legacy_cleanup_boundaries(s):
+    return s.str.strip(' "\'„“‚‘’«»›‹|[](){}-–—')
+
+
+def _legacy_remove_branding(s, brands):
+    for brand in brands:
+        esc = re.escape(brand)
+        s = s.str.replace(rf"^\s*{esc}\s*[-–—:|]\s*", "", regex=True, case=False)
+        s = s.str.replace(rf"[-–—:|]\s*{esc}\s*$", "", regex=True, case=False)
+        s = s.str.replace(rf"\|\s*{esc}\s*(?=\||$)", "", regex=True, case=False)
+    s = s.str.replace(r"\s*\|\s*", " | ", regex=True)
+    s = s.str.replace(r"\s*[-–—:]\s*", " - ", regex=True)
+    return _legacy_normalize_whitespace(s)
+
+
+def legacy_clean_text_column(s):
+    s = s.fillna("")
+    s = _legacy_remove_html_and_urls(s)
+    s = _legacy_normalize_quotes_and_dashes(s)
+    s = _legacy_normalize_whitespace(s)
+    return _legacy_cleanup_boundaries(s)
+
+
+def legacy_clean_title_column(s, brands=()):
+    s = s.astype(str)
+    s = s.replace(["nan", "NaN", "None", "none", "null", "Null", "-", "--"], "")
+    s = _legacy_remove_html_and_urls(s)
+    s = _legacy_normalize_quotes_and_dashes(s)
+    s = _legacy_normalize_whitespace(s)
+    if brands:
+        s = _legacy_remove_branding(s, brands)
+    s = _legacy_cleanup_boundaries(s)
+    s = s.str.replace(r"[!?]{3,}", "!!", regex=True)
+    s = s.mask(s.str.len() < 3, "")
+    return s.fillna("")
+
+
+@pytest.fixture
+def column():
+    return pd.Series(SAMPLES + [np.nan], index=range(10, 10 + len(SAMPLES) + 1))
+
+
+def test_text_column_matches_legacy_cleaning(column):
+    pd.testing.assert_series_equal(
+        clean_text_column(column), legacy_clean_text_column(column)
+    )
+
+
+def test_title_column_matches_legacy_cleaning(column):
+    pd.testing.assert_series_equal(
+        clean_title_column(column), legacy_clean_title_column(column)
+    )
+    pd.testing.assert_series_equal(
+        clean_title_column(column, brands=GermaPipeline.BRAND_NAMES),
+        legacy_clean_title_column(column, GermaPipeline.BRAND_NAMES),
+    )
+
+
+def test_normalize_whitespace_keeps_missing_values(column):
+    expected = column.astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+    pd.testing.assert_series_equal(normalize_whitespace(column), expected)
+
+
+def test_stacked_brand_prefix_is_removed_once():
+    titles = pd.Series(["Contra24 - Naturstoff Medizin - Titel", "Titel | QS24 | COMPACT"])
+
+    cleaned = clean_title_column(titles, brands=GermaPipeline.BRAND_NAMES)
+
+    assert cleaned.tolist() == ["Naturstoff Medizin - Titel", "Titel"]
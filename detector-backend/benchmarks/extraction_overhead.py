@@ -0,0 +1,94 @@
+"""
+Compares the per-extraction overhead of the ArticleExtractor before and after
+the parser registry, without the article download itself.
+
+- parser setup: a fresh parser instance per request vs. a leased registry instance
+- robots check: loading robots.txt on the request path vs. the cached rules
+- concurrent parsing: Fundus' shared parser instance vs. leased instances,
+  counting articles that came back with the title of another article
+
+Usage:
+    uv run python -m benchmarks.extraction_overhead
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from fundus.publishers.base_objects import Robots
+
+from app.services.article_extractor import ArticleExtractor
+
+ROUNDS = 500
+ROBOTS_ROUNDS = 5
+CONCURRENT_ARTICLES = 400
+
+
+def _html(index: int) -> str:
+    return (
+        f'<html><head><meta property="og:title" content="Titel {index}">'
+        f'<script type="application/ld+json">{{"@type":"NewsArticle","headline":"Titel {index}"}}</script>'
+        f"</head><body><article><h1>Titel {index}</h1><p>{'Text ' * 300}</p></article></body></html>"
+    )
+
+
+def _per_call_ms(fn: Callable[[], object], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def _mixed_up_titles(parse: Callable[[int], dict]) -> int:
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = pool.map(lambda i: (i, parse(i)["title"]), range(CONCURRENT_ARTICLES))
+        return sum(title != f"Titel {i}" for i, title in results)
+
+
+def main() -> None:
+    extractor = ArticleExtractor({"de", "en"})
+    registry = extractor._parsers
+    publisher = extractor._find_publisher_for_url("www.spiegel.de")
+    html = _html(0)
+    user_agent = publisher.request_header.get("user-agent") or "*"
+    url = "https://www.spiegel.de/politik/artikel.html"
+
+    def fresh_parser() -> None:
+        publisher.parser.latest_version().parse(html, error_handling="suppress")
+
+    def leased_parser() -> None:
+        with registry.parser(publisher) as parser:
+            parser.parse(html, error_handling="suppress")
+
+    def robots_on_request() -> None:
+        Robots(publisher.robots.url, headers=publisher.request_header).can_fetch(
+            user_agent, url
+        )
+
+    print(f"parser setup + parse   fresh  {_per_call_ms(fresh_parser, ROUNDS):8.3f} ms")
+    print(f"parser setup + parse   leased {_per_call_ms(leased_parser, ROUNDS):8.3f} ms")
+
+    print(f"robots check  request path {_per_call_ms(robots_on_request, ROBOTS_ROUNDS):8.3f} ms")
+    registry.can_fetch(publisher, url)
+    cached = _per_call_ms(lambda: registry.can_fetch(publisher, url), ROUNDS)
+    print(f"robots check  cached       {cached:8.3f} ms")
+
+    def shared_parse(index: int) -> dict:
+        return publisher.parser().parse(_html(index), error_handling="suppress")
+
+    def leased_parse(index: int) -> dict:
+        with registry.parser(publisher) as parser:
+            return parser.parse(_html(index), error_handling="suppress")
+
+    print(
+        f"concurrent parsing   shared instance {_mixed_up_titles(shared_parse):4d} "
+        f"/ {CONCURRENT_ARTICLES} wrong titles"
+    )
+    print(
+        f"concurrent parsing   leased instance {_mixed_up_titles(leased_parse):4d} "
+        f"/ {CONCURRENT_ARTICLES} wrong titles"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares latency and rank agreement of the exact (SHAP) and fast
+(gradient x input) highlight modes of the FakeNewsDetector.
+
+Rank agreement is reported as Spearman correlation of the word scores and as
+the overlap of the top-k words by absolute contribution.
+
+Usage:
+    uv run python -m benchmarks.highlight_modes
+"""
+
+import statistics
+import time
+
+from scipy.stats import spearmanr
+
+from app.core.detector import FakeNewsDetector
+from app.domain import HighlightMode
+
+TOP_K = 5
+ROUNDS = 3
+SAMPLES = [
+    "Donald Trump left the office after the election results were certified by Congress.",
+    "Scientists confirm that drinking bleach cures the virus within hours, the government is hiding it.",
+    "The central bank raised interest rates by a quarter point on Wednesday to fight inflation.",
+    "Die Bundesregierung hat am Mittwoch ein neues Klimaschutzgesetz im Kabinett beschlossen.",
+    "Geheime Dokumente beweisen, dass die Impfung Mikrochips enthält und das Wetter steuert.",
+]
+
+
+def _time_highlight(detector: FakeNewsDetector, text: str, mode: HighlightMode):
+    durations = []
+    highlights = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        highlights = detector.highlight(text, mode=mode)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations), highlights
+
+
+def main() -> None:
+    # No result cache, every round has to run the explanation.
+    detector = FakeNewsDetector()
+
+    exact_times, fast_times, correlations, overlaps = [], [], [], []
+    for text in SAMPLES:
+        exact_seconds, exact = _time_highlight(detector, text, HighlightMode.EXACT)
+        fast_seconds, fast = _time_highlight(detector, text, HighlightMode.FAST)
+        exact_times.append(exact_seconds)
+        fast_times.append(fast_seconds)
+
+        if len(exact) != len(fast):
+            print(f"Word count differs ({len(exact)} vs {len(fast)}), skipping: {text[:40]}")
+            continue
+
+        correlation = spearmanr([h.score for h in exact], [h.score for h in fast]).statistic
+        exact_top = {h.token for h in sorted(exact, key=lambda h: abs(h.score))[-TOP_K:]}
+        fast_top = {h.token for h in sorted(fast, key=lambda h: abs(h.score))[-TOP_K:]}
+        # Constant scores (e.g. very short texts) have no defined correlation.
+        if correlation == correlation:
+            correlations.append(correlation)
+        overlaps.append(len(exact_top & fast_top) / min(TOP_K, len(exact)))
+
+        print(
+            f"{text[:40]:<42} exact {exact_seconds * 1000:>8.1f} ms | "
+            f"fast {fast_seconds * 1000:>7.1f} ms | spearman {correlation:>5.2f} | "
+            f"top-{TOP_K} overlap {overlaps[-1]:.2f}"
+        )
+
+    print(
+        f"\nMedian latency exact {statistics.median(exact_times) * 1000:.1f} ms, "
+        f"fast {statistics.median(fast_times) * 1000:.1f} ms "
+        f"(x{statistics.median(exact_times) / statistics.median(fast_times):.1f})"
+    )
+    if correlations:
+        print(
+            f"Mean spearman {statistics.mean(correlations):.2f}, "
+            f"mean top-{TOP_K} overlap {statistics.mean(overlaps):.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compares BeautifulSoup's html.parser and lxml backends on saved article pages.
+
+The corpus is a directory of .html files. `--download N` fills it with the first
+N pages of the GermanFakeNC dataset, fetched through the scraper's size-limited
+download. For every parser the benchmark reports the parse time of the
+scraper's title/paragraph extraction and how many pages lxml extracts with
+exactly the same title and text as html.parser.
+
+Usage:
+    uv run python -m benchmarks.html_parsing --download 100
+    uv run python -m benchmarks.html_parsing
+    uv run python -m benchmarks.html_parsing --corpus path/to/saved/pages
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.services.german_fake_news_scraper import BACKEND_DIR, GermanFakeNCScraper
+
+CORPUS_DIR = BACKEND_DIR / "rawdata" / "GermanFakeNC" / "pages"
+PARSERS = ["html.parser", "lxml"]
+ROUNDS = 3
+
+
+def download(scraper: GermanFakeNCScraper, corpus: Path, count: int) -> None:
+    corpus.mkdir(parents=True, exist_ok=True)
+    urls = [record["URL"] for record in scraper.load_raw_metadata() if record.get("URL")]
+    saved = 0
+    for index, url in enumerate(urls[:count]):
+        try:
+            html = scraper._fetch_html(url)
+        except Exception as exc:
+            print(f"skipped {url}: {exc}")
+            continue
+        (corpus / f"{index:05d}.html").write_text(html, encoding="utf-8")
+        saved += 1
+    print(f"saved {saved} of {min(count, len(urls))} pages to {corpus}")
+
+
+def parse_corpus(
+    pages: List[str], parser: str
+) -> Tuple[float, List[Tuple[Optional[str], Optional[str]]]]:
+    best = float("inf")
+    results = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        results = [GermanFakeNCScraper._parse_html(html, parser) for html in pages]
+        best = min(best, time.perf_counter() - started)
+    return best, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR)
+    parser.add_argument("--download", type=int, default=0, metavar="N")
+    args = parser.parse_args()
+
+    if args.download:
+        download(GermanFakeNCScraper(), args.corpus, args.download)
+
+    files = sorted(args.corpus.glob("*.html"))
+    if not files:
+        raise SystemExit(f"No .html files in {args.corpus}, use --download first.")
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in files]
+    total_mb = sum(len(page.encode("utf-8")) for page in pages) / 1024 / 1024
+    print(f"{len(pages)} pages, {total_mb:.1f} MB, best of {ROUNDS} rounds")
+
+    outputs: Dict[str, List[Tuple[Optional[str], Optional[str]]]] = {}
+    for name in PARSERS:
+        seconds, outputs[name] = parse_corpus(pages, name)
+        print(
+            f"{name:<12} {seconds:8.3f} s total  "
+            f"{seconds / len(pages) * 1000:8.2f} ms/page  "
+            f"{total_mb / seconds:6.1f} MB/s"
+        )
+
+    same = sum(a == b for a, b in zip(outputs["html.parser"], outputs["lxml"]))
+    print(f"identical title and text: {same} / {len(pages)} pages")
+
+
+if __name__ == "__main__":
+    main()
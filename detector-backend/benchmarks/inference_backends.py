@@ -0,0 +1,110 @@
+"""
+Compares load time, latency, throughput and RSS of the inference backends.
+
+Every backend runs in a fresh interpreter, so the numbers are not skewed by
+models that an earlier backend already loaded. The ONNX backend uses the exports
+of `python -m app.core.model_export` if present.
+
+Usage:
+    uv run python -m benchmarks.inference_backends
+    uv run python -m benchmarks.inference_backends --backends torch torch-int8
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from app.core.config import Settings
+from app.domain import InferenceBackend
+
+MODEL_ID = "Lennywinks/fake-news-detector-english"
+
+TEXT = (
+    "The government announced on Monday that the new policy will take effect next "
+    "year. Critics argue that the changes were rushed through parliament without a "
+    "proper debate, while supporters point to the economic benefits. "
+) * 8
+BATCH_SIZE = 16
+ROUNDS = 20
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _run_backend(name: str) -> dict:
+    from app.core.inference_backend import load_classification_pipeline, onnx_model_dir
+
+    backend = InferenceBackend(name)
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    pipe = load_classification_pipeline(
+        MODEL_ID,
+        backend=backend,
+        onnx_dir=onnx_model_dir(Settings().ONNX_MODEL_DIR, MODEL_ID),
+    )
+    load_seconds = time.perf_counter() - started
+
+    # Warm-up run, the first call allocates buffers and compiles kernels.
+    pipe(TEXT)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        pipe(TEXT)
+    single_ms = (time.perf_counter() - started) / ROUNDS * 1000
+
+    batch = [TEXT] * BATCH_SIZE
+    started = time.perf_counter()
+    for _ in range(ROUNDS // 4):
+        pipe(batch, batch_size=BATCH_SIZE)
+    throughput = BATCH_SIZE * (ROUNDS // 4) / (time.perf_counter() - started)
+
+    return {
+        "backend": name,
+        "load_s": round(load_seconds, 2),
+        "single_ms": round(single_ms, 1),
+        "texts_per_s": round(throughput, 1),
+        "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=[backend.value for backend in InferenceBackend],
+    )
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(_run_backend(args.backend)))
+        return
+
+    for name in args.backends:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.inference_backends", "--backend", name],
+            capture_output=True,
+            text=True,
+        )
+        if output.returncode != 0:
+            print(f"{name:<11} failed: {output.stderr.strip().splitlines()[-1]}")
+            continue
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        print(
+            f"{result['backend']:<11} load {result['load_s']:>6.2f} s | "
+            f"single {result['single_ms']:>7.1f} ms | "
+            f"batch {result['texts_per_s']:>6.1f} texts/s | "
+            f"RSS +{result['rss_delta_mb']:>7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compares startup time, RSS and detection latency of the language detector modes.
+
+Every mode runs in a fresh interpreter, so the numbers are not skewed by models
+that an earlier mode already loaded.
+
+Usage:
+    uv run python -m benchmarks.language_detector
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+SAMPLES = [
+    ("en", "The government announced on Monday that the new policy will take effect next year."),
+    ("de", "Die Bundesregierung hat am Montag angekündigt, dass die neue Regelung im nächsten Jahr gilt."),
+    ("fr", "Le gouvernement a annoncé lundi que la nouvelle politique entrera en vigueur l'année prochaine."),
+    ("es", "El gobierno anunció el lunes que la nueva política entrará en vigor el próximo año."),
+    ("it", "Il governo ha annunciato lunedì che la nuova politica entrerà in vigore il prossimo anno."),
+    # Close to a supported language, a restricted detector reports them as en/de/nl.
+    ("sv", "Regeringen meddelade på måndagen att den nya lagen träder i kraft nästa år."),
+    ("da", "Regeringen meddelte mandag, at den nye lov træder i kraft næste år."),
+    ("id", "Pemerintah mengumumkan pada hari Senin bahwa undang-undang baru berlaku tahun depan."),
+]
+
+# A restricted candidate set for comparison with the full language set.
+RESTRICTED = ["en", "de", "fr", "es", "it", "nl", "pt", "pl", "ru", "tr"]
+
+MODES = {
+    "all_spoken": {},
+    "all_spoken_low_accuracy": {"low_accuracy": True},
+    "restricted": {"restrict_to": RESTRICTED},
+    "restricted_low_accuracy": {"restrict_to": RESTRICTED, "low_accuracy": True},
+}
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _run_mode(name: str) -> dict:
+    from app.services.language_service import LanguageDetectionService
+
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    service = LanguageDetectionService(**MODES[name])
+    build_seconds = time.perf_counter() - started
+
+    # The first detection loads the language models.
+    started = time.perf_counter()
+    service.detect_code(SAMPLES[0][1])
+    first_detection_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    correct = 0
+    rounds = 50
+    for _ in range(rounds):
+        for expected, text in SAMPLES:
+            correct += service.detect_code(text) == expected
+    detection_ms = (time.perf_counter() - started) / (rounds * len(SAMPLES)) * 1000
+
+    return {
+        "mode": name,
+        "build_ms": round(build_seconds * 1000, 1),
+        "first_detection_ms": round(first_detection_seconds * 1000, 1),
+        "avg_detection_ms": round(detection_ms, 3),
+        "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+        "accuracy": round(correct / (rounds * len(SAMPLES)), 3),
+    }
+
+
+def main() -> None:
+    if len(sys.argv) == 3 and sys.argv[1] == "--mode":
+        print(json.dumps(_run_mode(sys.argv[2])))
+        return
+
+    for name in MODES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.language_detector", "--mode", name],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        print(
+            f"{result['mode']:<26} build {result['build_ms']:>8.1f} ms | "
+            f"first detection {result['first_detection_ms']:>8.1f} ms | "
+            f"avg detection {result['avg_detection_ms']:>7.3f} ms | "
+            f"RSS +{result['rss_delta_mb']:>7.1f} MB | accuracy {result['accuracy']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Compares the shared compiled text normalization with the per-step pandas
+cleaning the German pipelines used before (kept below as reference).
+
+Cleans the text and title columns of GERMA.csv, or of a synthetic corpus if the
+file is missing, and reports the time of every variant and whether its output
+is identical to the legacy cleaning.
+
+Usage:
+    uv run python -m benchmarks.text_normalization
+    uv run python -m benchmarks.text_normalization --rows 50000
+"""
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.core.config import Settings
+from app.pipelines.germa_pipeline import GermaPipeline
+from app.pipelines.text_normalization import clean_text_column, clean_title_column
+
+settings = Settings()
+CSV_PATH = settings.BASE_DIR.parent / "rawdata" / "germa" / "GERMA.csv"
+ROUNDS = 3
+
+
+def _legacy_normalize_whitespace(s):
+    return (
+        s.astype(str)
+        .str.replace(r"\r\n|\r|\n", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _legacy_remove_html_and_urls(s):
+    s = s.str.replace(r"http\S+|www\.\S+", " ", regex=True)
+    return s.str.replace(r"<[^>]+>", " ", regex=True)
+
+
+def _legacy_normalize_quotes_and_dashes(s):
+    repl = {
+        "„": '"', "“": '"',
+        "‚": "'", "‘": "'", "’": "'",
+        "´": "'", "`": "'",
+        "–": "-", "—": "-",
+        "…": "...",
+    }
+    for old, new in repl.items():
+        s = s.str.replace(old, new)
+    return s
+
+
+def _legacy_cleanup_boundaries(s):
+    return s.str.strip(' "\'„“‚‘’«»›‹|[](){}-–—')
+
+
+def _legacy_remove_branding(s, brands):
+    for brand in brands:
+        esc = re.escape(brand)
+        s = s.str.replace(rf"^\s*{esc}\s*[-–—:|]\s*", "", regex=True, case=False)
+        s = s.str.replace(rf"[-–—:|]\s*{esc}\s*$", "", regex=True, case=False)
+        s = s.str.replace(rf"\|\s*{esc}\s*(?=\||$)", "", regex=True, case=False)
+    s = s.str.replace(r"\s*\|\s*", " | ", regex=True)
+    s = s.str.replace(r"\s*[-–—:]\s*", " - ", regex=True)
+    return _legacy_normalize_whitespace(s)
+
+
+def legacy_clean_text_column(s):
+    s = s.fillna("")
+    s = _legacy_remove_html_and_urls(s)
+    s = _legacy_normalize_quotes_and_dashes(s)
+    s = _legacy_normalize_whitespace(s)
+    return _legacy_cleanup_boundaries(s)
+
+
+def legacy_clean_title_column(s, brands=()):
+    s = s.astype(str)
+    s = s.replace(["nan", "NaN", "None", "none", "null", "Null", "-", "--"], "")
+    s = _legacy_remove_html_and_urls(s)
+    s = _legacy_normalize_quotes_and_dashes(s)
+    s = _legacy_normalize_whitespace(s)
+    if brands:
+        s = _legacy_remove_branding(s, brands)
+    s = _legacy_cleanup_boundaries(s)
+    s = s.str.replace(r"[!?]{3,}", "!!", regex=True)
+    s = s.mask(s.str.len() < 3, "")
+    return s.fillna("")
+
+
+def synthetic_corpus(rows: int) -> pd.DataFrame:
+    random.seed(0)
+    words = ["Die", "Regierung", "„plant“", "neue", "Gesetze", "–", "sagt", "Experte…", "https://t.co/x", "<b>", "</b>"]
+    brands = GermaPipeline.BRAND_NAMES + ["Nachrichten"] * 20
+    texts = [" ".join(random.choices(words, k=400)) for _ in range(rows)]
+    titles = [
+        f"{' '.join(random.choices(words, k=8))} | {random.choice(brands)}" for _ in range(rows)
+    ]
+    return pd.DataFrame({"title": titles, "text": texts})
+
+
+def _run(name: str, clean, column: pd.Series, expected: pd.Series | None) -> pd.Series:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = clean(column)
+        best = min(best, time.perf_counter() - started)
+    same = "reference" if expected is None else result.equals(expected)
+    print(f"{name:<28} {best:8.3f} s  {len(column) / best:10.0f} values/s  identical: {same}")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", type=Path, default=CSV_PATH)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.csv.exists():
+        df = pd.read_csv(args.csv, usecols=["title", "text"], nrows=args.rows)
+    else:
+        print(f"{args.csv} not found, using a synthetic corpus")
+        df = synthetic_corpus(args.rows)
+    print(f"{len(df)} rows, best of {ROUNDS} rounds")
+
+    brands = GermaPipeline.BRAND_NAMES
+    expected = _run("text legacy", legacy_clean_text_column, df["text"], None)
+    _run("text compiled", clean_text_column, df["text"], expected)
+
+    expected = _run("title legacy", lambda s: legacy_clean_title_column(s, brands), df["title"], None)
+    _run("title compiled", lambda s: clean_title_column(s, brands), df["title"], expected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measures the memory of multiple server workers with and without preloading.
+
+For every worker count the backend is started once via `uvicorn --workers`
+(every worker loads its own models) and once via `app.serve` (models are loaded
+before forking and shared copy-on-write). Per worker the unique set size (USS,
+pages only this process uses) and the proportional set size (PSS, shared pages
+split between their users) are read from /proc; the total is the PSS sum of all
+processes including the parent.
+
+Usage:
+    uv run python -m benchmarks.worker_memory
+    uv run python -m benchmarks.worker_memory --workers 1 2 4 8
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+PORT = 8799
+
+
+def _server_command(mode: str, workers: int) -> List[str]:
+    if mode == "uvicorn":
+        return [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(PORT), "--workers", str(workers), "--log-level", "warning",
+        ]
+    return [
+        sys.executable, "-m", "app.serve",
+        "--port", str(PORT), "--workers", str(workers), "--log-level", "warning",
+    ]
+
+
+def _children(pid: int) -> List[int]:
+    pids = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children = (task / "children").read_text().split()
+        for child in map(int, children):
+            pids.append(child)
+            pids.extend(_children(child))
+    return pids
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    values = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        key, value = line.split(":", 1)
+        values[key] = int(value.split()[0])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def _workers(pid: int) -> List[int]:
+    # uvicorn additionally starts a multiprocessing resource tracker.
+    return [
+        child
+        for child in _children(pid)
+        if b"resource_tracker" not in Path(f"/proc/{child}/cmdline").read_bytes()
+    ]
+
+
+def _wait_until_loaded(pid: int, workers: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/ready") as response:
+                if response.status == 200:
+                    break
+        except OSError:
+            pass
+        time.sleep(1)
+    else:
+        raise TimeoutError("Server did not become ready")
+
+    # Other workers may still be loading, wait until the memory stops growing.
+    previous = -1
+    while time.monotonic() < deadline:
+        pids = _workers(pid)
+        total = sum(_memory_kb(p)["rss"] for p in pids)
+        if len(pids) >= workers and total == previous:
+            return
+        previous = total
+        time.sleep(3)
+    raise TimeoutError("Worker memory did not settle")
+
+
+def _measure(mode: str, workers: int, timeout: float) -> Dict[str, float]:
+    server = subprocess.Popen(_server_command(mode, workers))
+    try:
+        _wait_until_loaded(server.pid, workers, timeout)
+        per_worker = [_memory_kb(pid) for pid in _workers(server.pid)]
+        parent = _memory_kb(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    mb = 1024
+    return {
+        "uss_per_worker_mb": sum(m["uss"] for m in per_worker) / len(per_worker) / mb,
+        "rss_per_worker_mb": sum(m["rss"] for m in per_worker) / len(per_worker) / mb,
+        "total_pss_mb": (parent["pss"] + sum(m["pss"] for m in per_worker)) / mb,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--modes", nargs="+", default=["uvicorn", "prefork"])
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        for workers in args.workers:
+            result = _measure(mode, workers, args.timeout)
+            print(
+                f"{mode:<8} {workers:>2} workers | "
+                f"USS/worker {result['uss_per_worker_mb']:>7.1f} MB | "
+                f"RSS/worker {result['rss_per_worker_mb']:>7.1f} MB | "
+                f"total PSS {result['total_pss_mb']:>8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()